@@ -9,45 +9,121 @@ import numpy as np
 import pandas as pd
 
 
-def compute_codeletion_frequency(mat):
+def _codeletion_counts(mat):
     """
-    Compute co-deletion frequencies for all gene pairs.
+    Compute co-deletion counts and frequencies from one float32 Gram matrix.
     
     Args:
         mat: DataFrame samples x genes (0/1 deletion)
         
     Returns:
-        Tuple of (freq_matrix, long_table, counts_matrix):
-        - freq_matrix: DataFrame with co-deletion frequencies (genes x genes)
-        - long_table: DataFrame with upper-triangle pairs in long format
-        - counts_matrix: DataFrame with raw co-deletion counts (genes x genes)
+        Tuple of (counts, freq) ndarrays (genes x genes; int32, float32)
+    """
+    # float32 so the Gram matrix is a single BLAS SGEMM call
+    X = np.asarray(mat.values, dtype=np.float32)  # shape (n_samples, n_genes)
+    
+    # counts[i,j] = # samples where both i and j are 1, i.e. X^T @ X; float32
+    # holds these integer counts exactly for fewer than 2**24 samples
+    gram = X.T @ X   # shape (n_genes, n_genes)
+    counts = gram.astype(np.int32)
+    
+    # The Gram matrix becomes the frequency buffer, normalized in place
+    freq = gram
+    freq /= mat.shape[0]
+    
+    return counts, freq
+
+
+def _conditional_codeletion(counts):
+    """
+    Compute P(i | j) = count(i,j) / count(j,j) from a counts ndarray.
+    
+    Args:
+        counts: ndarray genes x genes with co-deletion counts
+        
+    Returns:
+        ndarray genes x genes (float32; columns for genes never deleted are 0)
     """
-    # Number of samples
-    n = mat.shape[0]
+    diag = np.diag(counts).astype(np.float32)
     
-    # Convert to numpy for speed
-    X = mat.values  # shape (n_samples, n_genes)
+    # Reciprocal of each gene's own deletion count, 0 where it is never deleted
+    inv_diag = np.zeros_like(diag)
+    np.reciprocal(diag, out=inv_diag, where=diag > 0)
+    
+    conditional = counts.astype(np.float32)
+    conditional *= inv_diag[np.newaxis, :]
+    
+    return conditional
+
+
+def _long_table(genes, freq):
+    """
+    Gather the upper-triangle gene pairs of a frequency matrix in long format.
+    
+    Args:
+        genes: Index of gene labels
+        freq: ndarray genes x genes with co-deletion frequencies
+        
+    Returns:
+        DataFrame with gene_i, gene_j and co_deletion_frequency columns
+    """
+    iu, ju = np.triu_indices(len(genes), k=1)
+    genes_arr = genes.to_numpy()
+    return pd.DataFrame({
+        "gene_i": genes_arr[iu],
+        "gene_j": genes_arr[ju],
+        "co_deletion_frequency": freq[iu, ju]
+    })
+
+
+def compute_codeletion_statistics(mat):
+    """
+    Compute co-deletion frequencies, counts and conditional probabilities together.
     
-    # Co-deletion counts via matrix multiplication
-    # (X^T * X)[i,j] = # samples where both i and j are 1
-    counts = X.T @ X   # shape (n_genes, n_genes)
+    Equivalent to compute_codeletion_frequency followed by
+    compute_conditional_codeletion, sharing one Gram matrix for all three.
     
-    freq = counts / float(n)
+    Args:
+        mat: DataFrame samples x genes (0/1 deletion)
+        
+    Returns:
+        Tuple of (freq_matrix, long_table, counts_matrix, conditional):
+        - freq_matrix: DataFrame with co-deletion frequencies (genes x genes, float32)
+        - long_table: DataFrame with upper-triangle pairs in long format
+        - counts_matrix: DataFrame with raw co-deletion counts (genes x genes, int32)
+        - conditional: DataFrame with conditional probabilities P(i | j) (float32)
+    """
+    counts, freq = _codeletion_counts(mat)
+    conditional = _conditional_codeletion(counts)
     
     genes = mat.columns
     freq_df = pd.DataFrame(freq, index=genes, columns=genes)
     counts_df = pd.DataFrame(counts, index=genes, columns=genes)
+    conditional_df = pd.DataFrame(conditional, index=genes, columns=genes)
     
-    # Long-form table of upper-triangle pairs
-    long = (
-        freq_df.where(np.triu(np.ones(freq_df.shape, dtype=bool), k=1))
-               .stack()
-               .rename("co_deletion_frequency")
-               .reset_index()
-               .rename(columns={"level_0": "gene_i", "level_1": "gene_j"})
-    )
+    return freq_df, _long_table(genes, freq), counts_df, conditional_df
+
+
+def compute_codeletion_frequency(mat):
+    """
+    Compute co-deletion frequencies for all gene pairs.
     
-    return freq_df, long, counts_df
+    Args:
+        mat: DataFrame samples x genes (0/1 deletion)
+        
+    Returns:
+        Tuple of (freq_matrix, long_table, counts_matrix):
+        - freq_matrix: DataFrame with co-deletion frequencies (genes x genes, float32)
+        - long_table: DataFrame with upper-triangle pairs in long format
+        - counts_matrix: DataFrame with raw co-deletion counts (genes x genes, int32)
+    """
+    counts, freq = _codeletion_counts(mat)
+    
+    genes = mat.columns
+    freq_df = pd.DataFrame(freq, index=genes, columns=genes)
+    counts_df = pd.DataFrame(counts, index=genes, columns=genes)
+    
+    return freq_df, _long_table(genes, freq), counts_df
 
 
 def compute_conditional_codeletion(counts_df):
@@ -61,9 +137,11 @@ def compute_conditional_codeletion(counts_df):
         
     Returns:
         DataFrame with conditional probabilities P(i | j) = count(i,j) / count(j,j)
+        (float32; columns for genes never deleted are 0)
     """
-    conditional = counts_df / counts_df.values.diagonal()
-    return conditional
+    conditional = _conditional_codeletion(counts_df.to_numpy())
+    
+    return pd.DataFrame(conditional, index=counts_df.index, columns=counts_df.columns)
 
 
 def get_top_codeleted_pairs(long_table, n=20):
@@ -77,17 +155,41 @@ def get_top_codeleted_pairs(long_table, n=20):
     Returns:
         DataFrame with top N pairs sorted by co_deletion_frequency
     """
-    return long_table.sort_values("co_deletion_frequency", ascending=False).head(n)
+    freqs = long_table["co_deletion_frequency"].to_numpy()
+    n = min(n, len(freqs))
+    if n <= 0:
+        return long_table.iloc[:0]
+    
+    # Partial selection of the N largest (from the tail, so the pair-sized
+    # array is not negated into a temporary), then sort only those N
+    top_idx = np.argpartition(freqs, len(freqs) - n)[len(freqs) - n:]
+    top_idx = top_idx[np.argsort(-freqs[top_idx], kind="stable")]
+    
+    return long_table.iloc[top_idx]
 
 
-def compute_deletion_frequencies(mat):
+def compute_deletion_frequencies(mat, top_k=None):
     """
     Compute individual gene deletion frequencies.
     
     Args:
         mat: DataFrame samples x genes (0/1 deletion)
+        top_k: Optional number of most frequently deleted genes to return
         
     Returns:
-        Series with deletion frequency for each gene
+        Series with deletion frequency for each gene, sorted descending
     """
-    return mat.mean(axis=0).sort_values(ascending=False)
+    # Integer column sums, scaled once by 1/n
+    sums = mat.to_numpy().sum(axis=0, dtype=np.int32)
+    freqs = sums * (1.0 / mat.shape[0])
+    
+    if top_k is not None and top_k < len(freqs):
+        if top_k <= 0:
+            return pd.Series(freqs[:0], index=mat.columns[:0])
+        # Restore column order before the stable sort so ties keep it
+        order = np.sort(np.argpartition(-freqs, top_k - 1)[:top_k])
+        order = order[np.argsort(-freqs[order], kind="stable")]
+    else:
+        order = np.argsort(-freqs, kind="stable")
+    
+    return pd.Series(freqs[order], index=mat.columns[order])
@@ -0,0 +1,48 @@
+"""
+Ingestion-time precomputation of Dash-facing co-deletion tables.
+
+This module persists the conditional matrix for a (study, chromosome) as
+parquet so the Dash callbacks only need a columnar read instead of
+recomputing or parsing Excel/CSV on every request.
+"""
+
+import os
+
+import numpy as np
+
+
+def conditional_parquet_filename(chromosome):
+    """Filename of the precomputed conditional matrix for a chromosome."""
+    return f"chr{chromosome}_codeletion_conditional_frequencies.parquet"
+
+
+def _write_parquet(df, path, preserve_index):
+    """Write a DataFrame as zstd-compressed parquet with dictionary encoding."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    pq.write_table(table, path, compression='zstd', use_dictionary=True)
+
+
+def write_precomputed_tables(study_output_dir, chromosome, conditional):
+    """
+    Write the precomputed conditional matrix as parquet.
+    
+    Args:
+        study_output_dir: Study-specific output directory (data/processed/{study_id})
+        chromosome: Chromosome number
+        conditional: DataFrame with conditional probabilities P(i|j)
+    
+    Returns:
+        Dictionary with paths of the written files (keys: conditional)
+    """
+    os.makedirs(study_output_dir, exist_ok=True)
+    
+    # Probabilities are stored as float32; gene names are dictionary-encoded
+    conditional_path = os.path.join(study_output_dir, conditional_parquet_filename(chromosome))
+    _write_parquet(conditional.astype(np.float32), conditional_path, preserve_index=True)
+    
+    return {
+        'conditional': conditional_path
+    }
@@ -17,6 +17,7 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict, List, Tuple
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 
 # Module directory for relative paths
 MODULE_DIR = os.path.dirname(__file__)
@@ -27,6 +28,13 @@ USE_S3 = os.environ.get('USE_S3', 'false').lower() == 'true'
 S3_BUCKET = os.environ.get('S3_BUCKET', 'tcga-codeletion-data')
 S3_SL_KEY = 'synthetic_lethality/SyntheticLethalData_Harle_2025.csv'
 
+# Maximum number of chromosomes loaded concurrently per study
+CHROMOSOME_LOAD_WORKERS = 8
+
+# Chromosomes in genome order; the ordered dtype sorts on integer codes
+CHROMOSOMES = [str(i) for i in range(1, 23)] + ['X', 'Y']
+CHROMOSOME_DTYPE = pd.CategoricalDtype(CHROMOSOMES, ordered=True)
+
 
 def load_synthetic_lethal_data(
     fdr_threshold: float = 0.05,
@@ -111,6 +119,24 @@ def parse_depmap_count(depmap_str: str) -> Tuple[int, int]:
         return (0, 1086)
 
 
+def _group_by_gene_pair(sl_data: pd.DataFrame, aggregations: Dict) -> pd.DataFrame:
+    """
+    Aggregate SL rows per sorted_gene_pair using categorical (integer-coded) keys.
+    
+    Args:
+        sl_data: Synthetic lethality DataFrame with a 'sorted_gene_pair' column
+        aggregations: Column -> aggregation mapping passed to DataFrame.agg
+    
+    Returns:
+        DataFrame with 'sorted_gene_pair' plus the aggregated columns, sorted by pair
+    """
+    # Categorical keys group on int codes; observed=True skips unused categories
+    pair_keys = sl_data['sorted_gene_pair'].astype('category')
+    grouped = sl_data.groupby(pair_keys, observed=True).agg(aggregations).reset_index()
+    grouped['sorted_gene_pair'] = grouped['sorted_gene_pair'].astype(object)
+    return grouped
+
+
 def calculate_hit_frequency(sl_data: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate how many cell lines each SL pair was validated in.
@@ -127,10 +153,10 @@ def calculate_hit_frequency(sl_data: pd.DataFrame) -> pd.DataFrame:
         - cell_lines_validated: Comma-separated list of cell line labels
     """
     # Group by gene pair
-    grouped = sl_data.groupby('sorted_gene_pair').agg({
+    grouped = _group_by_gene_pair(sl_data, {
         'cell_line_label': lambda x: ','.join(sorted(set(x))),
         'cancer_type': lambda x: ','.join(sorted(set(x)))
-    }).reset_index()
+    })
     
     # Count unique cell lines
     grouped['hit_count'] = grouped['cell_line_label'].apply(lambda x: len(x.split(',')))
@@ -196,6 +222,73 @@ def calculate_therapeutic_score(
     return score
 
 
+def _load_chromosome_deletions(study_id: str, chr_num: str) -> Optional[pd.DataFrame]:
+    """
+    Load one chromosome's deletion frequencies joined with cytobands.
+    
+    Args:
+        study_id: TCGA study identifier
+        chr_num: Chromosome to load
+    
+    Returns:
+        DataFrame with columns gene, entrez_id, chromosome, cytoband,
+        deletion_frequency, or None if the chromosome is not available
+    """
+    from data import processed_loader
+    
+    try:
+        # Load deletion frequencies for this chromosome
+        del_freq_series = processed_loader.load_deletion_frequencies(chr_num, study_id)
+
+        # Load gene metadata for cytoband lookup (accept varying column casing)
+        try:
+            gene_metadata = processed_loader.load_gene_metadata(chr_num, study_id)
+            cols_lower = {c.lower(): c for c in gene_metadata.columns}
+            entrez_col = cols_lower.get('entrezgeneid') or cols_lower.get('entrez_gene_id')
+            symbol_col = cols_lower.get('hugogenesymbol') or cols_lower.get('gene_symbol')
+            cytoband_col = cols_lower.get('cytoband') or cols_lower.get('maplocation')
+
+            cytoband_by_entrez = {}
+            cytoband_by_symbol = {}
+            if cytoband_col:
+                if entrez_col:
+                    cytoband_by_entrez = gene_metadata.set_index(entrez_col)[cytoband_col].to_dict()
+                if symbol_col:
+                    cytoband_by_symbol = gene_metadata.set_index(symbol_col)[cytoband_col].to_dict()
+        except FileNotFoundError:
+            cytoband_by_entrez = {}
+            cytoband_by_symbol = {}
+        
+        # Split "SYMBOL (ENTREZ)" labels column-wise instead of per gene
+        names = pd.Series(del_freq_series.index.astype(str))
+        has_entrez = names.str.contains(' (', regex=False)
+        symbols = names.where(~has_entrez, names.str.split(' (', n=1, regex=False).str[0])
+        entrez_ids = pd.to_numeric(
+            names.str.split('(', n=1, regex=False).str[1].str.rstrip(')').where(has_entrez),
+            errors='coerce'
+        )
+        
+        # Cytoband by Entrez ID, falling back to the symbol
+        cytobands = pd.Series(None, index=names.index, dtype=object)
+        if cytoband_by_entrez:
+            cytobands = entrez_ids.map(cytoband_by_entrez)
+        if cytoband_by_symbol:
+            missing = cytobands.isna() | (cytobands == '')
+            cytobands = cytobands.where(~missing, symbols.map(cytoband_by_symbol))
+        
+        return pd.DataFrame({
+            'gene': symbols,
+            'entrez_id': entrez_ids,
+            'chromosome': chr_num,
+            'cytoband': cytobands,
+            'deletion_frequency': del_freq_series.to_numpy()
+        })
+    
+    except FileNotFoundError:
+        # Chromosome data not available for this study
+        return None
+
+
 def aggregate_deletions_genome_wide(
     study_id: str,
     chromosomes: Optional[List[str]] = None
@@ -211,74 +304,28 @@ def aggregate_deletions_genome_wide(
         DataFrame with columns:
         - gene: Gene symbol (e.g., "TP53")
         - entrez_id: Entrez gene ID
-        - chromosome: Chromosome location
+        - chromosome: Chromosome location (ordered categorical in genome order)
         - cytoband: Cytogenetic band for the gene (if available)
         - deletion_frequency: Fraction of samples with deletion (0-1)
     """
-    from data import processed_loader
-    
     if chromosomes is None:
-        chromosomes = [str(i) for i in range(1, 23)] + ['X', 'Y']
+        chromosomes = CHROMOSOMES
     
-    all_deletions = []
+    # Chromosome loads are I/O-bound, so read them concurrently (order is preserved)
+    with ThreadPoolExecutor(max_workers=min(CHROMOSOME_LOAD_WORKERS, max(len(chromosomes), 1))) as executor:
+        results = executor.map(lambda chr_num: _load_chromosome_deletions(study_id, chr_num), chromosomes)
+        frames = [frame for frame in results if frame is not None]
     
-    for chr_num in chromosomes:
-        try:
-            # Load deletion frequencies for this chromosome
-            del_freq_series = processed_loader.load_deletion_frequencies(chr_num, study_id)
-
-            # Load gene metadata for cytoband lookup (accept varying column casing)
-            try:
-                gene_metadata = processed_loader.load_gene_metadata(chr_num, study_id)
-                cols_lower = {c.lower(): c for c in gene_metadata.columns}
-                entrez_col = cols_lower.get('entrezgeneid') or cols_lower.get('entrez_gene_id')
-                symbol_col = cols_lower.get('hugogenesymbol') or cols_lower.get('gene_symbol')
-                cytoband_col = cols_lower.get('cytoband') or cols_lower.get('maplocation')
-
-                cytoband_by_entrez = {}
-                cytoband_by_symbol = {}
-                if cytoband_col:
-                    if entrez_col:
-                        cytoband_by_entrez = gene_metadata.set_index(entrez_col)[cytoband_col].to_dict()
-                    if symbol_col:
-                        cytoband_by_symbol = gene_metadata.set_index(symbol_col)[cytoband_col].to_dict()
-            except FileNotFoundError:
-                cytoband_by_entrez = {}
-                cytoband_by_symbol = {}
-            
-            # Convert Series to DataFrame format
-            for gene_name, freq in del_freq_series.items():
-                # Extract symbol from "SYMBOL (ENTREZ)" format
-                if ' (' in gene_name:
-                    symbol = gene_name.split(' (')[0]
-                    entrez_str = gene_name.split('(')[1].rstrip(')')
-                    try:
-                        entrez_id = int(entrez_str)
-                    except:
-                        entrez_id = None
-                else:
-                    symbol = gene_name
-                    entrez_id = None
-
-                cytoband = None
-                if entrez_id is not None and cytoband_by_entrez:
-                    cytoband = cytoband_by_entrez.get(entrez_id)
-                if not cytoband and cytoband_by_symbol:
-                    cytoband = cytoband_by_symbol.get(symbol)
-                
-                all_deletions.append({
-                    'gene': symbol,
-                    'entrez_id': entrez_id,
-                    'chromosome': chr_num,
-                    'cytoband': cytoband,
-                    'deletion_frequency': freq
-                })
-        
-        except FileNotFoundError:
-            # Chromosome data not available for this study
-            continue
+    if not frames:
+        return pd.DataFrame()
+    
+    genome_df = pd.concat(frames, ignore_index=True)
     
-    return pd.DataFrame(all_deletions)
+    # Store chromosome as integer codes (one label per gene otherwise)
+    if genome_df['chromosome'].isin(CHROMOSOMES).all():
+        genome_df['chromosome'] = genome_df['chromosome'].astype(CHROMOSOME_DTYPE)
+    
+    return genome_df
 
 
 def join_deletion_with_synthetic_lethality(
@@ -316,7 +363,7 @@ def join_deletion_with_synthetic_lethality(
     deletion_df = deletion_df[deletion_df['deletion_frequency'] >= min_deletion_freq].copy()
     
     # Get representative row per gene pair (average across cell lines)
-    sl_summary = sl_data.groupby('sorted_gene_pair').agg({
+    sl_summary = _group_by_gene_pair(sl_data, {
         'targetA': 'first',
         'targetB': 'first',
         'mean_norm_gi': 'mean',
@@ -325,7 +372,7 @@ def join_deletion_with_synthetic_lethality(
         'targetB__is_common_essential_bagel2': 'first',
         'targetA__n_depmap_dependent_cell_lines': 'first',
         'targetB__n_depmap_dependent_cell_lines': 'first'
-    }).reset_index()
+    })
     
     # Parse DepMap counts
     sl_summary['targetA_depmap_count'] = sl_summary['targetA__n_depmap_dependent_cell_lines'].apply(
@@ -339,62 +386,39 @@ def join_deletion_with_synthetic_lethality(
     if hit_frequency_df is not None:
         sl_summary = sl_summary.merge(hit_frequency_df, on='sorted_gene_pair', how='left')
     
-    opportunities = []
+    # First deletion row per gene, indexed by gene: each SL pair is matched with
+    # one hash join per direction instead of scanning deletion_df per gene
+    first_deletion = (
+        deletion_df.reindex(columns=['gene', 'deletion_frequency', 'cytoband'])
+        .drop_duplicates('gene')
+        .set_index('gene')
+    )
     
-    # Create bidirectional opportunities
-    for _, sl_row in sl_summary.iterrows():
-        gene_a = sl_row['targetA']
-        gene_b = sl_row['targetB']
+    # Create bidirectional opportunities: A deleted -> target B, B deleted -> target A
+    directions = []
+    for deleted, target in (('targetA', 'targetB'), ('targetB', 'targetA')):
+        matched = sl_summary.join(first_deletion, on=deleted, how='inner')
+        opp = pd.DataFrame({
+            'deleted_gene': matched[deleted],
+            'target_gene': matched[target],
+            'deletion_frequency': matched['deletion_frequency'],
+            'gi_score': matched['mean_norm_gi'],
+            'fdr': matched['fdr'],
+            'target_is_common_essential': matched[f'{target}__is_common_essential_bagel2'].astype(bool),
+            'target_depmap_dependent_lines': matched[f'{target}_depmap_count'],
+            'deleted_gene_cytoband': matched['cytoband']
+        })
         
-        # Opportunity 1: A is deleted → target B
-        a_deletions = deletion_df[deletion_df['gene'] == gene_a]
-        if not a_deletions.empty:
-            a_row = a_deletions.iloc[0]
-            del_freq_a = a_row['deletion_frequency']
-            
-            opp = {
-                'deleted_gene': gene_a,
-                'target_gene': gene_b,
-                'deletion_frequency': del_freq_a,
-                'gi_score': sl_row['mean_norm_gi'],
-                'fdr': sl_row['fdr'],
-                'target_is_common_essential': bool(sl_row['targetB__is_common_essential_bagel2']),
-                'target_depmap_dependent_lines': sl_row['targetB_depmap_count'],
-                'deleted_gene_cytoband': a_row.get('cytoband')
-            }
-            
-            if hit_frequency_df is not None:
-                opp['hit_count'] = sl_row.get('hit_count', 0)
-                opp['hit_fraction'] = sl_row.get('hit_fraction', 0.0)
-                opp['cancer_types_validated'] = sl_row.get('cancer_types_validated', '')
-            
-            opportunities.append(opp)
+        if hit_frequency_df is not None:
+            opp['hit_count'] = matched['hit_count']
+            opp['hit_fraction'] = matched['hit_fraction']
+            opp['cancer_types_validated'] = matched['cancer_types_validated']
         
-        # Opportunity 2: B is deleted → target A
-        b_deletions = deletion_df[deletion_df['gene'] == gene_b]
-        if not b_deletions.empty:
-            b_row = b_deletions.iloc[0]
-            del_freq_b = b_row['deletion_frequency']
-            
-            opp = {
-                'deleted_gene': gene_b,
-                'target_gene': gene_a,
-                'deletion_frequency': del_freq_b,
-                'gi_score': sl_row['mean_norm_gi'],
-                'fdr': sl_row['fdr'],
-                'target_is_common_essential': bool(sl_row['targetA__is_common_essential_bagel2']),
-                'target_depmap_dependent_lines': sl_row['targetA_depmap_count'],
-                'deleted_gene_cytoband': b_row.get('cytoband')
-            }
-            
-            if hit_frequency_df is not None:
-                opp['hit_count'] = sl_row.get('hit_count', 0)
-                opp['hit_fraction'] = sl_row.get('hit_fraction', 0.0)
-                opp['cancer_types_validated'] = sl_row.get('cancer_types_validated', '')
-            
-            opportunities.append(opp)
+        directions.append(opp)
+    
+    # Keep each pair's A-deleted row ahead of its B-deleted row (stable on the SL index)
+    result_df = pd.concat(directions).sort_index(kind='stable').reset_index(drop=True)
     
-    result_df = pd.DataFrame(opportunities)
     
     # Debug logging
     import sys
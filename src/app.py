@@ -5,13 +5,22 @@ This multi-page app loads pre-processed co-deletion data and provides interactiv
 controls for exploring conditional co-deletion probabilities.
 """
 
+import json
 import os
 import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
-from dash import Dash, Input, Output, State, html, dcc
+from dash import Dash, Input, Output, State, ClientsideFunction, Patch, ctx, html, dcc, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 
@@ -22,8 +31,10 @@ from src.layouts.codeletion import (
     create_gene_pairs_tab,
     create_distance_scatter_tab
 )
+from src.layouts.target_discovery_tab import create_target_discovery_tab
 from src.data import processed_loader
-from src.visualization import codeletion_heatmap
+from src.analysis import synthetic_lethality
+from src.visualization import codeletion_heatmap, target_discovery
 
 
 # ============================================================================
@@ -44,6 +55,29 @@ def register_health_check(server):
 # Helper Functions
 # ============================================================================
 
+def _format_study_id(study_id):
+    """Format a study ID for display when no cBioPortal name is available."""
+    return study_id.replace('_', ' ').replace('tcga', 'TCGA').replace('pan can atlas', 'PanCanAtlas').title()
+
+
+@lru_cache(maxsize=1)
+def _study_name_map():
+    """
+    Build a {study_id: display_name} map from cBioPortal, fetched once per process.
+    
+    Returns:
+        Dict mapping study IDs to human-readable names
+    """
+    from data.cbioportal_client import get_studies
+    
+    # Remove (TCGA, PanCancer Atlas) suffix
+    return {
+        study['studyId']: study.get('name', study['studyId']).replace('(TCGA, PanCancer Atlas)', '').strip()
+        for study in get_studies()
+        if study.get('studyId')
+    }
+
+
 def get_study_display_name(study_id):
     """
     Get human-readable study name from cBioPortal API.
@@ -55,24 +89,13 @@ def get_study_display_name(study_id):
         Human-readable name (e.g., 'Breast Invasive Carcinoma')
     """
     try:
-        from data.cbioportal_client import get_studies
-        
-        # Fetch all studies (cached)
-        studies = get_studies()
-        
-        # Find matching study
-        for study in studies:
-            if study.get('studyId') == study_id:
-                name = study.get('name', study_id)
-                # Remove (TCGA, PanCancer Atlas) suffix
-                name = name.replace('(TCGA, PanCancer Atlas)', '').strip()
-                return name
-        
-        # Fallback to formatted study_id if not found
-        return study_id.replace('_', ' ').replace('tcga', 'TCGA').replace('pan can atlas', 'PanCanAtlas').title()
-    except Exception as e:
-        # Fallback on error
-        return study_id.replace('_', ' ').replace('tcga', 'TCGA').replace('pan can atlas', 'PanCanAtlas').title()
+        name_map = _study_name_map()
+    except Exception:
+        # Fallback on error (failures are not cached, so the next call retries)
+        return _format_study_id(study_id)
+    
+    # Fallback to formatted study_id if not found
+    return name_map.get(study_id) or _format_study_id(study_id)
 
 
 def get_study_options_with_names(available_studies):
@@ -85,10 +108,10 @@ def get_study_options_with_names(available_studies):
     Returns:
         List of {'label': human_name, 'value': study_id} dicts
     """
-    options = []
-    for study_id in available_studies:
-        display_name = get_study_display_name(study_id)
-        options.append({'label': display_name, 'value': study_id})
+    options = [
+        {'label': get_study_display_name(study_id), 'value': study_id}
+        for study_id in available_studies
+    ]
     
     # Sort by label for better UX
     options.sort(key=lambda x: x['label'])
@@ -96,6 +119,334 @@ def get_study_options_with_names(available_studies):
     return options
 
 
+# Study selected by default in the study dropdowns when it has been processed
+DEFAULT_STUDY_ID = 'brca_tcga_pan_can_atlas_2018'
+
+
+@lru_cache(maxsize=8)
+def _study_dropdown_payload(available_studies, names_loaded):
+    """
+    Build study dropdown options and default value for a set of processed studies.
+    
+    Cached on the tuple of study IDs and on whether the cBioPortal names loaded,
+    so it is rebuilt when the list changes and fallback labels are replaced once
+    the names become available.
+    
+    Args:
+        available_studies: Tuple of study IDs
+        names_loaded: Whether _study_name_map() loaded (only keys the cache)
+        
+    Returns:
+        Tuple of (options, default_value)
+    """
+    if not available_studies:
+        return [{'label': 'No studies processed yet', 'value': 'none'}], 'none'
+    
+    options = get_study_options_with_names(available_studies)
+    
+    # Default to Breast Invasive Carcinoma if available, otherwise first alphabetically
+    if any(opt['value'] == DEFAULT_STUDY_ID for opt in options):
+        default_value = DEFAULT_STUDY_ID
+    else:
+        default_value = options[0]['value']
+    
+    return options, default_value
+
+
+# Processed study list, refreshed at most once per STUDIES_TTL_SECONDS (the same
+# age as the loader's cached S3 chromosome listings)
+STUDIES_TTL_SECONDS = processed_loader.S3_LISTING_TTL_SECONDS
+_available_studies_cache = None
+_available_studies_ts = 0.0
+
+
+def _studies(ttl=STUDIES_TTL_SECONDS):
+    """
+    Return the processed study IDs, rescanning storage at most once per ttl seconds.
+    
+    Args:
+        ttl: Maximum age of the cached list in seconds
+        
+    Returns:
+        List of study IDs
+    """
+    global _available_studies_cache, _available_studies_ts
+    now = time.monotonic()
+    if _available_studies_cache is None or now - _available_studies_ts > ttl:
+        _available_studies_cache = processed_loader.list_available_studies()
+        _available_studies_ts = now
+    return _available_studies_cache
+
+
+def _names_loaded():
+    """Return whether the cBioPortal study name map is available (retried while it is not)."""
+    try:
+        _study_name_map()
+    except Exception:
+        return False
+    return True
+
+
+def _dropdown_payload():
+    """Return (options, default_value) for the currently processed studies."""
+    return _study_dropdown_payload(tuple(_studies()), _names_loaded())
+
+
+# Processed data for one (study, chromosome), shared by the co-deletion tab callbacks
+Bundle = namedtuple('Bundle', 'conditional freqs joint metadata')
+
+
+# Age after which cached processed data is revalidated
+DATA_TTL_SECONDS = 600
+
+
+def _swr_cache(maxsize, ttl=DATA_TTL_SECONDS):
+    """
+    LRU cache decorator with stale-while-revalidate expiry, for storage loaders.
+    
+    A fresh entry is returned as is. An entry older than ttl is still returned
+    immediately, while a background thread recomputes it, so callers never wait
+    on storage for data they have already seen. Misses are computed
+    synchronously and exceptions are not cached.
+    
+    Every stored value gets a new token, read with wrapper.peek(*args), so
+    _derived_cache entries built from it can tell when it has been refreshed.
+    
+    Args:
+        maxsize: Maximum number of cached entries (least recently used evicted)
+        ttl: Seconds before an entry is revalidated in the background
+        
+    Returns:
+        Decorator for functions with hashable positional arguments
+    """
+    def decorator(func):
+        entries = OrderedDict()  # args -> (value, computed_at, token)
+        refreshing = set()
+        lock = threading.Lock()
+        
+        def store(args, value):
+            with lock:
+                entries[args] = (value, time.monotonic(), object())
+                entries.move_to_end(args)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+        
+        def refresh(args):
+            try:
+                store(args, func(*args))
+            except Exception:
+                pass  # Keep serving the stale value; the next call retries
+            finally:
+                with lock:
+                    refreshing.discard(args)
+        
+        def lookup(args):
+            # Called with lock held: the cached entry, revalidated in the background if stale
+            entry = entries.get(args)
+            if entry is not None:
+                entries.move_to_end(args)
+                if time.monotonic() - entry[1] > ttl and args not in refreshing:
+                    refreshing.add(args)
+                    threading.Thread(target=refresh, args=(args,), daemon=True).start()
+            return entry
+        
+        @wraps(func)
+        def wrapper(*args):
+            with lock:
+                entry = lookup(args)
+                if entry is not None:
+                    return entry[0]
+            
+            value = func(*args)
+            store(args, value)
+            return value
+        
+        def peek(*args):
+            """Token of the cached value for args (None if not cached), without loading it."""
+            with lock:
+                entry = lookup(args)
+                return None if entry is None else entry[2]
+        
+        def cache_clear():
+            with lock:
+                entries.clear()
+        
+        wrapper.peek = peek
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+def _derived_cache(maxsize, deps):
+    """
+    LRU cache decorator for values built from _swr_cache loaders.
+    
+    Entries have no expiry of their own: each remembers the tokens of the
+    loader entries it was built from and is rebuilt (synchronously, from the
+    cached loaders) once any of them has been refreshed. Only the loaders
+    revalidate in the background, so a derived value is never staler than its
+    loaders and newly processed data appears within about one ttl.
+    
+    Args:
+        maxsize: Maximum number of cached entries (least recently used evicted)
+        deps: Function mapping the decorated function's arguments to an iterable
+            of (loader, loader_args) pairs the value is built from
+        
+    Returns:
+        Decorator for functions with hashable positional arguments
+    """
+    def decorator(func):
+        entries = OrderedDict()  # args -> (value, loader tokens)
+        lock = threading.Lock()
+        
+        def tokens(args):
+            return tuple(loader.peek(*loader_args) for loader, loader_args in deps(*args))
+        
+        @wraps(func)
+        def wrapper(*args):
+            current = tokens(args)
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[1] == current:
+                    entries.move_to_end(args)
+                    return entry[0]
+            
+            value = func(*args)
+            # Tokens taken before the build never claim a refresh the value missed;
+            # loaders first loaded by the build are only known afterwards
+            if None in current:
+                current = tokens(args)
+            with lock:
+                entries[args] = (value, current)
+                entries.move_to_end(args)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+        
+        def cache_clear():
+            with lock:
+                entries.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+# Per-artifact loaders, cached per process on (study_id, chromosome).
+# Callers share the cached objects and must not modify them in place.
+
+@_swr_cache(maxsize=64)
+def _load_deletion_frequencies(study_id, chromosome):
+    """Load deletion frequencies for a study/chromosome, cached per process."""
+    return processed_loader.load_deletion_frequencies(chromosome=chromosome, study_id=study_id)
+
+
+@_swr_cache(maxsize=64)
+def _load_conditional_matrix(study_id, chromosome):
+    """Load the conditional co-deletion matrix for a study/chromosome, cached per process."""
+    return processed_loader.load_conditional_matrix(chromosome=chromosome, study_id=study_id)
+
+
+@_swr_cache(maxsize=64)
+def _load_codeletion_pairs(study_id, chromosome):
+    """Load long-format co-deletion pairs for a study/chromosome, cached per process."""
+    return processed_loader.load_codeletion_pairs(chromosome=chromosome, study_id=study_id)
+
+
+@_swr_cache(maxsize=64)
+def _load_gene_metadata(study_id, chromosome):
+    """Load gene metadata for a study/chromosome, cached per process."""
+    return processed_loader.load_gene_metadata(chromosome=chromosome, study_id=study_id)
+
+
+@_swr_cache(maxsize=64)
+def _load_dataset_stats(study_id, chromosome):
+    """Load the ingestion-time stats sidecar for a study/chromosome, cached per process."""
+    return processed_loader.get_dataset_stats(study_id=study_id, chromosome=chromosome)
+
+
+def _sample_counts(study_id, chromosome):
+    """
+    Sample and deletion counts for the stats display, from the stats sidecar.
+    
+    Args:
+        study_id: Study identifier
+        chromosome: Chromosome identifier
+        
+    Returns:
+        Dict with n_samples and n_deletions (None when unknown)
+    """
+    try:
+        stats = _load_dataset_stats(study_id, chromosome)
+    except Exception:
+        stats = {}
+    return {'n_samples': stats.get('n_samples'), 'n_deletions': stats.get('n_deletions')}
+
+
+def _deletion_stats(deletion_freqs):
+    """
+    Summarize deletion frequencies for the stats display.
+    
+    Args:
+        deletion_freqs: Series of per-gene deletion frequencies
+        
+    Returns:
+        Tuple of (n_genes, n_genes_with_deletions, max_deletion_pct)
+    """
+    # Backing array of the Series, no copy or pandas index alignment
+    freq_values = deletion_freqs.to_numpy()
+    
+    n_genes_with_deletions = int(np.count_nonzero(freq_values > 0))
+    max_deletion_pct = round(float(freq_values.max()) * 100, 1) if freq_values.size else 0
+    
+    return freq_values.size, n_genes_with_deletions, max_deletion_pct
+
+
+def _figure_json(fig):
+    """
+    Serialize a figure once into a JSON-ready dict.
+    
+    Arrays are already encoded (base64 typed arrays), so when a cached result is
+    returned again Dash only has to dump plain dicts and strings.
+    
+    Args:
+        fig: Plotly Figure
+        
+    Returns:
+        Figure as a plain dict
+    """
+    return json.loads(fig.to_json())
+
+
+# Per-artifact loaders behind each Bundle field, in field order
+BUNDLE_LOADERS = (_load_conditional_matrix, _load_deletion_frequencies, _load_codeletion_pairs, _load_gene_metadata)
+
+
+@_derived_cache(maxsize=64, deps=lambda study_id, chromosome: [
+    (loader, (study_id, chromosome)) for loader in BUNDLE_LOADERS
+])
+def _load_bundle(study_id, chromosome):
+    """
+    Load all processed data for a study/chromosome once and reuse it across callbacks.
+    
+    Slider and filter changes hit this cache instead of re-reading four files.
+    The four artifacts are fetched concurrently through the per-artifact caches,
+    so a cold load costs one storage round trip rather than four in sequence.
+    
+    Args:
+        study_id: Study identifier
+        chromosome: Chromosome identifier
+        
+    Returns:
+        Bundle of (conditional, freqs, joint, metadata)
+    """
+    with ThreadPoolExecutor(max_workers=len(BUNDLE_LOADERS)) as executor:
+        futures = [executor.submit(loader, study_id, chromosome) for loader in BUNDLE_LOADERS]
+        return Bundle(*(future.result() for future in futures))
+
+
 # Initialize Dash app with multi-page support
 app = Dash(
     __name__,
@@ -107,11 +458,29 @@ app = Dash(
 # Expose server for WSGI
 server = app.server
 
-# Set the app layout with URL routing
-app.layout = html.Div([
-    dcc.Location(id='url', refresh=False),
-    html.Div(id='page-content')
-])
+# Warm the study name map in the background so the first page load doesn't wait on cBioPortal
+threading.Thread(target=get_study_display_name, args=('',), daemon=True).start()
+
+def serve_layout():
+    """
+    Build the app layout with URL routing.
+    
+    The study dropdown options are computed once per page load and shipped in
+    'study-options-store'; every study dropdown is hydrated from it clientside.
+    """
+    options, default_value = _dropdown_payload()
+    if default_value == 'none':
+        options, default_value = [], None
+    
+    return html.Div([
+        dcc.Location(id='url', refresh=False),
+        dcc.Store(id='study-options-store', data={'options': options, 'default': default_value}),
+        html.Div(id='page-content')
+    ])
+
+
+# Set the app layout with URL routing (a function, so each page load sees current studies)
+app.layout = serve_layout
 
 
 # ============================================================================
@@ -184,7 +553,6 @@ def display_tab_content(active_tab):
     elif active_tab == 'tab-distance-scatter':
         return create_distance_scatter_tab()
     elif active_tab == 'tab-target-discovery':
-        from layouts.target_discovery_tab import create_target_discovery_tab
         return create_target_discovery_tab()
     else:
         return create_heatmap_tab()  # Default
@@ -194,40 +562,45 @@ def display_tab_content(active_tab):
 # Deletion Frequency Tab Callbacks
 # ============================================================================
 
-# Callback: Populate deletion tab study dropdown
-@app.callback(
+# Clientside callback: Populate deletion tab study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateDropdown'),
     [Output('deletion-study-dropdown', 'options'),
      Output('deletion-study-dropdown', 'value')],
-    Input('deletion-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('deletion-study-dropdown', 'id')]
 )
-def populate_deletion_study_dropdown(_):
-    """Populate study dropdown for deletion frequency tab."""
-    available_studies = processed_loader.list_available_studies()
-    
-    if not available_studies:
-        return [{'label': 'No studies processed yet', 'value': 'none'}], 'none'
+
+@_derived_cache(maxsize=64, deps=lambda study_id, chromosome: [
+    (_load_deletion_frequencies, (study_id, chromosome)),
+    (_load_gene_metadata, (study_id, chromosome))
+])
+def _deletion_scatter_figure(study_id, chromosome):
+    """Build the deletion frequency scatter for a study/chromosome as a cached JSON-ready dict."""
+    deletion_freqs = _load_deletion_frequencies(study_id, chromosome)
     
-    options = get_study_options_with_names(available_studies)
+    gene_metadata = _load_gene_metadata(study_id, chromosome)
     
-    # Default to Breast Invasive Carcinoma if available, otherwise first alphabetically
-    default_study_id = 'brca_tcga_pan_can_atlas_2018'
-    if any(opt['value'] == default_study_id for opt in options):
-        default_value = default_study_id
-    else:
-        default_value = options[0]['value'] if options else available_studies[0]
+    fig = codeletion_heatmap.create_deletion_frequency_scatter(
+        deletion_freqs=deletion_freqs,
+        gene_metadata=gene_metadata
+    )
     
-    return options, default_value
+    return _figure_json(fig)
+
 
-# Callback: Update deletion frequency scatter plot
+# Callback: Update deletion frequency scatter plot and stats
+# (one request per study/chromosome change; both outputs share the same loaded data)
 @app.callback(
-    Output('deletion-frequency-scatter', 'figure'),
+    [Output('deletion-frequency-scatter', 'figure'),
+     Output('deletion-stats-display', 'children')],
     [
         Input('deletion-study-dropdown', 'value'),
         Input('deletion-chromosome-dropdown', 'value')
     ]
 )
-def update_deletion_scatter(study_id, chromosome):
-    """Update the deletion frequency scatter plot."""
+def update_deletion_tab(study_id, chromosome):
+    """Update the deletion frequency scatter plot and its statistics."""
     if study_id is None or study_id == 'none':
         fig = go.Figure()
         fig.add_annotation(
@@ -236,202 +609,175 @@ def update_deletion_scatter(study_id, chromosome):
             x=0.5, y=0.5, showarrow=False,
             font=dict(size=16)
         )
-        return fig
-    
-    deletion_freqs = processed_loader.load_deletion_frequencies(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    gene_metadata = processed_loader.load_gene_metadata(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    fig = codeletion_heatmap.create_deletion_frequency_scatter(
-        deletion_freqs=deletion_freqs,
-        gene_metadata=gene_metadata
-    )
-    
-    return fig
-
-
-# Callback: Update deletion frequency stats
-@app.callback(
-    Output('deletion-stats-display', 'children'),
-    [
-        Input('deletion-study-dropdown', 'value'),
-        Input('deletion-chromosome-dropdown', 'value')
-    ]
-)
-def update_deletion_stats(study_id, chromosome):
-    """Update statistics for deletion frequency tab."""
-    if study_id is None or study_id == 'none':
-        return html.P("No data available", className="text-muted")
-    
-    deletion_freqs = processed_loader.load_deletion_frequencies(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    n_genes = len(deletion_freqs)
-    # Handle both dict and Series/array types
-    if hasattr(deletion_freqs, 'values'):
-        if callable(deletion_freqs.values):
-            freq_values = deletion_freqs.values()
-        else:
-            freq_values = deletion_freqs.values
-    else:
-        freq_values = deletion_freqs
+        return fig, html.P("No data available", className="text-muted")
     
-    n_genes_with_deletions = sum(1 for freq in freq_values if freq > 0)
-    max_deletion_pct = round(max(freq_values) * 100, 1) if len(freq_values) > 0 else 0
+    deletion_freqs = _load_deletion_frequencies(study_id, chromosome)
+    stats = create_stats_display(*_deletion_stats(deletion_freqs), chromosome,
+                                 **_sample_counts(study_id, chromosome))
     
-    return create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chromosome)
+    return _deletion_scatter_figure(study_id, chromosome), stats
 
 
 # ============================================================================
 # Heatmap Tab Callbacks
 # ============================================================================
 
-# Callback: Populate heatmap tab study dropdown
-@app.callback(
+# Clientside callback: Populate heatmap tab study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateDropdown'),
     [Output('heatmap-study-dropdown', 'options'),
      Output('heatmap-study-dropdown', 'value')],
-    Input('heatmap-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('heatmap-study-dropdown', 'id')]
 )
-def populate_heatmap_study_dropdown(_):
-    """Populate study dropdown for heatmap tab."""
-    available_studies = processed_loader.list_available_studies()
-    
-    if not available_studies:
-        return [{'label': 'No studies processed yet', 'value': 'none'}], 'none'
-    
-    options = get_study_options_with_names(available_studies)
-    default_study_id = 'brca_tcga_pan_can_atlas_2018'
-    if any(opt['value'] == default_study_id for opt in options):
-        default_value = default_study_id
-    else:
-        default_value = options[0]['value'] if options else available_studies[0]
-    
-    return options, default_value
 
 
-# Callback: Update heatmap
-@app.callback(
-    Output('codeletion-heatmap', 'figure'),
-    [
-        Input('heatmap-colorscale-dropdown', 'value'),
-        Input('heatmap-n-labels-slider', 'value'),
-        Input('heatmap-study-dropdown', 'value'),
-        Input('heatmap-chromosome-dropdown', 'value')
-    ]
-)
-def update_heatmap(colorscale, n_labels, study_id, chromosome):
-    """Update the co-deletion heatmap."""
-    if study_id is None or study_id == 'none':
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=16)
-        )
-        return fig
+# Largest heatmap side (in cells) sent to the browser
+HEATMAP_MAX_SIDE = 400
+
+# Heatmaps with more cells than this are sent as uint8 percents instead of float32
+HEATMAP_QUANTIZE_CELLS = 200 * 200
+
+
+@_derived_cache(maxsize=32, deps=lambda study_id, chromosome, colorscale, n_labels: [
+    (_load_conditional_matrix, (study_id, chromosome)),
+    (_load_gene_metadata, (study_id, chromosome))
+])
+def _heatmap_figure(study_id, chromosome, colorscale, n_labels):
+    """
+    Build the heatmap figure dict for a study/chromosome and display settings.
     
-    conditional_matrix = processed_loader.load_conditional_matrix(
-        chromosome=chromosome,
-        study_id=study_id
-    )
+    Cached on the primitive inputs, so switching back to a colorscale or label
+    count that was already shown skips figure construction entirely.
     
-    gene_metadata = processed_loader.load_gene_metadata(
-        chromosome=chromosome,
-        study_id=study_id
-    )
+    Args:
+        study_id: Study identifier
+        chromosome: Chromosome identifier
+        colorscale: Plotly colorscale name
+        n_labels: Number of axis labels
+        
+    Returns:
+        Plotly figure as a JSON-ready dict
+    """
+    conditional_matrix = _load_conditional_matrix(study_id, chromosome)
+    
+    gene_metadata = _load_gene_metadata(study_id, chromosome)
     
     # Extract gene labels from metadata DataFrame
     gene_labels = None
     if gene_metadata is not None and not gene_metadata.empty:
-        gene_labels = gene_metadata['hugoGeneSymbol'].tolist()
+        gene_labels = gene_metadata['hugoGeneSymbol'].to_numpy()
+    
+    # Block-average large matrices down to display resolution (labels follow the blocks)
+    conditional_matrix, block = codeletion_heatmap.downsample_matrix(
+        conditional_matrix, max_side=HEATMAP_MAX_SIDE
+    )
+    if gene_labels is not None and block > 1:
+        gene_labels = gene_labels[::block]
     
     fig = codeletion_heatmap.create_heatmap_figure(
         mat=conditional_matrix,
         colorscale=colorscale,
         n_labels=n_labels,
-        cytobands=gene_labels
+        cytobands=gene_labels,
+        quantize_above=HEATMAP_QUANTIZE_CELLS
     )
     
-    return fig
+    return _figure_json(fig)
 
 
-# Callback: Update heatmap stats
+# Callback: Update heatmap and its stats
+# (one request per study/chromosome change; stats are left untouched when only
+# the display settings change)
 @app.callback(
-    Output('heatmap-stats-display', 'children'),
+    [Output('codeletion-heatmap', 'figure'),
+     Output('heatmap-stats-display', 'children')],
     [
+        Input('heatmap-colorscale-dropdown', 'value'),
+        Input('heatmap-n-labels-slider', 'value'),
         Input('heatmap-study-dropdown', 'value'),
         Input('heatmap-chromosome-dropdown', 'value')
     ]
 )
-def update_heatmap_stats(study_id, chromosome):
-    """Update statistics for heatmap tab."""
+def update_heatmap_tab(colorscale, n_labels, study_id, chromosome):
+    """Update the co-deletion heatmap and its statistics."""
     if study_id is None or study_id == 'none':
-        return html.P("No data available", className="text-muted")
+        fig = go.Figure()
+        fig.add_annotation(
+            text="No data available",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False,
+            font=dict(size=16)
+        )
+        return fig, html.P("No data available", className="text-muted")
     
-    deletion_freqs = processed_loader.load_deletion_frequencies(
-        chromosome=chromosome,
-        study_id=study_id
-    )
+    figure = _heatmap_figure(study_id, chromosome, colorscale, n_labels)
     
-    n_genes = len(deletion_freqs)
-    # Handle both dict and Series/array types
-    if hasattr(deletion_freqs, 'values'):
-        if callable(deletion_freqs.values):
-            freq_values = deletion_freqs.values()
-        else:
-            freq_values = deletion_freqs.values
-    else:
-        freq_values = deletion_freqs
+    if ctx.triggered_id in ('heatmap-colorscale-dropdown', 'heatmap-n-labels-slider'):
+        return figure, no_update
     
-    n_genes_with_deletions = sum(1 for freq in freq_values if freq > 0)
-    max_deletion_pct = round(max(freq_values) * 100, 1) if len(freq_values) > 0 else 0
+    deletion_freqs = _load_deletion_frequencies(study_id, chromosome)
+    stats = create_stats_display(*_deletion_stats(deletion_freqs), chromosome,
+                                 **_sample_counts(study_id, chromosome))
     
-    return create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chromosome)
+    return figure, stats
 
 
 # ============================================================================
 # Gene Pairs Tab Callbacks
 # ============================================================================
 
-# Callback: Populate gene pairs tab study dropdown
-@app.callback(
+# Clientside callback: Populate gene pairs tab study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateDropdown'),
     [Output('pairs-study-dropdown', 'options'),
      Output('pairs-study-dropdown', 'value')],
-    Input('pairs-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('pairs-study-dropdown', 'id')]
+)
+
+
+# Callback: Load candidate gene pairs for the selected study/chromosome
+@app.callback(
+    [Output('pairs-data-store', 'data'),
+     Output('top-pairs-table', 'children')],
+    [Input('pairs-study-dropdown', 'value'),
+     Input('pairs-chromosome-dropdown', 'value')]
 )
-def populate_pairs_study_dropdown(_):
-    """Populate study dropdown for gene pairs tab."""
-    available_studies = processed_loader.list_available_studies()
+def update_pairs_data_store(study_id, chromosome):
+    """
+    Load all candidate gene pairs into the browser-side store.
     
-    if not available_studies:
-        return [{'label': 'No studies processed yet', 'value': 'none'}], 'none'
+    Only study/chromosome changes reach the server; the slider, gene search
+    and numeric filters are applied clientside by pairs.filterTable.
+    """
+    table = codeletion_heatmap.create_top_pairs_table([])
     
-    options = get_study_options_with_names(available_studies)
-    default_study_id = 'brca_tcga_pan_can_atlas_2018'
-    if any(opt['value'] == default_study_id for opt in options):
-        default_value = default_study_id
-    else:
-        default_value = options[0]['value'] if options else available_studies[0]
+    if study_id is None or study_id == 'none':
+        return None, table
     
-    return options, default_value
+    bundle = _load_bundle(study_id, chromosome)
+    
+    pairs_df = codeletion_heatmap.build_top_pairs_data(
+        conditional_matrix=bundle.conditional,
+        deletion_freqs=bundle.freqs,
+        joint_data=bundle.joint,
+        gene_metadata=bundle.metadata
+    )
+    
+    return pairs_df.to_dict('records'), table
 
 
-# Callback: Update top pairs table
-@app.callback(
-    Output('top-pairs-table', 'children'),
+# Clientside callback: Filter the stored pairs and update the table
+app.clientside_callback(
+    ClientsideFunction(namespace='pairs', function_name='filterTable'),
+    [Output('top-pairs-datatable', 'data'),
+     Output('top-pairs-datatable', 'page_size'),
+     Output('top-pairs-message', 'children'),
+     Output('top-pairs-table', 'style')],
     [
+        Input('pairs-data-store', 'data'),
         Input('pairs-n-pairs-slider', 'value'),
-        Input('pairs-study-dropdown', 'value'),
-        Input('pairs-chromosome-dropdown', 'value'),
         Input('pairs-gene-search-input', 'value'),
         Input('pairs-min-distance', 'value'),
         Input('pairs-max-distance', 'value'),
@@ -441,75 +787,44 @@ def populate_pairs_study_dropdown(_):
         Input('pairs-min-joint', 'value')
     ]
 )
-def update_top_pairs_table(n_pairs, study_id, chromosome, gene_filter,
-                          min_distance, max_distance, min_freq, min_pab, min_pba, min_joint):
-    """Update the top gene pairs table."""
-    if study_id is None or study_id == 'none':
-        return html.P("No data available", className="text-muted")
-    
-    conditional_matrix = processed_loader.load_conditional_matrix(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    deletion_freqs = processed_loader.load_deletion_frequencies(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    joint_data = processed_loader.load_codeletion_pairs(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    gene_metadata = processed_loader.load_gene_metadata(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    table_data = codeletion_heatmap.create_top_pairs_table_data(
-        conditional_matrix=conditional_matrix,
-        deletion_freqs=deletion_freqs,
-        joint_data=joint_data,
-        gene_metadata=gene_metadata,
-        n=n_pairs,
-        gene_filter=gene_filter if gene_filter and gene_filter.strip() else None,
-        min_distance=min_distance,
-        max_distance=max_distance,
-        min_freq=min_freq,
-        min_pab=min_pab,
-        min_pba=min_pba,
-        min_joint=min_joint
-    )
-    
-    return table_data
 
 
 # ============================================================================
 # Distance Scatter Tab Callbacks
 # ============================================================================
 
-# Callback: Populate distance scatter tab study dropdown
-@app.callback(
+# Clientside callback: Populate distance scatter tab study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateDropdown'),
     [Output('scatter-study-dropdown', 'options'),
      Output('scatter-study-dropdown', 'value')],
-    Input('scatter-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('scatter-study-dropdown', 'id')]
 )
-def populate_scatter_study_dropdown(_):
-    """Populate study dropdown for distance scatter tab."""
-    available_studies = processed_loader.list_available_studies()
+
+
+@_derived_cache(maxsize=64, deps=lambda study_id, chromosome, gene_filter, freq_a: [
+    (_load_conditional_matrix, (study_id, chromosome)),
+    (_load_gene_metadata, (study_id, chromosome)),
+    (_load_deletion_frequencies, (study_id, chromosome))
+])
+def _distance_scatter_figure(study_id, chromosome, gene_filter, freq_a):
+    """Build the distance vs frequency scatter as a cached JSON-ready dict."""
+    conditional_matrix = _load_conditional_matrix(study_id, chromosome)
     
-    if not available_studies:
-        return [{'label': 'No studies processed yet', 'value': 'none'}], 'none'
+    gene_metadata = _load_gene_metadata(study_id, chromosome)
     
-    options = get_study_options_with_names(available_studies)
-    default_study_id = 'brca_tcga_pan_can_atlas_2018'
-    if any(opt['value'] == default_study_id for opt in options):
-        default_value = default_study_id
-    else:
-        default_value = options[0]['value'] if options else available_studies[0]
+    deletion_freqs = _load_deletion_frequencies(study_id, chromosome)
     
-    return options, default_value
+    fig = codeletion_heatmap.create_distance_frequency_scatter(
+        conditional_matrix=conditional_matrix,
+        gene_metadata=gene_metadata,
+        deletion_freqs=deletion_freqs,
+        gene_filter=gene_filter,
+        freq_a=freq_a
+    )
+    
+    return _figure_json(fig)
 
 
 # Callback: Update distance-frequency scatter plot
@@ -540,79 +855,110 @@ def update_distance_scatter(study_id, chromosome, gene_filter,
         )
         return fig
     
-    conditional_matrix = processed_loader.load_conditional_matrix(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    gene_metadata = processed_loader.load_gene_metadata(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    deletion_freqs = processed_loader.load_deletion_frequencies(
-        chromosome=chromosome,
-        study_id=study_id
-    )
-    
-    fig = codeletion_heatmap.create_distance_frequency_scatter(
-        conditional_matrix=conditional_matrix,
-        gene_metadata=gene_metadata,
-        deletion_freqs=deletion_freqs,
-        gene_filter=gene_filter if gene_filter and gene_filter.strip() else None,
-        freq_a=min_freq_a  # Using min as the threshold for filtering
+    return _distance_scatter_figure(
+        study_id,
+        chromosome,
+        gene_filter if gene_filter and gene_filter.strip() else None,
+        min_freq_a  # Using min as the threshold for filtering
     )
-    
-    return fig
 
 
 # ============================================================================
 # Summary Page Callbacks (unchanged)
 # ============================================================================
 
-# Callback: Populate summary page study dropdown
-@app.callback(
+# Clientside callback: Populate summary page study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateSummaryDropdown'),
     Output('summary-study-dropdown', 'options'),
-    Input('summary-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('summary-study-dropdown', 'id')]
 )
-def populate_summary_study_dropdown(_):
-    """Populate study dropdown for summary page."""
-    available_studies = processed_loader.list_available_studies()
-    
-    if not available_studies:
-        return [{'label': 'All Studies', 'value': 'all'}]
-    
-    options = [{'label': 'All Studies', 'value': 'all'}]
-    options.extend(get_study_options_with_names(available_studies))
-    
-    return options
 
 
-# Callback: Update summary statistics
-@app.callback(
+# Clientside callback: Update summary statistics cards from the filters and
+# the processed studies already in 'study-options-store' (no server round trip)
+app.clientside_callback(
+    ClientsideFunction(namespace='summary', function_name='filterCards'),
     [Output('summary-total-studies', 'children'),
      Output('summary-total-chromosomes', 'children'),
      Output('summary-total-analyses', 'children')],
     [Input('summary-study-dropdown', 'value'),
-     Input('summary-chromosome-dropdown', 'value')]
+     Input('summary-chromosome-dropdown', 'value')],
+    State('study-options-store', 'data')
 )
-def update_summary_stats(study_filter, chromosome_filter):
-    """Update summary statistics."""
-    available_studies = processed_loader.list_available_studies()
+
+
+# Maximum number of concurrent deletion-frequency loads for the summary chart
+SUMMARY_LOAD_WORKERS = 8
+
+# Number of bins in the summary deletion frequency histogram
+SUMMARY_HISTOGRAM_BINS = 50
+
+
+@_derived_cache(maxsize=16, deps=lambda jobs: [
+    (_load_deletion_frequencies, job) for job in jobs
+])
+def _summary_distribution_figure(jobs):
+    """
+    Build the summary deletion frequency histogram as a cached JSON-ready dict.
     
-    if study_filter and study_filter != 'all':
-        n_studies = 1
-    else:
-        n_studies = len(available_studies)
+    Frequencies are binned here, so the browser receives one bar per bin
+    instead of every gene's value.
     
-    if chromosome_filter and chromosome_filter != 'all':
-        n_chromosomes = 1
-    else:
-        n_chromosomes = 24
+    Args:
+        jobs: Tuple of (study_id, chromosome) pairs to include
+        
+    Returns:
+        Plotly figure as a JSON-ready dict. With no data the histogram is empty
+        and carries a "No data available" annotation, so every result has the
+        same structure and filter changes can patch it in place.
+    """
+    # The histogram only needs the frequency values, so collect them as arrays
+    freq_arrays = []
+    if jobs:
+        # Loads are I/O-bound, so fetch all (study, chromosome) pairs concurrently
+        with ThreadPoolExecutor(max_workers=min(SUMMARY_LOAD_WORKERS, len(jobs))) as executor:
+            futures = [
+                executor.submit(_load_deletion_frequencies, study, chrom)
+                for study, chrom in jobs
+            ]
+            for future in futures:
+                try:
+                    freq_arrays.append(np.asarray(future.result(), dtype=np.float64))
+                except:
+                    continue
+    
+    deletion_freq_values = np.concatenate(freq_arrays) if freq_arrays else np.empty(0)
+    
+    counts, edges = np.histogram(deletion_freq_values, bins=SUMMARY_HISTOGRAM_BINS)
     
-    n_analyses = n_studies * n_chromosomes
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name='Deletion Frequency Distribution'
+    ))
     
-    return str(n_studies), str(n_chromosomes), str(n_analyses)
+    fig.update_layout(
+        title='Distribution of Gene Deletion Frequencies',
+        xaxis_title='Deletion Frequency',
+        yaxis_title='Count',
+        template='plotly_white',
+        height=400,
+        uirevision='constant'
+    )
+    
+    if deletion_freq_values.size == 0:
+        fig.add_annotation(
+            text="No data available",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False,
+            font=dict(size=16)
+        )
+    
+    return _figure_json(fig)
 
 
 # Callback: Update summary distribution chart
@@ -623,9 +969,7 @@ def update_summary_stats(study_filter, chromosome_filter):
 )
 def update_summary_distribution(study_filter, chromosome_filter):
     """Update summary distribution chart."""
-    import pandas as pd
-    
-    available_studies = processed_loader.list_available_studies()
+    available_studies = _studies()
     
     if study_filter and study_filter != 'all':
         studies_to_process = [study_filter]
@@ -637,52 +981,27 @@ def update_summary_distribution(study_filter, chromosome_filter):
     else:
         chromosomes = ['13']  # Default to chr13 for summary
     
-    data = []
+    # Keyed on the resolved (study, chromosome) set, so selections that resolve to
+    # the same data (e.g. 'all' vs the default chromosome) share one figure
+    # Only (study, chromosome) pairs with processed files, so missing ones are not
+    # probed (or recomputed from cBioPortal) on every call
+    jobs = []
     for study in studies_to_process:
-        for chrom in chromosomes:
-            try:
-                deletion_freqs = processed_loader.load_deletion_frequencies(
-                    chromosome=chrom,
-                    study_id=study
-                )
-                for gene, freq in deletion_freqs.items():
-                    data.append({
-                        'study': study,
-                        'chromosome': chrom,
-                        'gene': gene,
-                        'deletion_freq': freq
-                    })
-            except:
-                continue
-    
-    df = pd.DataFrame(data)
-    
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False,
-            font=dict(size=16)
-        )
-        return fig
-    
-    fig = go.Figure()
-    fig.add_trace(go.Histogram(
-        x=df['deletion_freq'],
-        nbinsx=50,
-        name='Deletion Frequency Distribution'
-    ))
+        available = processed_loader.list_available_chromosomes(study)
+        jobs.extend((study, chrom) for chrom in chromosomes if chrom in available)
+    jobs = tuple(jobs)
+    figure = _summary_distribution_figure(jobs)
     
-    fig.update_layout(
-        title='Distribution of Gene Deletion Frequencies',
-        xaxis_title='Deletion Frequency',
-        yaxis_title='Count',
-        template='plotly_white',
-        height=400
-    )
+    # The first render sends the whole figure; filter changes only replace the
+    # histogram bins and the "No data available" annotation
+    if ctx.triggered_id is None:
+        return figure
     
-    return fig
+    patched = Patch()
+    for key in ('x', 'y', 'width'):
+        patched['data'][0][key] = figure['data'][0][key]
+    patched['layout']['annotations'] = figure['layout'].get('annotations', [])
+    return patched
 
 
 # Callback: Update chromosome comparison chart
@@ -693,6 +1012,10 @@ def update_summary_distribution(study_filter, chromosome_filter):
 )
 def update_chromosome_comparison(study_filter, chromosome_filter):
     """Update chromosome comparison chart."""
+    # The placeholder does not depend on the filters, so only the first render sends it
+    if ctx.triggered_id is not None:
+        return no_update
+    
     fig = go.Figure()
     fig.add_annotation(
         text="Chromosome comparison visualization",
@@ -711,6 +1034,10 @@ def update_chromosome_comparison(study_filter, chromosome_filter):
 )
 def update_study_comparison(study_filter, chromosome_filter):
     """Update study comparison chart."""
+    # The placeholder does not depend on the filters, so only the first render sends it
+    if ctx.triggered_id is not None:
+        return no_update
+    
     fig = go.Figure()
     fig.add_annotation(
         text="Study comparison visualization",
@@ -736,30 +1063,16 @@ def update_summary_table(study_filter, chromosome_filter):
 # Synthetic Lethality Target Discovery Callbacks
 # ============================================================================
 
-# Callback: Populate target discovery study dropdown
-@app.callback(
+# Clientside callback: Populate target discovery study dropdown
+app.clientside_callback(
+    ClientsideFunction(namespace='studies', function_name='populateTargetDropdown'),
     [Output('target-study-dropdown', 'options'),
      Output('target-study-dropdown', 'value')],
-    Input('target-study-dropdown', 'id')
+    [Input('study-options-store', 'data'),
+     Input('target-study-dropdown', 'id')]
 )
-def populate_target_study_dropdown(_):
-    """Populate study dropdown for target discovery tab."""
-    studies = processed_loader.list_available_studies()
-    
-    if not studies:
-        return [{'label': 'No studies available', 'value': 'none'}], None
-    
-    options = get_study_options_with_names(studies)
-    
-    # Default to Breast Invasive Carcinoma if available, otherwise first alphabetically
-    default_study_id = 'brca_tcga_pan_can_atlas_2018'
-    if any(opt['value'] == default_study_id for opt in options):
-        default_value = default_study_id
-    else:
-        default_value = options[0]['value'] if options else None
-    
-    return options, default_value
-    
+
+
 # Callback: Update target discovery visualizations
 @app.callback(
     Output('target-viz-content', 'children'),
@@ -771,9 +1084,6 @@ def populate_target_study_dropdown(_):
 )
 def update_target_discovery_viz(active_viz_tab, study_id, fdr_threshold, min_del_freq, ess_filter):
     """Update target discovery visualizations based on user selections."""
-    from analysis import synthetic_lethality
-    from visualization import target_discovery
-    
     if study_id is None:
         return html.Div([
             html.P("Please select a study to view therapeutic opportunities.", 
@@ -856,7 +1166,6 @@ def update_target_discovery_viz(active_viz_tab, study_id, fdr_threshold, min_del
             return html.Div("Unknown visualization type")
     
     except Exception as e:
-        import traceback
         error_details = traceback.format_exc()
         return html.Div([
             dbc.Alert([
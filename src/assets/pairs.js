@@ -0,0 +1,62 @@
+/*
+ * Clientside callbacks for the Top Gene Pairs tab.
+ *
+ * The server sends every candidate pair for the selected study/chromosome
+ * once (already sorted by max conditional probability); the slider, search
+ * box and numeric filters are applied here without a server round trip.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    pairs: {
+        filterTable: function(records, nPairs, geneFilter, minDistance, maxDistance,
+                              minFreq, minPab, minPba, minJoint) {
+            const pageSize = nPairs || 20;
+            const hidden = {display: 'none'};
+            if (records === null || records === undefined) {
+                return [[], pageSize, 'No data available', hidden];
+            }
+            if (records.length === 0) {
+                return [[], pageSize, 'No co-deletion data available', hidden];
+            }
+
+            // Missing values (NaN on the server) arrive as null and never pass a threshold
+            const atLeast = function(value, threshold) {
+                return threshold === null || threshold === undefined ||
+                    (value !== null && value !== undefined && value >= threshold);
+            };
+            const atMost = function(value, threshold) {
+                return threshold === null || threshold === undefined ||
+                    (value !== null && value !== undefined && value <= threshold);
+            };
+
+            let rows = records;
+
+            const query = (geneFilter || '').trim().toUpperCase();
+            if (query) {
+                rows = rows.filter(function(row) {
+                    return String(row['Gene A']).toUpperCase().includes(query) ||
+                        String(row['Gene B']).toUpperCase().includes(query);
+                });
+                if (rows.length === 0) {
+                    return [[], pageSize,
+                        "No gene pairs found containing '" + geneFilter + "'", hidden];
+                }
+            }
+
+            rows = rows.filter(function(row) {
+                return atLeast(row['Distance (bp)'], minDistance) &&
+                    atMost(row['Distance (bp)'], maxDistance) &&
+                    atLeast(row['Freq A'], minFreq) &&
+                    atLeast(row['Freq B'], minFreq) &&
+                    atLeast(row['P(A|B)'], minPab) &&
+                    atLeast(row['P(B|A)'], minPba) &&
+                    atLeast(row['P(A,B)'], minJoint);
+            });
+
+            if (rows.length === 0) {
+                return [[], pageSize, 'No gene pairs match the specified filters', hidden];
+            }
+
+            return [rows, pageSize, '', {}];
+        }
+    }
+});
@@ -0,0 +1,32 @@
+/*
+ * Clientside callbacks that hydrate the study dropdowns.
+ *
+ * The options and default study are computed once per page load on the
+ * server and shipped in the 'study-options-store' dcc.Store, so rendering a
+ * tab does not need a server round trip to fill its dropdown.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    studies: {
+        populateDropdown: function(store) {
+            if (!store || !store.options || store.options.length === 0) {
+                return [[{label: 'No studies processed yet', value: 'none'}], 'none'];
+            }
+            return [store.options, store.default];
+        },
+
+        populateSummaryDropdown: function(store) {
+            const options = [{label: 'All Studies', value: 'all'}];
+            if (store && store.options) {
+                return options.concat(store.options);
+            }
+            return options;
+        },
+
+        populateTargetDropdown: function(store) {
+            if (!store || !store.options || store.options.length === 0) {
+                return [[{label: 'No studies available', value: 'none'}], null];
+            }
+            return [store.options, store.default];
+        }
+    }
+});
@@ -0,0 +1,17 @@
+/*
+ * Clientside callbacks for the Summary page.
+ *
+ * The stats cards only count studies and chromosomes, which the browser
+ * already has: the processed studies are the options in 'study-options-store'.
+ * Changing a filter therefore updates the cards without a server round trip.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    summary: {
+        filterCards: function(study, chromosome, store) {
+            const nAvailable = (store && store.options) ? store.options.length : 0;
+            const nStudies = (study && study !== 'all') ? 1 : nAvailable;
+            const nChromosomes = (chromosome && chromosome !== 'all') ? 1 : 24;
+            return [String(nStudies), String(nChromosomes), String(nStudies * nChromosomes)];
+        }
+    }
+});
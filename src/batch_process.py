@@ -5,19 +5,187 @@ This script reads study IDs from data/curated_data/TCGA_study_names.csv and proc
 each study to generate pre-computed co-deletion matrices for the Dash application.
 """
 
+import json
 import os
 import sys
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.data import queries, cbioportal_client
-from src.analysis import codeletion_calc
+from src.data import queries, cbioportal_client, processed_loader
+from src.analysis import codeletion_calc, precompute
 
 
-def process_study(study_id, output_dir, chromosome="13"):
+# Background writer threads: exports are I/O and compression bound (parquet and
+# zstd release the GIL), so a study's files are written concurrently
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _wait_for_writes(futures):
+    """Block until all submitted exports finish, re-raising the first failure."""
+    wait(futures)
+    for future in futures:
+        future.result()
+
+
+def _write_xlsx_workbook(sheets, path):
+    """
+    Write DataFrames as the sheets of one Excel workbook using openpyxl's
+    write-only (streaming) mode.
+    
+    Rows are streamed to the file instead of building every cell object in
+    memory first (openpyxl serializes with lxml when it is installed), and the
+    workbook and zip container are set up and finalized once for all sheets.
+    
+    Args:
+        sheets: List of (sheet_name, DataFrame, index) tuples, where index says
+            whether to write the DataFrame index as the first column
+        path: Output .xlsx path
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    wb = Workbook(write_only=True)
+    
+    for sheet_name, df, index in sheets:
+        ws = wb.create_sheet(title=sheet_name)
+        
+        # Bold header row, as written by DataFrame.to_excel
+        header = ([df.index.name] if index else []) + list(df.columns)
+        header_cells = []
+        for name in header:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = Font(bold=True)
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Convert to plain Python rows in one pass (no per-row indexing or cell
+        # objects); missing values become empty cells. The NaN check runs on the
+        # array itself rather than through isna()/notna() boolean DataFrames
+        values = df.to_numpy()
+        missing = pd.isna(values)
+        if missing.any():
+            values = values.astype(object)
+            values[missing] = None
+        rows = values.tolist()
+        
+        if index:
+            for label, row in zip(df.index.tolist(), rows):
+                ws.append([label] + row)
+        else:
+            for row in rows:
+                ws.append(row)
+    
+    wb.save(path)
+
+
+def _write_xlsx(df, path, index=True):
+    """
+    Write a DataFrame to a single-sheet Excel workbook (see _write_xlsx_workbook).
+    
+    Args:
+        df: DataFrame to write
+        path: Output .xlsx path
+        index: Whether to write the DataFrame index as the first column
+    """
+    _write_xlsx_workbook([('Sheet1', df, index)], path)
+
+
+def _write_table(df, path_stem, index=True, xlsx=False):
+    """
+    Write a result table as zstd-compressed parquet (or Excel for --xlsx runs).
+    
+    Args:
+        df: DataFrame to write
+        path_stem: Output path without extension
+        index: Whether to write the DataFrame index
+        xlsx: Write an Excel workbook instead of parquet
+        
+    Returns:
+        Path of the written file
+    """
+    if xlsx:
+        path = f"{path_stem}.xlsx"
+        _write_xlsx(df, path, index=index)
+    else:
+        path = f"{path_stem}.parquet"
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=index)
+    return path
+
+
+def _write_symmetric(df, path_stem, xlsx=False):
+    """
+    Write a symmetric gene x gene matrix, storing only its lower triangle.
+    
+    Parquet output is long format (gene_i, gene_j, value) over the lower triangle
+    including the diagonal, with gene names as categoricals ordered like the
+    matrix; processed_loader mirrors it back into the full matrix. Excel output
+    keeps the full matrix for readability.
+    
+    Args:
+        df: Symmetric DataFrame (genes x genes)
+        path_stem: Output path without extension
+        xlsx: Write an Excel workbook instead of parquet
+        
+    Returns:
+        Path of the written file
+    """
+    if xlsx:
+        return _write_table(df, path_stem, xlsx=True)
+    
+    il, jl = np.tril_indices(df.shape[0])
+    genes = pd.CategoricalDtype(df.index, ordered=False)
+    triangle = pd.DataFrame({
+        'gene_i': pd.Categorical.from_codes(il, dtype=genes),
+        'gene_j': pd.Categorical.from_codes(jl, dtype=genes),
+        'value': df.to_numpy()[il, jl]
+    })
+    return _write_table(triangle, path_stem, index=False)
+
+
+# Result tables written with _write_symmetric in parquet runs
+_SYMMETRIC_TABLES = frozenset(['codeletion_matrix', 'codeletion_counts'])
+
+# Result tables written as .csv.gz rather than workbook sheets in --xlsx runs
+_CSV_TABLES = frozenset(['codeletion_counts', 'codeletion_frequencies'])
+
+
+def shared_gene_metadata_path(output_dir, chromosome):
+    """Path of the chromosome gene metadata shared by all studies."""
+    return os.path.join(output_dir, f"chr{chromosome}_genes_metadata.parquet")
+
+
+def write_shared_gene_metadata(output_dir, chromosome, chr_genes):
+    """
+    Write the shared chromosome gene metadata parquet unless it already exists.
+    
+    The gene set depends only on the chromosome (and genome), so one copy in the
+    top-level processed directory serves every study. The file is written to a
+    temporary name and renamed, so concurrent workers never see a partial file.
+    
+    Args:
+        output_dir: Top-level processed directory
+        chromosome: Chromosome number
+        chr_genes: DataFrame of genes on the chromosome
+        
+    Returns:
+        Path of the shared metadata file
+    """
+    path = shared_gene_metadata_path(output_dir, chromosome)
+    if not os.path.exists(path):
+        os.makedirs(output_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        chr_genes.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, path)
+    return path
+
+
+def process_study(study_id, output_dir, chromosome="13", xlsx=False, chr_genes=None):
     """
     Process a single study to compute chromosome co-deletions.
     
@@ -25,6 +193,8 @@ def process_study(study_id, output_dir, chromosome="13"):
         study_id: Study identifier (e.g., 'prad_tcga_pan_can_atlas_2018')
         output_dir: Directory to save processed results
         chromosome: Chromosome number (default: "13")
+        xlsx: Export Excel/CSV tables instead of parquet (default: False)
+        chr_genes: Optional chromosome genes fetched once for all studies
         
     Returns:
         Dictionary with processing results and statistics
@@ -43,29 +213,27 @@ def process_study(study_id, output_dir, chromosome="13"):
     }
     
     try:
-        # Step 1: Get CNA profile and sample list
+        # Steps 1-2: Get CNA profile, sample list and chromosome genes (fetched concurrently)
         print(f"[1/6] Fetching study metadata...")
-        cna_profile_id = queries.get_cna_profile_id(study_id)
-        sample_list_id = queries.get_cna_sample_list_id(study_id)
+        print(f"[2/6] Fetching chromosome {chromosome} genes...")
+        cna_profile_id, sample_list_id, chr_genes = queries.get_study_metadata(study_id, chromosome,
+                                                                               chr_genes=chr_genes)
         print(f"  CNA profile: {cna_profile_id}")
         print(f"  Sample list: {sample_list_id}")
-        
-        # Step 2: Get chromosome genes
-        print(f"[2/6] Fetching chromosome {chromosome} genes...")
-        chr_genes = queries.get_chromosome_genes(chromosome)
         results['n_genes'] = len(chr_genes)
         print(f"  Found {len(chr_genes)} genes on chr{chromosome}")
         
         # Step 3: Fetch CNA data
         print(f"[3/6] Fetching CNA data...")
         cna_data = queries.fetch_cna_for_genes(cna_profile_id, sample_list_id, chr_genes)
-        results['n_deletions'] = len(cna_data)
         print(f"  Fetched {len(cna_data)} CNA calls")
         
         # Step 4: Build deletion matrix
         print(f"[4/6] Building deletion matrix...")
         deletion_mat = queries.build_deletion_matrix(cna_data, chr_genes, deletion_cutoff=-1)
         results['n_samples'] = deletion_mat.shape[0]
+        # Deleted (sample, gene) cells, not the number of CNA calls fetched
+        results['n_deletions'] = int(deletion_mat.to_numpy().sum(dtype=np.int64))
         print(f"  Matrix shape: {deletion_mat.shape} (samples x genes)")
         
         # Skip if no samples or very few deletions
@@ -76,8 +244,7 @@ def process_study(study_id, output_dir, chromosome="13"):
         
         # Step 5: Compute co-deletion statistics
         print(f"[5/6] Computing co-deletion statistics...")
-        freq_matrix, freq_long, counts_df = codeletion_calc.compute_codeletion_frequency(deletion_mat)
-        conditional = codeletion_calc.compute_conditional_codeletion(counts_df)
+        freq_matrix, freq_long, counts_df, conditional = codeletion_calc.compute_codeletion_statistics(deletion_mat)
         deletion_freqs = codeletion_calc.compute_deletion_frequencies(deletion_mat)
         
         # Step 6: Export results
@@ -87,59 +254,77 @@ def process_study(study_id, output_dir, chromosome="13"):
         
         # Determine chromosome size for format selection
         n_genes = freq_matrix.shape[0]
+        path_stem = os.path.join(study_output_dir, f"chr{chromosome}")
         
-        # Save gene metadata
-        chr_genes.to_excel(
-            os.path.join(study_output_dir, f"chr{chromosome}_genes_metadata.xlsx"),
-            index=False
-        )
+        # Exports run on the background writer; wait for all of them before
+        # recording success so a failed write fails the analysis
+        writes = []
         
-        # Save conditional matrix (always needed for Dash app)
-        # Use CSV for large chromosomes (Excel has size limits)
+        # Result tables as (name, DataFrame, index); large chromosomes keep the
+        # long pairs table bounded (Excel size limits) and skip the full matrices
         if n_genes > 1000:
-            conditional.to_csv(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_conditional_frequencies.csv"),
-                index=True
-            )
-        else:
-            conditional.to_excel(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_conditional_frequencies.xlsx"),
-                index=True
-            )
-        
-        # Handle large chromosomes (Excel size limits)
-        if n_genes > 1000:
-            # For large chromosomes, only save top pairs and skip full matrices
             print(f"  Large chromosome ({n_genes} genes) - saving top pairs only")
             max_pairs = min(100000, len(freq_long))
-            top_pairs = freq_long.sort_values("co_deletion_frequency", ascending=False).head(max_pairs)
-            top_pairs.to_excel(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_frequencies.xlsx"),
-                index=False
-            )
+            top_pairs = codeletion_calc.get_top_codeleted_pairs(freq_long, n=max_pairs)
+            tables = [('codeletion_frequencies', top_pairs, False)]
+        else:
+            tables = [
+                ('codeletion_matrix', freq_matrix, True),
+                ('codeletion_counts', counts_df, True),
+                ('codeletion_frequencies', freq_long, False)
+            ]
+        tables.append(('deletion_frequencies', deletion_freqs.to_frame('deletion_frequency'), True))
+        
+        if xlsx:
+            # One multi-sheet workbook per analysis, including the gene metadata and
+            # conditional matrix; a large conditional matrix exceeds Excel's limits
+            # and is written as CSV instead
+            sheets = [('genes_metadata', chr_genes, False)]
+            if n_genes > 1000:
+                writes.append(_IO_POOL.submit(conditional.to_csv, f"{path_stem}_codeletion_conditional_frequencies.csv", index=True))
+            else:
+                sheets.append(('codeletion_conditional_frequencies', conditional, True))
+            
+            # Tall numeric tables gain nothing from Excel: gzip-compressed CSV instead
+            for name, df, index in tables:
+                if name in _CSV_TABLES:
+                    writes.append(_IO_POOL.submit(df.to_csv, f"{path_stem}_{name}.csv.gz", index=index, compression='gzip'))
+                else:
+                    sheets.append((name, df, index))
+            
+            sheets = [(processed_loader.ANALYSIS_WORKBOOK_SHEETS[name], df, index) for name, df, index in sheets]
+            writes.append(_IO_POOL.submit(_write_xlsx_workbook, sheets,
+                                          f"{path_stem}{processed_loader.ANALYSIS_WORKBOOK_SUFFIX}.xlsx"))
         else:
-            # Small/medium chromosomes - save all data
-            freq_matrix.to_excel(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_matrix.xlsx"),
-                index=True
-            )
+            # Parquet runs share one gene metadata copy per chromosome and record a
+            # pointer to it in the stats sidecar
+            shared_path = shared_gene_metadata_path(output_dir, chromosome)
+            writes.append(_IO_POOL.submit(write_shared_gene_metadata, output_dir, chromosome, chr_genes))
+            results['genes_metadata'] = os.path.relpath(shared_path, study_output_dir)
             
-            counts_df.to_excel(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_counts.xlsx"),
-                index=True
-            )
+            # Symmetric matrices: only the lower triangle is stored (the conditional
+            # matrix is written with the precomputed tables below)
+            for name, df, index in tables:
+                if name in _SYMMETRIC_TABLES:
+                    writes.append(_IO_POOL.submit(_write_symmetric, df, f"{path_stem}_{name}"))
+                else:
+                    writes.append(_IO_POOL.submit(_write_table, df, f"{path_stem}_{name}", index=index))
             
-            freq_long.to_excel(
-                os.path.join(study_output_dir, f"chr{chromosome}_codeletion_frequencies.xlsx"),
-                index=False
-            )
+            # Binary deletion matrix: int8 columns compress to a small parquet file
+            writes.append(_IO_POOL.submit(_write_table, deletion_mat, f"{path_stem}_deletion_matrix"))
         
-        deletion_freqs.to_excel(
-            os.path.join(study_output_dir, f"chr{chromosome}_deletion_frequencies.xlsx"),
-            index=True
-        )
+        # Precomputed parquet conditional matrix read directly by the Dash app
+        writes.append(_IO_POOL.submit(precompute.write_precomputed_tables, study_output_dir, chromosome,
+                                      conditional))
+        
+        _wait_for_writes(writes)
         
         results['success'] = True
+        
+        # Stats sidecar so the app never needs the deletion matrix for counts
+        with open(f"{path_stem}_stats.json", 'w') as f:
+            json.dump(results, f)
+        
         print(f"  ✓ Successfully processed {study_id}")
         print(f"  ✓ Results saved to: {study_output_dir}")
         
@@ -150,6 +335,33 @@ def process_study(study_id, output_dir, chromosome="13"):
     return results
 
 
+def _process_analysis(job):
+    """
+    Process one (study, chromosome) analysis.
+    
+    Defined at module level so it can be sent to worker processes.
+    
+    Args:
+        job: Tuple of (study_id, output_dir, chromosome, xlsx, chr_genes)
+        
+    Returns:
+        Dictionary with processing results, including the chromosome
+    """
+    study_id, output_dir, chromosome, xlsx, chr_genes = job
+    result = process_study(study_id, output_dir, chromosome=chromosome, xlsx=xlsx, chr_genes=chr_genes)
+    result['chromosome'] = chromosome
+    return result
+
+
+def _parse_jobs(argv):
+    """Return the worker count from a "--jobs N" argument (default: 1, sequential)."""
+    if '--jobs' in argv:
+        position = argv.index('--jobs')
+        if position + 1 < len(argv):
+            return max(1, int(argv[position + 1]))
+    return 1
+
+
 def main():
     """
     Main batch processing workflow.
@@ -160,8 +372,14 @@ def main():
     # Define all chromosomes to process
     chromosomes = [str(i) for i in range(1, 23)] + ['X', 'Y']
     
+    # Tables are written as parquet unless --xlsx is given
+    xlsx = '--xlsx' in sys.argv[1:]
+    
+    # Number of analyses processed in parallel worker processes
+    n_jobs = _parse_jobs(sys.argv[1:])
+    
     # Allow command-line argument for test file
-    if len(sys.argv) > 1 and sys.argv[1] == '--test':
+    if '--test' in sys.argv[1:]:
         study_list_path = os.path.join(script_dir, "data", "curated_data", "test_studies.csv")
         print("** TEST MODE: Using test_studies.csv **\n")
         # In test mode, only process chr13 for speed
@@ -191,22 +409,51 @@ def main():
     print(f"\nChromosomes to process: {', '.join(chromosomes)}")
     print(f"Total analyses: {len(study_ids)} studies × {len(chromosomes)} chromosomes = {len(study_ids) * len(chromosomes)}")
     
+    # The gene set of a chromosome is the same for every study: fetch it once
+    print("\nFetching chromosome genes...")
+    genes_by_chromosome = {chromosome: queries.get_chromosome_genes(chromosome) for chromosome in chromosomes}
+    if not xlsx:
+        for chromosome, chr_genes in genes_by_chromosome.items():
+            write_shared_gene_metadata(output_dir, chromosome, chr_genes)
+    
     # Process each study and chromosome combination
-    results_list = []
-    total_analyses = len(study_ids) * len(chromosomes)
-    analysis_count = 0
+    jobs = [
+        (study_id, output_dir, chromosome, xlsx, genes_by_chromosome[chromosome])
+        for study_id in study_ids
+        for chromosome in chromosomes
+    ]
+    total_analyses = len(jobs)
     
-    for i, study_id in enumerate(study_ids, 1):
-        for chr_idx, chromosome in enumerate(chromosomes, 1):
-            analysis_count += 1
-            print(f"\n\n{'#'*70}")
-            print(f"# Analysis {analysis_count}/{total_analyses}: {study_id} - chr{chromosome}")
-            print(f"# Study {i}/{len(study_ids)} | Chromosome {chr_idx}/{len(chromosomes)}")
-            print(f"{'#'*70}")
-            
-            result = process_study(study_id, output_dir, chromosome=chromosome)
-            result['chromosome'] = chromosome
-            results_list.append(result)
+    if n_jobs == 1:
+        results_list = []
+        analysis_count = 0
+        
+        for i, study_id in enumerate(study_ids, 1):
+            for chr_idx, chromosome in enumerate(chromosomes, 1):
+                analysis_count += 1
+                print(f"\n\n{'#'*70}")
+                print(f"# Analysis {analysis_count}/{total_analyses}: {study_id} - chr{chromosome}")
+                print(f"# Study {i}/{len(study_ids)} | Chromosome {chr_idx}/{len(chromosomes)}")
+                print(f"{'#'*70}")
+                
+                results_list.append(_process_analysis(
+                    (study_id, output_dir, chromosome, xlsx, genes_by_chromosome[chromosome])))
+    else:
+        # Analyses are independent (own output files), so overlap their API waits,
+        # computation and exports; completion order is non-deterministic
+        print(f"\nRunning {total_analyses} analyses with {n_jobs} worker processes")
+        results_by_job = {}
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {executor.submit(_process_analysis, job): index for index, job in enumerate(jobs)}
+            for analysis_count, future in enumerate(as_completed(futures), 1):
+                study_id, _, chromosome, _, _ = jobs[futures[future]]
+                result = future.result()
+                status = "✓" if result['success'] else f"✗ {result['error']}"
+                print(f"# Analysis {analysis_count}/{total_analyses} done: {study_id} - chr{chromosome} {status}")
+                results_by_job[futures[future]] = result
+        
+        # Report in study/chromosome order regardless of completion order
+        results_list = [results_by_job[index] for index in range(total_analyses)]
     
     # Summary
     print("\n\n" + "="*70)
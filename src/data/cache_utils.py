@@ -1,24 +1,51 @@
 import os
 import pandas as pd
 import pickle
+import pyarrow as pa
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "cached")
 
+# Leading bytes of a parquet file and of a zstd frame (compressed pickle);
+# anything else in the cache is a plain pickle from older versions
+PARQUET_MAGIC = b"PAR1"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
 def load_from_cache(filename: str):
     """
     Load data from cache. Returns the data in its original format.
+    
+    DataFrames are stored as parquet and everything else as zstd-compressed
+    pickle; the format is detected from the file header, so older uncompressed
+    pickles still load.
     """
     path = os.path.join(CACHE_DIR, filename)
     if os.path.exists(path):
         with open(path, 'rb') as f:
+            magic = f.read(4)
+            if magic == PARQUET_MAGIC:
+                return pd.read_parquet(path, engine='pyarrow')
+            if magic == ZSTD_MAGIC:
+                with pa.input_stream(path, compression='zstd') as stream:
+                    return pickle.loads(stream.read())
+            f.seek(0)
             return pickle.load(f)
     return None
 
 def save_to_cache(data, filename: str):
     """
-    Save data to cache. Stores the data as-is.
+    Save data to cache. DataFrames are written as zstd parquet (columnar, no
+    per-object unpickling on load); other data is pickled and zstd-compressed.
     """
     os.makedirs(CACHE_DIR, exist_ok=True)
     path = os.path.join(CACHE_DIR, filename)
-    with open(path, 'wb') as f:
-        pickle.dump(data, f)
+    
+    # Write to a per-process temp file and rename, so concurrent batch workers
+    # never read a partially written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if isinstance(data, pd.DataFrame):
+        data.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+    else:
+        with pa.output_stream(tmp_path, compression='zstd') as stream:
+            stream.write(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(tmp_path, path)
@@ -5,9 +5,16 @@ This module provides direct access to cBioPortal API endpoints with caching.
 It mirrors Swagger endpoints with minimal processing and no domain-specific logic.
 """
 
+import hashlib
 import os
+import threading
+import time
+import numpy as np
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .cache_utils import load_from_cache, save_to_cache
 
 BASE = "https://www.cbioportal.org/api"
@@ -16,6 +23,101 @@ HEADERS = {
     # If you end up needing an auth token: "Authorization": "Bearer <TOKEN>"
 }
 
+# Per-process session: keep-alive connections are reused across requests (and
+# across the threads that fetch a study's metadata concurrently), but never
+# across processes, since forked workers would otherwise share the parent's
+# pooled sockets. Transient server errors are retried with backoff; the CNA
+# fetch POST is a read, so it is retried too.
+_session_pid = None
+_session_obj = None
+_session_lock = threading.Lock()
+
+
+def _session():
+    """Return this process's shared requests.Session, creating it on first use."""
+    global _session_pid, _session_obj
+    pid = os.getpid()
+    if _session_pid != pid:
+        with _session_lock:
+            if _session_pid != pid:
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=frozenset(['GET', 'POST']),
+                        raise_on_status=False  # Leave the final error response to raise_for_status()
+                    )
+                ))
+                _session_obj, _session_pid = session, pid
+    return _session_obj
+
+
+# NCBI E-utilities allows 3 requests/second, or 10 with an API key
+NCBI_ESUMMARY_URL = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi'
+NCBI_API_KEY = os.environ.get('NCBI_API_KEY')
+NCBI_REQUESTS_PER_SECOND = 10 if NCBI_API_KEY else 3
+
+
+class _RateLimiter:
+    """Space request start times at least 1/rate seconds apart across threads."""
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+    
+    def wait(self):
+        """Block until the next request slot."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        time.sleep(max(0.0, start - now))
+
+
+def _gene_set_hash(entrez_ids):
+    """Order-independent hash of a gene ID set, hashed from the sorted int64 bytes."""
+    ids = np.sort(np.asarray(entrez_ids, dtype=np.int64))
+    return hashlib.blake2b(ids.tobytes(), digest_size=8).hexdigest()
+
+
+def _legacy_gene_set_hash(entrez_ids):
+    """MD5-based gene set hash used in cache filenames by earlier versions."""
+    gene_ids_str = ",".join(map(str, sorted(entrez_ids)))
+    return hashlib.md5(gene_ids_str.encode()).hexdigest()[:8]
+
+
+def _load_gene_set_cache(prefix, entrez_ids, refresh=False):
+    """
+    Resolve the cache file for a gene-set-keyed request and load it if present.
+    
+    Entries stored under the legacy MD5 key are copied to the new key on first use.
+    
+    Args:
+        prefix: Cache filename prefix (the gene set hash is appended)
+        entrez_ids: List of Entrez gene IDs
+        refresh: Skip loading (only resolve the cache filename)
+        
+    Returns:
+        Tuple of (cache filename, cached data or None)
+    """
+    cache_file = f"{prefix}_{_gene_set_hash(entrez_ids)}.pkl"
+    if refresh:
+        return cache_file, None
+    
+    cached = load_from_cache(cache_file)
+    if cached is None:
+        cached = load_from_cache(f"{prefix}_{_legacy_gene_set_hash(entrez_ids)}.pkl")
+        if cached is not None:
+            save_to_cache(cached, cache_file)
+    
+    return cache_file, cached
+
 
 def get_studies(keyword=None, refresh=False):
     """
@@ -36,7 +138,7 @@ def get_studies(keyword=None, refresh=False):
             return cached
     
     params = {"keyword": keyword} if keyword else {}
-    r = requests.get(f"{BASE}/studies", params=params, headers=HEADERS)
+    r = _session().get(f"{BASE}/studies", params=params)
     r.raise_for_status()
     studies = r.json()
     
@@ -62,7 +164,7 @@ def get_molecular_profiles(study_id, refresh=False):
         if cached is not None:
             return cached
     
-    r = requests.get(f"{BASE}/studies/{study_id}/molecular-profiles", headers=HEADERS)
+    r = _session().get(f"{BASE}/studies/{study_id}/molecular-profiles")
     r.raise_for_status()
     profiles = r.json()
     
@@ -88,7 +190,7 @@ def get_sample_lists(study_id, refresh=False):
         if cached is not None:
             return cached
     
-    r = requests.get(f"{BASE}/studies/{study_id}/sample-lists", headers=HEADERS)
+    r = _session().get(f"{BASE}/studies/{study_id}/sample-lists")
     r.raise_for_status()
     lists_ = r.json()
     
@@ -105,43 +207,88 @@ def get_genes_by_genome(genome="hg19", refresh=False):
         refresh: Force refresh from API
         
     Returns:
-        List of gene dicts
+        DataFrame of genes (one row per gene, columns as in the API response)
     """
     cache_file = f"all_genes_{genome}.pkl"
     
     if not refresh:
         cached = load_from_cache(cache_file)
         if cached is not None:
-            return cached
+            # Entries cached by older versions are a list of gene dicts
+            return pd.DataFrame(cached) if isinstance(cached, list) else cached
     
-    r = requests.get(f"{BASE}/reference-genome-genes/{genome}", headers=HEADERS)
+    r = _session().get(f"{BASE}/reference-genome-genes/{genome}")
     r.raise_for_status()
-    genes = r.json()
+    
+    # Tabular payload: cached as parquet, so callers filter by column instead
+    # of looping over ~60k gene dicts
+    genes = pd.DataFrame(r.json())
     
     save_to_cache(genes, cache_file)
     return genes
 
 
-def get_genes_detailed(entrez_ids, refresh=False):
+def _fetch_ncbi_gene_batch(batch, limiter):
     """
-    Fetch detailed gene information including genomic coordinates.
+    Fetch genomic positions for one batch of genes from NCBI E-utilities.
     
     Args:
-        entrez_ids: List of Entrez gene IDs
-        refresh: Force refresh from API
+        batch: List of Entrez Gene IDs (at most 200)
+        limiter: _RateLimiter shared by all batches of the request
         
     Returns:
-        List of detailed gene dicts with start/end positions
+        Dictionary mapping Entrez ID to gene dictionary
     """
-    import hashlib
+    params = {
+        'db': 'gene',
+        'id': ','.join(str(gid) for gid in batch),
+        'retmode': 'json'
+    }
+    if NCBI_API_KEY:
+        params['api_key'] = NCBI_API_KEY
+    
+    limiter.wait()
+    r = _session().get(NCBI_ESUMMARY_URL, params=params)
+    r.raise_for_status()
     
-    # Create cache key based on gene IDs
+    genes = {}
+    data = r.json()
+    if 'result' in data:
+        for gid_str, gene_data in data['result'].items():
+            if gid_str == 'uids':  # Skip metadata field
+                continue
+                
+            # Extract genomic coordinates
+            start = 0
+            end = 0
+            chromosome = gene_data.get('chromosome', '')
+            
+            if 'genomicinfo' in gene_data and gene_data['genomicinfo']:
+                gi = gene_data['genomicinfo'][0]
+                start = gi.get('chrstart', 0)
+                end = gi.get('chrstop', 0)
+            
+            genes[int(gid_str)] = {
+                'entrezGeneId': int(gid_str),
+                'hugoGeneSymbol': gene_data.get('name', ''),
+                'chromosome': chromosome,
+                'start': start,
+                'end': end,
+                'cytoband': gene_data.get('maplocation', '')  # Use map location as cytoband approximation
+            }
+    
+    return genes
+
+
 def get_genes_detailed(entrez_ids, refresh=False):
     """
     Get detailed gene information including genomic positions from NCBI E-utilities.
     cBioPortal API doesn't provide actual genomic coordinates (returns 0 for all genes),
     so we fetch from NCBI E-utilities which has real position data.
     
+    Batches are fetched concurrently within NCBI's rate limit (set NCBI_API_KEY
+    to raise it from 3 to 10 requests per second).
+    
     Args:
         entrez_ids: List of Entrez Gene IDs
         refresh: Whether to bypass cache
@@ -149,66 +296,21 @@ def get_genes_detailed(entrez_ids, refresh=False):
     Returns:
         List of gene dictionaries with genomic positions
     """
-    import hashlib
-    import time
-    
-    # Create cache key
-    gene_ids_str = ",".join(map(str, sorted(entrez_ids)))
-    gene_hash = hashlib.md5(gene_ids_str.encode()).hexdigest()[:8]
-    cache_file = f"genes_ncbi_detailed_{gene_hash}.pkl"
-    
-    if not refresh:
-        cached = load_from_cache(cache_file)
-        if cached is not None:
-            return cached
+    # Cache key based on the gene set
+    cache_file, cached = _load_gene_set_cache("genes_ncbi_detailed", entrez_ids, refresh=refresh)
+    if cached is not None:
+        return cached
     
     # Batch requests to NCBI (max 200 IDs per request to be safe)
     batch_size = 200
+    batches = [entrez_ids[i:i + batch_size] for i in range(0, len(entrez_ids), batch_size)]
     all_genes = {}
     
-    for i in range(0, len(entrez_ids), batch_size):
-        batch = entrez_ids[i:i + batch_size]
-        batch_str = ','.join(str(gid) for gid in batch)
-        
-        # NCBI E-utilities API
-        url = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi'
-        params = {
-            'db': 'gene',
-            'id': batch_str,
-            'retmode': 'json'
-        }
-        
-        r = requests.get(url, params=params)
-        r.raise_for_status()
-        
-        data = r.json()
-        if 'result' in data:
-            for gid_str, gene_data in data['result'].items():
-                if gid_str == 'uids':  # Skip metadata field
-                    continue
-                    
-                # Extract genomic coordinates
-                start = 0
-                end = 0
-                chromosome = gene_data.get('chromosome', '')
-                
-                if 'genomicinfo' in gene_data and gene_data['genomicinfo']:
-                    gi = gene_data['genomicinfo'][0]
-                    start = gi.get('chrstart', 0)
-                    end = gi.get('chrstop', 0)
-                
-                all_genes[int(gid_str)] = {
-                    'entrezGeneId': int(gid_str),
-                    'hugoGeneSymbol': gene_data.get('name', ''),
-                    'chromosome': chromosome,
-                    'start': start,
-                    'end': end,
-                    'cytoband': gene_data.get('maplocation', '')  # Use map location as cytoband approximation
-                }
-        
-        # NCBI recommends max 3 requests per second
-        if i + batch_size < len(entrez_ids):
-            time.sleep(0.34)
+    # Overlap batch latencies; the shared limiter keeps starts within the allowed rate
+    limiter = _RateLimiter(NCBI_REQUESTS_PER_SECOND)
+    with ThreadPoolExecutor(max_workers=NCBI_REQUESTS_PER_SECOND) as executor:
+        for batch_genes in executor.map(lambda batch: _fetch_ncbi_gene_batch(batch, limiter), batches):
+            all_genes.update(batch_genes)
     
     # Convert to list maintaining order of input
     result = [all_genes.get(gid, {
@@ -224,6 +326,29 @@ def get_genes_detailed(entrez_ids, refresh=False):
     return result
 
 
+def cna_records_to_frame(records):
+    """
+    Project DiscreteCopyNumberData records onto the columns the analysis uses.
+    
+    The frame is built column by column with compact dtypes (categorical sample
+    IDs, int32 gene IDs, int8 calls) instead of a wide object frame of every
+    response field.
+    
+    Args:
+        records: List of DiscreteCopyNumberData dicts
+        
+    Returns:
+        DataFrame with columns ['sampleId', 'entrezGeneId', 'alteration']
+    """
+    return pd.DataFrame({
+        "sampleId": pd.Categorical([rec["sampleId"] for rec in records]),
+        "entrezGeneId": np.fromiter((rec["entrezGeneId"] for rec in records),
+                                    dtype=np.int32, count=len(records)),
+        "alteration": np.fromiter((rec["alteration"] for rec in records),
+                                  dtype=np.int8, count=len(records)),
+    })
+
+
 def fetch_discrete_copy_number(molecular_profile_id, sample_list_id, entrez_ids, refresh=False):
     """
     Fetch discrete copy number alterations.
@@ -235,27 +360,27 @@ def fetch_discrete_copy_number(molecular_profile_id, sample_list_id, entrez_ids,
         refresh: Force refresh from API
         
     Returns:
-        List of discrete copy number data dicts
+        DataFrame with columns ['sampleId', 'entrezGeneId', 'alteration'] (one
+        row per sample/gene call); entries cached by older versions may carry
+        every response field or load as a list of dicts
     """
     # Create a cache key that includes a hash of the gene IDs to ensure uniqueness per gene set
-    import hashlib
-    gene_ids_str = ",".join(map(str, sorted(entrez_ids)))
-    gene_hash = hashlib.md5(gene_ids_str.encode()).hexdigest()[:8]
-    cache_file = f"cna_data_{molecular_profile_id}_{sample_list_id}_{gene_hash}.pkl"
-    
-    if not refresh:
-        cached = load_from_cache(cache_file)
-        if cached is not None:
-            return cached
+    cache_file, cached = _load_gene_set_cache(
+        f"cna_data_{molecular_profile_id}_{sample_list_id}", entrez_ids, refresh=refresh
+    )
+    if cached is not None:
+        return cached
     
     url = f"{BASE}/molecular-profiles/{molecular_profile_id}/discrete-copy-number/fetch"
     body = {
         "sampleListId": sample_list_id,
         "entrezGeneIds": list(map(int, entrez_ids))
     }
-    r = requests.post(url, json=body, headers=HEADERS)
+    r = _session().post(url, json=body)
     r.raise_for_status()
-    cna_data = r.json()
+    
+    # Tabular payload: cached as parquet, projected to the columns in use
+    cna_data = cna_records_to_frame(r.json())
     
     save_to_cache(cna_data, cache_file)
     return cna_data
\ No newline at end of file
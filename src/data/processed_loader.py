@@ -10,8 +10,13 @@ Supports both local file system and AWS S3 storage based on environment variable
 - S3_PREFIX: Prefix path in S3 bucket (default: 'processed/')
 """
 
+import json
 import os
+import time
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 
 # Configuration from environment variables
@@ -19,6 +24,12 @@ USE_S3 = os.environ.get('USE_S3', 'false').lower() == 'true'
 S3_BUCKET = os.environ.get('S3_BUCKET', 'tcga-codeletion-data')
 S3_PREFIX = os.environ.get('S3_PREFIX', 'processed/')
 
+# Local processed data root, resolved once at import
+PROCESSED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "processed")
+
+# Maximum age in seconds of a cached S3 listing (S3 has no directory mtime to key on)
+S3_LISTING_TTL_SECONDS = 60
+
 # Initialize S3 client only if needed
 _s3_client = None
 
@@ -46,20 +57,44 @@ def _get_s3_client():
     return _s3_client
 
 
+# S3 objects are read in ranged GETs of this size: small processed files take one
+# request, larger ones are split into a few large ranges fetched concurrently
+S3_RANGE_CHUNK_SIZE = 4 * 1024 * 1024
+S3_RANGE_WORKERS = 8
+
+
+def _get_s3_range(s3_key, start, end):
+    """Fetch bytes [start, end] (inclusive) of an S3 object; returns (body, object size)."""
+    obj = _get_s3_client().get_object(Bucket=S3_BUCKET, Key=s3_key, Range=f"bytes={start}-{end}")
+    return obj['Body'].read(), int(obj['ContentRange'].rsplit('/', 1)[1])
+
+
 def load_from_s3(s3_key):
     """
     Load file from S3 bucket.
     
+    The first S3_RANGE_CHUNK_SIZE bytes are requested directly (which is the
+    whole file for most processed tables); the rest of a larger object is
+    fetched as concurrent ranges of the same size.
+    
     Args:
         s3_key: S3 object key (path within bucket)
         
     Returns:
         BytesIO object containing file data
     """
-    s3 = _get_s3_client()
     try:
-        obj = s3.get_object(Bucket=S3_BUCKET, Key=s3_key)
-        return BytesIO(obj['Body'].read())
+        head, size = _get_s3_range(s3_key, 0, S3_RANGE_CHUNK_SIZE - 1)
+        if size <= len(head):
+            return BytesIO(head)
+        
+        starts = range(len(head), size, S3_RANGE_CHUNK_SIZE)
+        with ThreadPoolExecutor(max_workers=S3_RANGE_WORKERS) as executor:
+            parts = executor.map(
+                lambda start: _get_s3_range(s3_key, start, min(start + S3_RANGE_CHUNK_SIZE, size) - 1)[0],
+                starts
+            )
+            return BytesIO(head + b''.join(parts))
     except Exception as e:
         raise FileNotFoundError(f"Failed to load from S3: s3://{S3_BUCKET}/{s3_key} - {str(e)}")
 
@@ -82,63 +117,146 @@ def get_processed_dir(study_id=None):
         return S3_PREFIX
     else:
         # Return local file path
-        module_dir = os.path.dirname(__file__)
-        processed_dir = os.path.join(module_dir, "processed")
-        
         if study_id is not None:
-            return os.path.join(processed_dir, study_id)
+            return os.path.join(PROCESSED_DIR, study_id)
         
-        return processed_dir
+        return PROCESSED_DIR
+
+
+def _read_parquet(source, columns=None):
+    """
+    Read a parquet file (path or buffer) with pyarrow, optionally selecting columns.
+    
+    Local files are memory-mapped, so pyarrow decodes straight from the OS page
+    cache (shared across worker processes) instead of reading into a private buffer.
+    """
+    return pd.read_parquet(source, engine='pyarrow', columns=columns,
+                           memory_map=isinstance(source, (str, os.PathLike)))
+
+
+# Table formats in lookup order: parquet written by batch_process.py, then the
+# CSV/gzip CSV/Excel exports of older (or --xlsx) runs
+TABLE_EXTENSIONS = ('.parquet', '.csv', '.csv.gz', '.xlsx')
+
+# --xlsx runs write one chr{N}_analysis.xlsx workbook per analysis (pair frequencies
+# and counts go to .csv.gz files); sheet name of each table (Excel limits sheet
+# names to 31 characters)
+ANALYSIS_WORKBOOK_SUFFIX = '_analysis'
+ANALYSIS_WORKBOOK_SHEETS = {
+    'genes_metadata': 'genes_metadata',
+    'codeletion_conditional_frequencies': 'conditional_frequencies',
+    'codeletion_matrix': 'codeletion_matrix',
+    'deletion_frequencies': 'deletion_frequencies'
+}
+
+
+def _find_source(processed_dir, filename):
+    """Return a readable source for a processed file (local path or S3 buffer), or None if missing."""
+    if USE_S3:
+        try:
+            return load_from_s3(processed_dir + filename)
+        except FileNotFoundError:
+            return None
+    filepath = os.path.join(processed_dir, filename)
+    return filepath if os.path.exists(filepath) else None
+
+
+def _load_table(study_id, stem, index_col=None, columns=None):
+    """
+    Load a processed table, trying parquet, then CSV, then Excel (first found).
+    
+    Tables of --xlsx runs are read from their sheet of the chr{N}_analysis.xlsx
+    workbook when no standalone file exists.
+    
+    Args:
+        study_id: Full study identifier (None for the top-level processed directory)
+        stem: Filename without extension (e.g. "chr13_genes_metadata")
+        index_col: Column to use as the index for CSV/Excel (parquet restores its stored index)
+        columns: Optional list of columns to load (parquet only)
+        
+    Returns:
+        DataFrame with the table contents
+    """
+    processed_dir = get_processed_dir(study_id)
+    readers = {
+        '.parquet': lambda source: _read_parquet(source, columns=columns),
+        '.csv': lambda source: pd.read_csv(source, index_col=index_col),
+        '.csv.gz': lambda source: pd.read_csv(source, index_col=index_col, compression='gzip'),
+        '.xlsx': lambda source: pd.read_excel(source, index_col=index_col)
+    }
+    
+    for ext in TABLE_EXTENSIONS:
+        source = _find_source(processed_dir, stem + ext)
+        if source is not None:
+            return readers[ext](source)
+    
+    # "chr13_codeletion_matrix" -> sheet "codeletion_matrix" of chr13_analysis.xlsx
+    prefix, _, table = stem.partition('_')
+    sheet = ANALYSIS_WORKBOOK_SHEETS.get(table)
+    if sheet is not None:
+        source = _find_source(processed_dir, f"{prefix}{ANALYSIS_WORKBOOK_SUFFIX}.xlsx")
+        if source is not None:
+            return pd.read_excel(source, sheet_name=sheet, index_col=index_col)
+    
+    raise FileNotFoundError(
+        f"{stem} not found in {processed_dir} (tried {', '.join(TABLE_EXTENSIONS)}). "
+        "Run batch_process.py to generate processed data for all studies."
+    )
 
 
-def load_conditional_matrix(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
+def load_conditional_matrix(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018", columns=None,
+                            dtype=np.float32):
     """
     Load conditional co-deletion probability matrix.
     
+    Reads the precomputed parquet matrix when available (only the requested
+    columns are decoded), falling back to the CSV/Excel exports.
+    
     Args:
         chromosome: Chromosome number (default: "13")
         study_id: Full study identifier (default: "prad_tcga_pan_can_atlas_2018")
+        columns: Optional list of gene columns to load (parquet only)
+        dtype: Value dtype of the returned matrix (default: float32; None keeps the stored dtype)
         
     Returns:
         DataFrame with conditional probabilities P(i|j)
     """
-    processed_dir = get_processed_dir(study_id)
-    csv_filename = f"chr{chromosome}_codeletion_conditional_frequencies.csv"
-    xlsx_filename = f"chr{chromosome}_codeletion_conditional_frequencies.xlsx"
+    matrix = _load_conditional_matrix(chromosome, study_id, columns)
+    if dtype is not None:
+        matrix = matrix.astype(dtype, copy=False)
+    return matrix
+
+
+def _load_conditional_matrix(chromosome, study_id, columns):
+    """Read the conditional matrix from parquet, CSV or Excel (first found)."""
+    return _load_table(study_id, f"chr{chromosome}_codeletion_conditional_frequencies",
+                       index_col=0, columns=columns)
+
+
+# Columns of a symmetric matrix stored as its lower triangle by batch_process.py
+TRIANGLE_COLUMNS = ['gene_i', 'gene_j', 'value']
+
+
+def _load_symmetric(study_id, stem):
+    """
+    Load a symmetric gene x gene matrix, mirroring a stored lower triangle.
     
-    if USE_S3:
-        # Try CSV first, then Excel from S3
-        csv_key = processed_dir + csv_filename
-        xlsx_key = processed_dir + xlsx_filename
-        
-        s3 = _get_s3_client()
-        try:
-            # Check if CSV exists in S3
-            s3.head_object(Bucket=S3_BUCKET, Key=csv_key)
-            data = load_from_s3(csv_key)
-            return pd.read_csv(data, index_col=0)
-        except:
-            try:
-                # Fall back to Excel
-                data = load_from_s3(xlsx_key)
-                return pd.read_excel(data, index_col=0)
-            except:
-                raise FileNotFoundError(
-                    f"Conditional matrix not found in S3: {csv_key} or {xlsx_key}"
-                )
-    else:
-        # Load from local filesystem
-        csv_filepath = os.path.join(processed_dir, csv_filename)
-        xlsx_filepath = os.path.join(processed_dir, xlsx_filename)
-        
-        if os.path.exists(csv_filepath):
-            return pd.read_csv(csv_filepath, index_col=0)
-        elif os.path.exists(xlsx_filepath):
-            return pd.read_excel(xlsx_filepath, index_col=0)
-        else:
-            raise FileNotFoundError(
-                f"Conditional matrix not found: {xlsx_filepath} or {csv_filepath}"
-            )
+    Full matrices (CSV/Excel exports or older parquet runs) are returned as is.
+    """
+    table = _load_table(study_id, stem, index_col=0)
+    if list(table.columns) != TRIANGLE_COLUMNS:
+        return table
+    
+    genes = table['gene_i'].cat.categories
+    i = table['gene_i'].cat.codes.to_numpy()
+    j = table['gene_j'].cat.codes.to_numpy()
+    values = table['value'].to_numpy()
+    
+    matrix = np.zeros((len(genes), len(genes)), dtype=values.dtype)
+    matrix[i, j] = values
+    matrix[j, i] = values
+    
+    return pd.DataFrame(matrix, index=genes, columns=genes)
 
 
 def load_frequency_matrix(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
@@ -152,18 +270,21 @@ def load_frequency_matrix(chromosome="13", study_id="prad_tcga_pan_can_atlas_201
     Returns:
         DataFrame with co-deletion frequencies
     """
-    processed_dir = get_processed_dir(study_id)
-    filename = f"chr{chromosome}_codeletion_matrix.xlsx"
+    return _load_symmetric(study_id, f"chr{chromosome}_codeletion_matrix")
+
+
+def load_codeletion_counts(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
+    """
+    Load raw co-deletion count matrix (symmetric).
     
-    if USE_S3:
-        s3_key = processed_dir + filename
-        data = load_from_s3(s3_key)
-        return pd.read_excel(data, index_col=0)
-    else:
-        filepath = os.path.join(processed_dir, filename)
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Frequency matrix not found: {filepath}")
-        return pd.read_excel(filepath, index_col=0)
+    Args:
+        chromosome: Chromosome number (default: "13")
+        study_id: Full study identifier (default: "prad_tcga_pan_can_atlas_2018")
+        
+    Returns:
+        DataFrame with co-deletion counts
+    """
+    return _load_symmetric(study_id, f"chr{chromosome}_codeletion_counts")
 
 
 def load_codeletion_pairs(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
@@ -177,62 +298,68 @@ def load_codeletion_pairs(chromosome="13", study_id="prad_tcga_pan_can_atlas_201
     Returns:
         DataFrame with columns: gene_i, gene_j, co_deletion_frequency
     """
-    processed_dir = get_processed_dir(study_id)
-    filename = f"chr{chromosome}_codeletion_frequencies.xlsx"
-    
-    if USE_S3:
-        s3_key = processed_dir + filename
-        data = load_from_s3(s3_key)
-        return pd.read_excel(data)
-    else:
-        filepath = os.path.join(processed_dir, filename)
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Co-deletion pairs not found: {filepath}")
-        return pd.read_excel(filepath)
+    return _load_table(study_id, f"chr{chromosome}_codeletion_frequencies")
 
 
-def load_deletion_matrix(chromosome="13", study="prad"):
+def load_deletion_matrix(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
     """
     Load binary deletion matrix (samples x genes).
     
+    Written as parquet by batch_process.py (parquet runs only), which keeps
+    the int8 dtype, so the matrix loads at 1 byte per cell.
+    
     Args:
         chromosome: Chromosome number (default: "13")
-        study: Study identifier (default: "prad")
+        study_id: Full study identifier (default: "prad_tcga_pan_can_atlas_2018")
         
     Returns:
         DataFrame with samples as rows, genes as columns, 0/1 values
     """
-    processed_dir = get_processed_dir()
-    # This file is not currently saved by main.py, but could be added
-    filename = f"chr{chromosome}_deletion_matrix.xlsx"
-    filepath = os.path.join(processed_dir, filename)
-    
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(
-            f"Deletion matrix not found: {filepath}. "
-            "Run main.py to generate processed data."
-        )
+    return _load_table(study_id, f"chr{chromosome}_deletion_matrix", index_col=0)
+
+
+def _load_stats_sidecar(study_id, chromosome):
+    """Read the chr{N}_stats.json written by batch_process.py, or None if missing."""
+    processed_dir = get_processed_dir(study_id)
+    filename = f"chr{chromosome}_stats.json"
     
-    df = pd.read_excel(filepath, index_col=0)
-    return df
+    try:
+        if USE_S3:
+            return json.load(load_from_s3(processed_dir + filename))
+        with open(os.path.join(processed_dir, filename)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
 
 
-def get_dataset_stats(conditional_matrix):
+def get_dataset_stats(conditional_matrix=None, study_id=None, chromosome=None):
     """
-    Extract dataset statistics from conditional matrix.
+    Get dataset statistics for a study/chromosome.
+    
+    Reads the small stats sidecar written at ingestion time when study_id and
+    chromosome are given, so no deletion matrix has to be loaded. Falls back to
+    inspecting the conditional matrix (sample and deletion counts unknown).
     
     Args:
-        conditional_matrix: DataFrame with conditional probabilities
+        conditional_matrix: Optional DataFrame with conditional probabilities
+        study_id: Optional full study identifier
+        chromosome: Optional chromosome number
         
     Returns:
-        Dictionary with keys: n_genes, n_samples, n_deletions
+        Dictionary with keys: n_genes, n_samples, n_deletions (number of deleted
+        sample-gene cells in the deletion matrix)
     """
-    n_genes = conditional_matrix.shape[0]
+    if study_id is not None and chromosome is not None:
+        sidecar = _load_stats_sidecar(study_id, chromosome)
+        if sidecar is not None:
+            return {key: sidecar.get(key) for key in ('n_genes', 'n_samples', 'n_deletions')}
     
-    # Calculate approximate statistics
-    # Note: For exact stats, we'd need the original deletion matrix
+    if conditional_matrix is None:
+        conditional_matrix = load_conditional_matrix(chromosome=chromosome, study_id=study_id, columns=[])
+    
+    # Note: For exact sample/deletion counts, we'd need the original deletion matrix
     stats = {
-        'n_genes': n_genes,
+        'n_genes': conditional_matrix.shape[0],
         'n_samples': None,  # Would need deletion matrix
         'n_deletions': None  # Would need deletion matrix
     }
@@ -250,15 +377,17 @@ def get_cytobands_from_genes(conditional_matrix):
     Returns:
         List of gene symbols (cytobands would need to be loaded separately)
     """
-    # Gene columns are formatted as "SYMBOL (ENTREZ)"
-    gene_symbols = [col.split(' ')[0] for col in conditional_matrix.columns]
-    return gene_symbols
+    # Gene columns are formatted as "SYMBOL (ENTREZ)"; split once with pandas string ops
+    return conditional_matrix.columns.str.split(' ', n=1).str[0].tolist()
 
 
 def load_gene_metadata(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
     """
     Load gene metadata including cytobands.
     
+    Uses the study's own export when present, otherwise the chromosome metadata
+    shared by all studies in the top-level processed directory.
+    
     Args:
         chromosome: Chromosome number (default: "13")
         study_id: Full study identifier (default: "prad_tcga_pan_can_atlas_2018")
@@ -266,21 +395,11 @@ def load_gene_metadata(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018")
     Returns:
         DataFrame with columns: entrezGeneId, hugoGeneSymbol, cytoband
     """
-    processed_dir = get_processed_dir(study_id)
-    filename = f"chr{chromosome}_genes_metadata.xlsx"
-    
-    if USE_S3:
-        s3_key = processed_dir + filename
-        data = load_from_s3(s3_key)
-        return pd.read_excel(data)
-    else:
-        filepath = os.path.join(processed_dir, filename)
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(
-                f"Gene metadata not found: {filepath}. "
-                "Run batch_process.py to generate processed data for all studies."
-            )
-        return pd.read_excel(filepath)
+    stem = f"chr{chromosome}_genes_metadata"
+    try:
+        return _load_table(study_id, stem)
+    except FileNotFoundError:
+        return _load_table(None, stem)
 
 
 def load_deletion_frequencies(chromosome="13", study_id="prad_tcga_pan_can_atlas_2018"):
@@ -295,24 +414,15 @@ def load_deletion_frequencies(chromosome="13", study_id="prad_tcga_pan_can_atlas
         study_id: Full study identifier (default: "prad_tcga_pan_can_atlas_2018")
         
     Returns:
-        Series with deletion frequency for each gene
+        Float Series named 'deletion_frequency' with the deletion frequency of
+        each gene, indexed by gene label ("SYMBOL (ENTREZ)")
     """
-    processed_dir = get_processed_dir(study_id)
-    filename = f"chr{chromosome}_deletion_frequencies.xlsx"
-    
     try:
-        if USE_S3:
-            s3_key = processed_dir + filename
-            data = load_from_s3(s3_key)
-            df = pd.read_excel(data, index_col=0)
-        else:
-            filepath = os.path.join(processed_dir, filename)
-            if not os.path.exists(filepath):
-                raise FileNotFoundError(f"Deletion frequencies not found: {filepath}")
-            df = pd.read_excel(filepath, index_col=0)
+        df = _load_table(study_id, f"chr{chromosome}_deletion_frequencies", index_col=0)
         
-        # Return as Series
-        return df.iloc[:, 0] if df.shape[1] == 1 else df.squeeze()
+        # Same shape as the fallback below: a float Series named
+        # 'deletion_frequency' indexed by gene label, whatever the file format
+        return df.iloc[:, 0].astype(float).rename('deletion_frequency')
         
     except (FileNotFoundError, Exception):
         # Fallback: Calculate from cBioPortal API
@@ -335,11 +445,13 @@ def load_deletion_frequencies(chromosome="13", study_id="prad_tcga_pan_can_atlas
             # Build deletion matrix
             deletion_mat = queries.build_deletion_matrix(cna_data, chr_genes, deletion_cutoff=-1)
             
-            # Calculate deletion frequencies (mean across samples)
-            deletion_freqs = deletion_mat.mean(axis=0).sort_values(ascending=False)
-            deletion_freqs.name = 'deletion_frequency'
+            # Calculate deletion frequencies (int32 column sums of the int8 matrix,
+            # scaled once by 1/n), most frequently deleted first
+            sums = deletion_mat.to_numpy().sum(axis=0, dtype=np.int32)
+            deletion_freqs = pd.Series(sums * (1.0 / deletion_mat.shape[0]),
+                                       index=deletion_mat.columns, name='deletion_frequency')
             
-            return deletion_freqs
+            return deletion_freqs.sort_values(ascending=False, kind='stable')
             
         except Exception as e:
             raise FileNotFoundError(
@@ -347,6 +459,25 @@ def load_deletion_frequencies(chromosome="13", study_id="prad_tcga_pan_can_atlas
             )
 
 
+# Local directory listings are cached on (path, st_mtime_ns): adding or removing
+# an entry bumps the directory's mtime, so a changed directory misses the cache
+
+
+def _dir_mtime_ns(path):
+    """Return a directory's modification time in ns, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _scan_studies(processed_dir, mtime_ns):
+    """List study subdirectories (mtime_ns only keys the cache)."""
+    with os.scandir(processed_dir) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.is_dir()))
+
+
 def list_available_studies():
     """
     List all available processed studies.
@@ -383,15 +514,109 @@ def list_available_studies():
             print(f"Warning: Failed to list studies from S3: {e}")
             return []
     else:
-        # List from local filesystem
-        if not os.path.exists(processed_dir):
+        # List from local filesystem (each subdirectory represents a study)
+        mtime_ns = _dir_mtime_ns(processed_dir)
+        if mtime_ns is None:
             return []
         
-        # Get all subdirectories (each represents a study)
-        studies = [d for d in os.listdir(processed_dir) 
-                   if os.path.isdir(os.path.join(processed_dir, d))]
+        return list(_scan_studies(processed_dir, mtime_ns))
+
+
+_DELETION_FREQUENCIES_STEM_SUFFIX = '_deletion_frequencies'
+
+
+def _chromosomes_from_filenames(filenames):
+    """
+    Extract chromosome identifiers from chr{N}_deletion_frequencies.{parquet,csv,xlsx}
+    and chr{N}_analysis.xlsx filenames.
+    """
+    chromosomes = set()
+    for name in filenames:
+        stem, ext = os.path.splitext(name)
+        if not stem.startswith('chr'):
+            continue
+        if ext in TABLE_EXTENSIONS and stem.endswith(_DELETION_FREQUENCIES_STEM_SUFFIX):
+            chromosomes.add(stem[3:-len(_DELETION_FREQUENCIES_STEM_SUFFIX)])
+        elif ext == '.xlsx' and stem.endswith(ANALYSIS_WORKBOOK_SUFFIX):
+            chromosomes.add(stem[3:-len(ANALYSIS_WORKBOOK_SUFFIX)])
+    return frozenset(chromosomes)
+
+
+@lru_cache(maxsize=64)
+def _list_s3_chromosomes(prefix, ttl_bucket):
+    """List chromosomes with deletion frequencies under an S3 prefix (ttl_bucket only keys the cache)."""
+    paginator = _get_s3_client().get_paginator('list_objects_v2')
+    return _chromosomes_from_filenames(
+        obj['Key'][len(prefix):]
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix)
+        for obj in page.get('Contents', [])
+    )
+
+
+@lru_cache(maxsize=64)
+def _scan_chromosomes(study_dir, mtime_ns):
+    """List chromosomes with deletion frequencies in a study directory (mtime_ns only keys the cache)."""
+    with os.scandir(study_dir) as entries:
+        return _chromosomes_from_filenames(entry.name for entry in entries)
+
+
+def list_available_chromosomes(study_id):
+    """
+    List chromosomes with processed deletion frequencies for a study.
+    
+    One directory listing replaces probing (and failing on) every chromosome file.
+    Local listings are cached on the directory mtime and S3 listings for up to
+    S3_LISTING_TTL_SECONDS, so repeated calls do no storage I/O.
+    
+    Args:
+        study_id: Full study identifier
         
-        return sorted(studies)
+    Returns:
+        Frozenset of chromosome identifiers (e.g. {'1', '13', 'X'})
+    """
+    processed_dir = get_processed_dir(study_id)
+    
+    if USE_S3:
+        # Failed listings raise out of the cache, so they are retried on the next call
+        try:
+            return _list_s3_chromosomes(processed_dir, int(time.monotonic() // S3_LISTING_TTL_SECONDS))
+        except Exception as e:
+            print(f"Warning: Failed to list chromosomes for {study_id} from S3: {e}")
+            return frozenset()
+    else:
+        mtime_ns = _dir_mtime_ns(processed_dir)
+        if mtime_ns is None:
+            return frozenset()
+        
+        return _scan_chromosomes(processed_dir, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _scan_analyses(processed_dir, mtime_ns):
+    """Classify processed files by analysis type (mtime_ns only keys the cache)."""
+    analyses = {
+        'conditional_matrices': [],
+        'frequency_matrices': [],
+        'pair_frequencies': [],
+        'other': []
+    }
+    
+    # Classify each entry once; every table or HTML file is also listed under 'other'
+    with os.scandir(processed_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(TABLE_EXTENSIONS):
+                if 'conditional' in name:
+                    analyses['conditional_matrices'].append(name)
+                if 'codeletion_matrix' in name:
+                    analyses['frequency_matrices'].append(name)
+                if 'codeletion_frequencies' in name:
+                    analyses['pair_frequencies'].append(name)
+                analyses['other'].append(name)
+            elif name.endswith('.html'):
+                analyses['other'].append(name)
+    
+    return {analysis: tuple(files) for analysis, files in analyses.items()}
 
 
 def list_available_analyses():
@@ -403,16 +628,9 @@ def list_available_analyses():
     """
     processed_dir = get_processed_dir()
     
-    if not os.path.exists(processed_dir):
+    mtime_ns = _dir_mtime_ns(processed_dir)
+    if mtime_ns is None:
         return {}
     
-    files = os.listdir(processed_dir)
-    
-    analyses = {
-        'conditional_matrices': [f for f in files if 'conditional' in f and f.endswith('.xlsx')],
-        'frequency_matrices': [f for f in files if 'codeletion_matrix' in f and f.endswith('.xlsx')],
-        'pair_frequencies': [f for f in files if 'codeletion_frequencies' in f and f.endswith('.xlsx')],
-        'other': [f for f in files if f.endswith(('.xlsx', '.html'))]
-    }
-    
-    return analyses
+    # Fresh lists so callers can't modify the cached listing
+    return {analysis: list(files) for analysis, files in _scan_analyses(processed_dir, mtime_ns).items()}
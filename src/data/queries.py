@@ -5,9 +5,16 @@ This module provides domain-specific queries that combine and filter
 raw API data to produce meaningful datasets for analysis.
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from . import cbioportal_client as client
 
+# Largest Entrez ID mapped through a dense lookup table in build_deletion_matrix
+# (int32 table of at most 64 MiB); gene sets with larger IDs use a hash lookup
+ENTREZ_LUT_MAX_ID = 1 << 24
+
 
 def get_study_id(study_id=None):
     """
@@ -25,10 +32,40 @@ def get_study_id(study_id=None):
     return study_id
 
 
+def _find_cna_profile_id(study_id, refresh=False):
+    """Pick the CNA molecular profile ID for a study (see get_cna_profile_id)."""
+    profiles = client.get_molecular_profiles(study_id, refresh=refresh)
+    
+    cna_profiles = [
+        p for p in profiles
+        if p.get("molecularAlterationType") == "COPY_NUMBER_ALTERATION"
+    ]
+    
+    if not cna_profiles:
+        raise ValueError("No CNA profiles found.")
+    
+    # Heuristic: prefer GISTIC / discrete profile, else the first CNA profile
+    return next(
+        (p["molecularProfileId"] for p in cna_profiles
+         if any(word in f"{p.get('name') or ''} {p.get('description') or ''}".lower()
+                for word in ("gistic", "discrete"))),
+        cna_profiles[0]["molecularProfileId"]
+    )
+
+
+@lru_cache(maxsize=256)
+def _cached_cna_profile_id(study_id):
+    """CNA molecular profile ID for a study, cached per process."""
+    return _find_cna_profile_id(study_id)
+
+
 def get_cna_profile_id(study_id, refresh=False):
     """
     Get the CNA molecular profile ID for a study, preferring GISTIC/discrete profiles.
     
+    Results are cached per process on study_id, so repeat calls skip the
+    profile scan; refresh=True refetches from the API and drops the cache.
+    
     Args:
         study_id: Study identifier
         refresh: Force refresh from API
@@ -36,30 +73,48 @@ def get_cna_profile_id(study_id, refresh=False):
     Returns:
         Molecular profile ID string
     """
-    profiles = client.get_molecular_profiles(study_id, refresh=refresh)
+    if refresh:
+        _cached_cna_profile_id.cache_clear()
+        return _find_cna_profile_id(study_id, refresh=True)
     
-    cna_profiles = [
-        p for p in profiles
-        if p.get("molecularAlterationType") == "COPY_NUMBER_ALTERATION"
-    ]
+    return _cached_cna_profile_id(study_id)
+
+
+def _find_cna_sample_list_id(study_id, refresh=False):
+    """Pick the CNA sample list ID for a study (see get_cna_sample_list_id)."""
+    lists_ = client.get_sample_lists(study_id, refresh=refresh)
     
-    if not cna_profiles:
-        raise ValueError("No CNA profiles found.")
+    # One pass, keeping the first list of each kind, in order of preference:
+    # all_cases_with_cna, then any list mentioning cna, then all cases
+    found = {}
+    for sl in lists_:
+        category = sl.get("category")
+        if category == "all_cases_with_cna":
+            return sl["sampleListId"]
+        if "cna" in (sl.get("sampleListId", "") + sl.get("name", "")).lower():
+            found.setdefault("cna", sl["sampleListId"])
+        if category == "all_cases_in_study":
+            found.setdefault("all", sl["sampleListId"])
     
-    # Heuristic: prefer GISTIC / discrete profile
-    for p in cna_profiles:
-        name = (p.get("name") or "").lower() + " " + (p.get("description") or "").lower()
-        if "gistic" in name or "discrete" in name:
-            return p["molecularProfileId"]
+    if found:
+        return found.get("cna", found.get("all"))
     
-    # Fallback to first CNA profile
-    return cna_profiles[0]["molecularProfileId"]
+    raise ValueError("No suitable sample list for CNA found.")
+
+
+@lru_cache(maxsize=256)
+def _cached_cna_sample_list_id(study_id):
+    """CNA sample list ID for a study, cached per process."""
+    return _find_cna_sample_list_id(study_id)
 
 
 def get_cna_sample_list_id(study_id, refresh=False):
     """
     Get the CNA sample list ID for a study.
     
+    Results are cached per process on study_id; refresh=True refetches from
+    the API and drops the cache.
+    
     Args:
         study_id: Study identifier
         refresh: Force refresh from API
@@ -67,50 +122,75 @@ def get_cna_sample_list_id(study_id, refresh=False):
     Returns:
         Sample list ID string
     """
-    lists_ = client.get_sample_lists(study_id, refresh=refresh)
-    
-    # Prefer all_cases_with_cna if present
-    for sl in lists_:
-        if sl.get("category") == "all_cases_with_cna":
-            return sl["sampleListId"]
-    
-    # Fallback: any sample list mentioning cna
-    for sl in lists_:
-        if "cna" in (sl.get("sampleListId", "") + sl.get("name", "")).lower():
-            return sl["sampleListId"]
+    if refresh:
+        _cached_cna_sample_list_id.cache_clear()
+        return _find_cna_sample_list_id(study_id, refresh=True)
     
-    # Absolute fallback: all cases
-    for sl in lists_:
-        if sl.get("category") == "all_cases_in_study":
-            return sl["sampleListId"]
-    
-    raise ValueError("No suitable sample list for CNA found.")
+    return _cached_cna_sample_list_id(study_id)
 
 
-def get_chromosome_genes(chromosome, genome="hg19", refresh=False):
+def get_study_metadata(study_id, chromosome, genome="hg19", refresh=False, chr_genes=None):
     """
-    Get all genes on a specific chromosome with genomic positions.
+    Fetch a study's CNA profile ID, CNA sample list ID and chromosome genes.
+    
+    The three lookups are independent, so they run concurrently and their
+    request latencies overlap instead of adding up.
     
     Args:
+        study_id: Study identifier
         chromosome: Chromosome number or name (e.g., "13", "X")
         genome: Reference genome (default: hg19)
         refresh: Force refresh from API
+        chr_genes: Optional chromosome genes already fetched (shared across studies)
         
     Returns:
-        DataFrame with entrezGeneId, hugoGeneSymbol, chromosome, cytoband, start, end columns
+        Tuple of (cna_profile_id, sample_list_id, chr_genes DataFrame)
     """
-    genes = client.get_genes_by_genome(genome, refresh=refresh)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        profile = executor.submit(get_cna_profile_id, study_id, refresh=refresh)
+        sample_list = executor.submit(get_cna_sample_list_id, study_id, refresh=refresh)
+        if chr_genes is None:
+            chr_genes = executor.submit(get_chromosome_genes, chromosome, genome=genome, refresh=refresh).result()
+        return profile.result(), sample_list.result(), chr_genes
+
+
+def _group_genes_by_chromosome(genes):
+    """
+    Split a genome's gene list into per-chromosome DataFrames in one pass.
     
-    # Filter by chromosome
-    chr_genes = [g for g in genes if g.get("chromosome") == str(chromosome)]
+    Args:
+        genes: DataFrame of genes from client.get_genes_by_genome
+        
+    Returns:
+        Dictionary mapping chromosome name to a DataFrame with entrezGeneId,
+        hugoGeneSymbol and cytoband columns (deduplicated per chromosome)
+    """
+    df = genes[["entrezGeneId", "hugoGeneSymbol", "cytoband", "chromosome"]]
+    return {
+        str(chromosome): group.drop(columns="chromosome").drop_duplicates("entrezGeneId")
+        for chromosome, group in df.groupby("chromosome", sort=False)
+    }
+
+
+@lru_cache(maxsize=4)
+def _genes_by_chromosome(genome):
+    """Per-chromosome gene DataFrames for a genome, grouped once per process."""
+    return _group_genes_by_chromosome(client.get_genes_by_genome(genome))
+
+
+def _build_chromosome_genes(chromosome, genome, refresh=False):
+    """Build the positioned gene DataFrame for a chromosome (see get_chromosome_genes)."""
+    if refresh:
+        by_chromosome = _group_genes_by_chromosome(client.get_genes_by_genome(genome, refresh=True))
+    else:
+        by_chromosome = _genes_by_chromosome(genome)
     
-    # Build DataFrame with basic info from cBioPortal
-    df = pd.DataFrame(chr_genes)[["entrezGeneId", "hugoGeneSymbol", "cytoband"]]
-    df = df.drop_duplicates("entrezGeneId")
-    df['chromosome'] = str(chromosome)  # Add chromosome column
+    # Basic info from cBioPortal (the grouped frame is shared; read it, don't copy it)
+    empty = pd.DataFrame(columns=["entrezGeneId", "hugoGeneSymbol", "cytoband"])
+    genes = by_chromosome.get(chromosome, empty)
     
     # Fetch detailed gene information from NCBI to get actual genomic coordinates
-    entrez_ids = df['entrezGeneId'].tolist()
+    entrez_ids = genes['entrezGeneId'].tolist()
     detailed_genes = client.get_genes_detailed(entrez_ids, refresh=refresh)
     
     # Create lookup for start/end positions
@@ -119,17 +199,51 @@ def get_chromosome_genes(chromosome, genome="hg19", refresh=False):
         for g in detailed_genes
     }
     
-    # Add start/end columns
-    df['start'] = df['entrezGeneId'].map(lambda x: position_lookup.get(x, {}).get('start', 0))
-    df['end'] = df['entrezGeneId'].map(lambda x: position_lookup.get(x, {}).get('end', 0))
+    # Assemble the output columns in one frame, then sort by chromosomal start
+    # position in place; ignore_index renumbers rows in the same pass
+    df = pd.DataFrame({
+        'entrezGeneId': genes['entrezGeneId'],
+        'hugoGeneSymbol': genes['hugoGeneSymbol'],
+        'chromosome': chromosome,
+        'cytoband': genes['cytoband'],
+        'start': genes['entrezGeneId'].map(lambda x: position_lookup.get(x, {}).get('start', 0)),
+        'end': genes['entrezGeneId'].map(lambda x: position_lookup.get(x, {}).get('end', 0))
+    })
+    df.sort_values("start", inplace=True, ignore_index=True)
     
-    # Sort by chromosomal position using start position
-    df = df.sort_values("start").reset_index(drop=True)
-    
-    return df[['entrezGeneId', 'hugoGeneSymbol', 'chromosome', 'cytoband', 'start', 'end']]
     return df
 
 
+@lru_cache(maxsize=64)
+def _cached_chromosome_genes(chromosome, genome):
+    """Positioned gene DataFrame for a chromosome, cached per process."""
+    return _build_chromosome_genes(chromosome, genome)
+
+
+def get_chromosome_genes(chromosome, genome="hg19", refresh=False):
+    """
+    Get all genes on a specific chromosome with genomic positions.
+    
+    Results are cached per process on (chromosome, genome); callers share the
+    cached DataFrame and must not modify it in place. refresh=True refetches
+    from the API and drops the cached results.
+    
+    Args:
+        chromosome: Chromosome number or name (e.g., "13", "X")
+        genome: Reference genome (default: hg19)
+        refresh: Force refresh from API
+        
+    Returns:
+        DataFrame with entrezGeneId, hugoGeneSymbol, chromosome, cytoband, start, end columns
+    """
+    if refresh:
+        _genes_by_chromosome.cache_clear()
+        _cached_chromosome_genes.cache_clear()
+        return _build_chromosome_genes(str(chromosome), genome, refresh=True)
+    
+    return _cached_chromosome_genes(str(chromosome), genome)
+
+
 def get_chr13_genes(refresh=False):
     """
     Get all genes on chromosome 13 (project-specific convenience function).
@@ -154,7 +268,7 @@ def fetch_cna_for_genes(molecular_profile_id, sample_list_id, gene_df, refresh=F
         refresh: Force refresh from API
         
     Returns:
-        List of CNA data dicts
+        DataFrame (or list of dicts) of CNA data
     """
     entrez_ids = gene_df["entrezGeneId"].tolist()
     return client.fetch_discrete_copy_number(
@@ -169,8 +283,12 @@ def build_deletion_matrix(cna_data, gene_map, deletion_cutoff=-1):
     """
     Build a binary deletion matrix from CNA data.
     
+    Deletion calls are scattered straight into a preallocated int8 array
+    (samples in sorted order, genes in gene_map order) instead of pivoting.
+    
     Args:
-        cna_data: List of DiscreteCopyNumberData dicts
+        cna_data: DataFrame (sampleId may be categorical) or list of
+            DiscreteCopyNumberData dicts
         gene_map: DataFrame with columns ['entrezGeneId', 'hugoGeneSymbol']
         deletion_cutoff: Treat alteration <= this as deleted (default: -1)
         
@@ -178,35 +296,105 @@ def build_deletion_matrix(cna_data, gene_map, deletion_cutoff=-1):
         DataFrame with samples as rows, genes as columns (with HUGO symbols),
         and 0/1 values indicating deletion status
     """
-    df = pd.DataFrame(cna_data)
+    # Records (e.g. older cache entries) are projected before building a frame
+    if isinstance(cna_data, pd.DataFrame):
+        df = cna_data
+    else:
+        df = client.cna_records_to_frame(cna_data)
     
-    # Keep only relevant columns
-    df = df[["sampleId", "entrezGeneId", "alteration"]]
+    # Row index per sample (sorted, as a pivot would order them). Compact API
+    # fetches carry sampleId as categorical, so rows come from the integer codes
+    # without hashing the sample ID of every call
+    if isinstance(df["sampleId"].dtype, pd.CategoricalDtype):
+        sample_codes, samples = _sorted_category_codes(df["sampleId"])
+    else:
+        sample_codes, samples = pd.factorize(df["sampleId"], sort=True)
     
-    # Binary deletion flag
-    df["deleted"] = df["alteration"] <= deletion_cutoff
+    # Column index per gene in chromosomal order (gene_map is already sorted by
+    # position from get_chromosome_genes); genes outside gene_map map to -1
+    gene_ids = pd.Index(gene_map["entrezGeneId"])
+    gene_cols = _gene_columns(gene_ids, df["entrezGeneId"].to_numpy())
     
-    # Pivot to samples x genes (Entrez)
-    mat = df.pivot_table(
-        index="sampleId",
-        columns="entrezGeneId",
-        values="deleted",
-        aggfunc="max",  # if multiple rows, any deletion counts
-        fill_value=False
-    )
+    # Positions of deleted calls; any deleted call for a (sample, gene) counts
+    deleted = np.flatnonzero((df["alteration"].to_numpy() <= deletion_cutoff)
+                             & (gene_cols >= 0) & (sample_codes >= 0))
     
-    # Ensure all genes appear in chromosomal order (by position, not sorted ID)
-    # gene_map is already sorted by chromosomal position from get_chromosome_genes
-    mat = mat.reindex(columns=gene_map["entrezGeneId"].tolist(), fill_value=False)
+    # int8 (0/1): 1 byte per cell instead of 8. One scatter through flat cell
+    # offsets is cheaper than indexing with a (row, column) pair of arrays
+    out = np.zeros((len(samples), len(gene_ids)), dtype=np.int8)
+    out.reshape(-1)[sample_codes[deleted] * len(gene_ids) + gene_cols[deleted]] = 1
     
-    # Rename columns to HUGO symbols
-    entrez_to_hugo = dict(zip(gene_map["entrezGeneId"], gene_map["hugoGeneSymbol"]))
-    mat.columns = [f"{entrez_to_hugo[gid]} ({gid})" for gid in mat.columns]
+    # Plain (non-categorical) sample index. Wrap the scattered array as-is:
+    # copy=False keeps pandas from copying the matrix (the default under
+    # copy-on-write for ndarray input)
+    samples = pd.Index(np.asarray(samples), name="sampleId")
+    return pd.DataFrame(out, index=samples, columns=gene_labels(gene_map), copy=False)
+
+
+def _gene_columns(gene_ids, entrez_ids):
+    """
+    Column position of each call's gene in gene_ids (-1 for genes not in it).
+    
+    Entrez IDs are integers, so when the largest ID is at most ENTREZ_LUT_MAX_ID
+    the positions come from one gather through a dense lookup table; otherwise
+    (e.g. ncRNA IDs in the 100 millions) through the hash-based get_indexer.
+    
+    Args:
+        gene_ids: Index of Entrez IDs in column order
+        entrez_ids: Integer array of Entrez IDs, one per call
+        
+    Returns:
+        Integer array of column positions
+    """
+    if len(gene_ids) == 0 or gene_ids.max() > ENTREZ_LUT_MAX_ID:
+        return gene_ids.get_indexer(entrez_ids)
+    
+    # One slot past the largest ID stays -1 and absorbs every larger call ID
+    lut = np.full(gene_ids.max() + 2, -1, dtype=np.int32)
+    lut[gene_ids.to_numpy()] = np.arange(len(gene_ids), dtype=np.int32)
+    return lut[np.clip(entrez_ids, 0, len(lut) - 1)]
+
+
+def _sorted_category_codes(values):
+    """
+    Codes of a categorical Series renumbered to its sorted, observed categories.
+    
+    Equivalent to pd.factorize(values.astype(object), sort=True) but computed
+    on the integer codes; missing values keep code -1.
     
-    # Convert to int (0/1)
-    mat = mat.astype(int)
+    Args:
+        values: Categorical Series
+        
+    Returns:
+        Tuple of (codes as intp array, sorted Index of the observed categories)
+    """
+    # Codes may be int8/int16; widen before they feed flat cell offsets
+    codes = values.cat.codes.to_numpy().astype(np.intp)
+    categories = values.cat.categories
+    
+    # Observed categories in sorted order, and each category's new position
+    # (trailing -1 so missing values, code -1, map to -1)
+    counts = np.bincount(codes + 1, minlength=len(categories) + 1)[1:]
+    order = categories.argsort()
+    kept = order[counts[order] > 0]
+    positions = np.full(len(categories) + 1, -1, dtype=np.intp)
+    positions[kept] = np.arange(len(kept))
+    
+    return positions[codes], categories[kept]
+
+
+def gene_labels(gene_map):
+    """
+    Build "SYMBOL (ENTREZ)" column labels for a gene map with vectorized string ops.
     
-    return mat
+    Args:
+        gene_map: DataFrame with columns ['entrezGeneId', 'hugoGeneSymbol']
+        
+    Returns:
+        Index of labels in gene_map order
+    """
+    labels = gene_map["hugoGeneSymbol"].astype(str) + " (" + gene_map["entrezGeneId"].astype(str) + ")"
+    return pd.Index(labels.to_numpy())
 
 
 def select_genes_by_symbol(matrix, symbols):
@@ -220,5 +408,6 @@ def select_genes_by_symbol(matrix, symbols):
     Returns:
         DataFrame with only the selected gene columns
     """
-    symbols = set(symbols)
-    return matrix[[c for c in matrix.columns if c.split(" ")[0] in symbols]]
+    # Symbol is the label up to the first space; isin runs over the whole Index at once
+    column_symbols = matrix.columns.str.split(" ", n=1).str[0]
+    return matrix.loc[:, column_symbols.isin(list(symbols))]
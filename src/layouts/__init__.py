@@ -1,12 +1,34 @@
-"""Layouts package for Dash app components."""
-
-from .home import create_home_layout
-from .codeletion import create_codeletion_layout, create_stats_display
-from .summary import create_summary_layout
-
-__all__ = [
-    'create_home_layout',
-    'create_codeletion_layout',
-    'create_summary_layout',
-    'create_stats_display'
-]
+"""Layouts package for Dash app components.
+
+Submodules are imported lazily (PEP 562), on first access of one of their
+exported names, so importing the package does not build every page module.
+
+The zero-argument layout and tab builders are memoized with lru_cache: the
+layouts hold no per-request state (studies are filled in by callbacks), so each
+is built once and the same component tree is returned on every call.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'create_home_layout': '.home',
+    'create_codeletion_layout': '.codeletion',
+    'create_summary_layout': '.summary',
+    'create_stats_display': '.codeletion',
+    'create_layout': '.layout',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,10 +5,15 @@ This module contains the layout for the interactive co-deletion analysis page,
 with separate tabs for each main visualization type.
 """
 
+from functools import lru_cache
+
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
+from .options import CHROMOSOME_OPTIONS, COLORSCALE_OPTIONS, N_LABELS_MARKS, N_PAIRS_MARKS
+
 
+@lru_cache(maxsize=1)
 def create_codeletion_layout():
     """
     Create the co-deletion explorer layout with tabs for each visualization.
@@ -106,6 +111,7 @@ def create_codeletion_layout():
     return layout
 
 
+@lru_cache(maxsize=1)
 def create_deletion_freq_tab():
     """Create the Individual Gene Deletion Frequencies tab content."""
     return dbc.Row([
@@ -125,11 +131,7 @@ def create_deletion_freq_tab():
                     html.Label("Chromosome:", className="fw-bold"),
                     dcc.Dropdown(
                         id='deletion-chromosome-dropdown',
-                        options=[
-                            *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                            {'label': 'Chromosome X', 'value': 'X'},
-                            {'label': 'Chromosome Y', 'value': 'Y'}
-                        ],
+                        options=CHROMOSOME_OPTIONS,
                         value='16',
                         clearable=False,
                         className="mb-3"
@@ -180,6 +182,7 @@ def create_deletion_freq_tab():
     ])
 
 
+@lru_cache(maxsize=1)
 def create_heatmap_tab():
     """Create the Co-Deletion Heatmap tab content."""
     return dbc.Row([
@@ -199,11 +202,7 @@ def create_heatmap_tab():
                     html.Label("Chromosome:", className="fw-bold"),
                     dcc.Dropdown(
                         id='heatmap-chromosome-dropdown',
-                        options=[
-                            *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                            {'label': 'Chromosome X', 'value': 'X'},
-                            {'label': 'Chromosome Y', 'value': 'Y'}
-                        ],
+                        options=CHROMOSOME_OPTIONS,
                         value='16',
                         clearable=False,
                         className="mb-3"
@@ -211,14 +210,7 @@ def create_heatmap_tab():
                     html.Label("Colorscale:", className="fw-bold"),
                     dcc.Dropdown(
                         id='heatmap-colorscale-dropdown',
-                        options=[
-                            {'label': 'Viridis', 'value': 'Viridis'},
-                            {'label': 'YlOrRd (Yellow-Orange-Red)', 'value': 'YlOrRd'},
-                            {'label': 'Blues', 'value': 'Blues'},
-                            {'label': 'Reds', 'value': 'Reds'},
-                            {'label': 'RdBu (Red-Blue)', 'value': 'RdBu'},
-                            {'label': 'Plasma', 'value': 'Plasma'},
-                        ],
+                        options=COLORSCALE_OPTIONS,
                         value='Viridis',
                         clearable=False,
                         className="mb-3"
@@ -230,7 +222,7 @@ def create_heatmap_tab():
                         max=50,
                         step=5,
                         value=20,
-                        marks={i: str(i) for i in range(5, 51, 5)},
+                        marks=N_LABELS_MARKS,
                         tooltip={"placement": "bottom", "always_visible": True}
                     ),
                 ])
@@ -267,6 +259,7 @@ def create_heatmap_tab():
     ])
 
 
+@lru_cache(maxsize=1)
 def create_gene_pairs_tab():
     """Create the Top Gene Pairs tab content."""
     return dbc.Row([
@@ -286,11 +279,7 @@ def create_gene_pairs_tab():
                     html.Label("Chromosome:", className="fw-bold"),
                     dcc.Dropdown(
                         id='pairs-chromosome-dropdown',
-                        options=[
-                            *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                            {'label': 'Chromosome X', 'value': 'X'},
-                            {'label': 'Chromosome Y', 'value': 'Y'}
-                        ],
+                        options=CHROMOSOME_OPTIONS,
                         value='16',
                         clearable=False,
                         className="mb-3"
@@ -310,7 +299,7 @@ def create_gene_pairs_tab():
                         max=50,
                         step=5,
                         value=20,
-                        marks={i: str(i) for i in range(10, 51, 10)},
+                        marks=N_PAIRS_MARKS,
                         tooltip={"placement": "bottom", "always_visible": True},
                         className="mb-3"
                     ),
@@ -385,6 +374,9 @@ def create_gene_pairs_tab():
             dbc.Card([
                 dbc.CardHeader(html.H5("Top Co-deleted Gene Pairs")),
                 dbc.CardBody([
+                    # Candidate pairs for the selected study/chromosome; filtered clientside
+                    dcc.Store(id='pairs-data-store'),
+                    html.Div(id='top-pairs-message', className="text-center text-muted"),
                     dcc.Loading(
                         id="loading-pairs-table",
                         type="default",
@@ -396,6 +388,7 @@ def create_gene_pairs_tab():
     ])
 
 
+@lru_cache(maxsize=1)
 def create_distance_scatter_tab():
     """Create the Distance vs Probability tab content."""
     return dbc.Row([
@@ -415,11 +408,7 @@ def create_distance_scatter_tab():
                     html.Label("Chromosome:", className="fw-bold"),
                     dcc.Dropdown(
                         id='scatter-chromosome-dropdown',
-                        options=[
-                            *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                            {'label': 'Chromosome X', 'value': 'X'},
-                            {'label': 'Chromosome Y', 'value': 'Y'}
-                        ],
+                        options=CHROMOSOME_OPTIONS,
                         value='16',
                         clearable=False,
                         className="mb-3"
@@ -526,7 +515,8 @@ def create_distance_scatter_tab():
     ])
 
 
-def create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chromosome="13"):
+def create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chromosome="13",
+                         n_samples=None, n_deletions=None):
     """
     Create statistics display component.
     
@@ -535,29 +525,30 @@ def create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chro
         n_genes_with_deletions: Number of genes deleted at least once
         max_deletion_pct: Maximum individual gene deletion frequency (as percentage)
         chromosome: Chromosome identifier (default: "13")
+        n_samples: Optional number of samples (shown when known)
+        n_deletions: Optional number of (sample, gene) deletions (shown when known)
         
     Returns:
         HTML component with statistics
     """
+    items = [
+        (str(n_genes), f"Genes on Chr{chromosome}"),
+        (str(n_genes_with_deletions), "Genes with Deletions"),
+        (f"{max_deletion_pct}%", "Max Deletion Freq")
+    ]
+    if n_samples is not None:
+        items.append((str(n_samples), "Samples"))
+    if n_deletions is not None:
+        items.append((str(n_deletions), "Gene Deletions"))
+    
     return html.Div([
         dbc.Row([
             dbc.Col([
                 html.Div([
-                    html.H4(str(n_genes), className="text-primary mb-0"),
-                    html.P(f"Genes on Chr{chromosome}", className="text-muted small mb-0")
-                ], className="text-center")
-            ], width=4),
-            dbc.Col([
-                html.Div([
-                    html.H4(str(n_genes_with_deletions), className="text-primary mb-0"),
-                    html.P("Genes with Deletions", className="text-muted small mb-0")
-                ], className="text-center")
-            ], width=4),
-            dbc.Col([
-                html.Div([
-                    html.H4(f"{max_deletion_pct}%", className="text-primary mb-0"),
-                    html.P("Max Deletion Freq", className="text-muted small mb-0")
+                    html.H4(value, className="text-primary mb-0"),
+                    html.P(label, className="text-muted small mb-0")
                 ], className="text-center")
-            ], width=4)
+            ], width=True)
+            for value, label in items
         ])
     ])
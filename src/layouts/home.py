@@ -2,10 +2,13 @@
 Homepage layout for the TCGA Co-Deletion Analysis app.
 """
 
+from functools import lru_cache
+
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
 
+@lru_cache(maxsize=1)
 def create_home_layout():
     """
     Create the homepage layout.
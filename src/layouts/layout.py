@@ -5,10 +5,17 @@ This module defines the Dash app layout for displaying interactive
 co-deletion heatmaps and related visualizations.
 """
 
+from functools import lru_cache
+
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
+# Re-exported: the stats panel is shared with the co-deletion page
+from .codeletion import create_stats_display
+from .options import CHROMOSOME_OPTIONS, COLORSCALE_OPTIONS, N_LABELS_MARKS, N_PAIRS_MARKS
+
 
+@lru_cache(maxsize=1)
 def create_layout():
     """
     Create the main Dash layout for the co-deletion analysis app.
@@ -52,11 +59,7 @@ def create_layout():
                         html.Label("Chromosome:", className="fw-bold"),
                         dcc.Dropdown(
                             id='chromosome-dropdown',
-                            options=[
-                                *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                                {'label': 'Chromosome X', 'value': 'X'},
-                                {'label': 'Chromosome Y', 'value': 'Y'}
-                            ],
+                            options=CHROMOSOME_OPTIONS,
                             value='13',  # Default to chr13
                             clearable=False,
                             className="mb-3"
@@ -66,14 +69,7 @@ def create_layout():
                         html.Label("Colorscale:", className="fw-bold"),
                         dcc.Dropdown(
                             id='colorscale-dropdown',
-                            options=[
-                                {'label': 'Viridis', 'value': 'Viridis'},
-                                {'label': 'YlOrRd (Yellow-Orange-Red)', 'value': 'YlOrRd'},
-                                {'label': 'Blues', 'value': 'Blues'},
-                                {'label': 'Reds', 'value': 'Reds'},
-                                {'label': 'RdBu (Red-Blue)', 'value': 'RdBu'},
-                                {'label': 'Plasma', 'value': 'Plasma'},
-                            ],
+                            options=COLORSCALE_OPTIONS,
                             value='Viridis',
                             clearable=False,
                             className="mb-3"
@@ -87,7 +83,7 @@ def create_layout():
                             max=50,
                             step=5,
                             value=20,
-                            marks={i: str(i) for i in range(5, 51, 5)},
+                            marks=N_LABELS_MARKS,
                             tooltip={"placement": "bottom", "always_visible": True}
                         ),
                     ])
@@ -172,7 +168,7 @@ def create_layout():
                             max=50,
                             step=5,
                             value=20,
-                            marks={i: str(i) for i in range(10, 51, 10)},
+                            marks=N_PAIRS_MARKS,
                             tooltip={"placement": "bottom", "always_visible": True},
                             className="mb-3"
                         ),
@@ -235,40 +231,3 @@ def create_layout():
     ], fluid=True, style={'maxWidth': '1400px'})
     
     return layout
-
-
-def create_stats_display(n_genes, n_genes_with_deletions, max_deletion_pct, chromosome="13"):
-    """
-    Create statistics display component.
-    
-    Args:
-        n_genes: Number of genes on the chromosome
-        n_genes_with_deletions: Number of genes deleted at least once
-        max_deletion_pct: Maximum individual gene deletion frequency (as percentage)
-        chromosome: Chromosome identifier (default: "13")
-        
-    Returns:
-        HTML component with statistics
-    """
-    return html.Div([
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    html.H4(str(n_genes), className="text-primary mb-0"),
-                    html.P(f"Genes on Chr{chromosome}", className="text-muted small mb-0")
-                ], className="text-center")
-            ], width=4),
-            dbc.Col([
-                html.Div([
-                    html.H4(str(n_genes_with_deletions), className="text-primary mb-0"),
-                    html.P("Genes with Deletions", className="text-muted small mb-0")
-                ], className="text-center")
-            ], width=4),
-            dbc.Col([
-                html.Div([
-                    html.H4(f"{max_deletion_pct}%", className="text-primary mb-0"),
-                    html.P("Max Deletion Freq", className="text-muted small mb-0")
-                ], className="text-center")
-            ], width=4)
-        ])
-    ])
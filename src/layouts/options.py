@@ -0,0 +1,27 @@
+"""
+Shared dropdown options and slider marks for the Dash layouts.
+
+These are built once at import time rather than on every layout construction.
+Layouts pass them to components as-is; nothing may modify them in place.
+"""
+
+# Chromosome dropdown options: 1-22, then X and Y
+CHROMOSOME_OPTIONS = [
+    *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
+    {'label': 'Chromosome X', 'value': 'X'},
+    {'label': 'Chromosome Y', 'value': 'Y'}
+]
+
+# Heatmap colorscale dropdown options
+COLORSCALE_OPTIONS = [
+    {'label': 'Viridis', 'value': 'Viridis'},
+    {'label': 'YlOrRd (Yellow-Orange-Red)', 'value': 'YlOrRd'},
+    {'label': 'Blues', 'value': 'Blues'},
+    {'label': 'Reds', 'value': 'Reds'},
+    {'label': 'RdBu (Red-Blue)', 'value': 'RdBu'},
+    {'label': 'Plasma', 'value': 'Plasma'},
+]
+
+# Slider marks for the number of heatmap axis labels and of top gene pairs
+N_LABELS_MARKS = {i: str(i) for i in range(5, 51, 5)}
+N_PAIRS_MARKS = {i: str(i) for i in range(10, 51, 10)}
@@ -5,10 +5,15 @@ This module contains the layout for viewing summary statistics across
 all processed studies and chromosomes.
 """
 
+from functools import lru_cache
+
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
+from .options import CHROMOSOME_OPTIONS
+
 
+@lru_cache(maxsize=1)
 def create_summary_layout():
     """
     Create the summary statistics layout.
@@ -58,9 +63,7 @@ def create_summary_layout():
                             id='summary-chromosome-dropdown',
                             options=[
                                 {'label': 'All Chromosomes', 'value': 'all'},
-                                *[{'label': f'Chromosome {i}', 'value': str(i)} for i in range(1, 23)],
-                                {'label': 'Chromosome X', 'value': 'X'},
-                                {'label': 'Chromosome Y', 'value': 'Y'}
+                                *CHROMOSOME_OPTIONS
                             ],
                             value='all',
                             clearable=False,
@@ -110,11 +113,14 @@ def create_summary_layout():
                         dcc.Loading(
                             id="loading-summary-distribution",
                             type="default",
+                            # Full figure on first render; filter changes send a Patch of the
+                            # histogram bins and annotations only
                             children=dcc.Graph(
                                 id='summary-distribution-chart',
                                 config={
                                     'displayModeBar': True,
-                                    'displaylogo': False
+                                    'displaylogo': False,
+                                    'scrollZoom': True
                                 }
                             )
                         )
@@ -132,6 +138,7 @@ def create_summary_layout():
                         dcc.Loading(
                             id="loading-summary-comparison",
                             type="default",
+                            # Full figure on first render; filter changes send no_update
                             children=dcc.Graph(
                                 id='summary-chromosome-comparison',
                                 config={
@@ -151,6 +158,7 @@ def create_summary_layout():
                         dcc.Loading(
                             id="loading-summary-study-comparison",
                             type="default",
+                            # Full figure on first render; filter changes send no_update
                             children=dcc.Graph(
                                 id='summary-study-comparison',
                                 config={
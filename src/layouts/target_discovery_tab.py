@@ -5,10 +5,13 @@ Integrates Harle 2025 synthetic lethality data with TCGA deletion frequencies
 to identify therapeutic opportunities.
 """
 
+from functools import lru_cache
+
 from dash import dcc, html
 import dash_bootstrap_components as dbc
 
 
+@lru_cache(maxsize=1)
 def create_target_discovery_tab():
     """Create the Synthetic Lethality Target Discovery tab content."""
     return dbc.Row([
@@ -8,16 +8,23 @@ This script orchestrates the complete analysis pipeline:
 4. Generate visualizations and export results
 
 Usage:
-    python main.py [chromosome] [study_id]
+    python main.py [chromosome] [study_id] [--refresh]
     
 Examples:
     python main.py                          # Default: chr13, PRAD
     python main.py 17                       # Chr17, PRAD
     python main.py 13 brca_tcga_pan_can_atlas_2018  # Chr13, BRCA
+    python main.py 13 --refresh             # Refetch instead of using cached API responses
+
+cBioPortal responses (profiles, sample lists, genes, CNA calls) are cached on
+disk by the data client, so re-runs for the same study skip those requests;
+--refresh refetches them. Results are written as zstd-compressed parquet; set
+EXPORT_FMT=xlsx for the older Excel exports.
 """
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -25,24 +32,65 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.data import queries
 from src.analysis import codeletion_calc
 
+# Output format for result tables: 'parquet' (default) or 'xlsx'
+EXPORT_FORMATS = ('parquet', 'xlsx')
+EXPORT_FMT = os.environ.get('EXPORT_FMT', 'parquet').lower()
+
+# Result tables are independent files, written concurrently on this many threads
+EXPORT_WORKERS = 4
+
+
+def _write(df, output_dir, name, index=True):
+    """
+    Write a result table in the EXPORT_FMT format.
+    
+    Args:
+        df: DataFrame to write
+        output_dir: Output directory
+        name: File name without extension
+        index: Whether to write the DataFrame index
+        
+    Returns:
+        File name of the written table
+    """
+    filename = f"{name}.{EXPORT_FMT}"
+    path = os.path.join(output_dir, filename)
+    if EXPORT_FMT == 'xlsx':
+        df.to_excel(path, index=index)
+    else:
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=index)
+    return filename
+
 
 def main():
+    # Unknown formats would otherwise be written as misnamed parquet files
+    if EXPORT_FMT not in EXPORT_FORMATS:
+        print(f"Error: Unsupported EXPORT_FMT '{EXPORT_FMT}' (expected one of: {', '.join(EXPORT_FORMATS)})")
+        sys.exit(1)
+    
     # Parse command-line arguments
-    chromosome = sys.argv[1] if len(sys.argv) > 1 else "13"
-    study_id = sys.argv[2] if len(sys.argv) > 2 else None
+    refresh = '--refresh' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--refresh']
+    chromosome = args[0] if len(args) > 0 else "13"
+    study_id = args[1] if len(args) > 1 else None
     
     # Set up output directory
     output_dir = os.path.join(os.path.dirname(__file__), "data", "processed")
     os.makedirs(output_dir, exist_ok=True)
     
+    # Exports run in the background while the analysis continues; each is
+    # reported (and any write error raised) once all of them are submitted
+    writer = ThreadPoolExecutor(max_workers=EXPORT_WORKERS)
+    writes = []  # (future, message printed when the write has finished)
+    
     # Step 1: Get study information
     print("=" * 60)
     print("Fetching study information...")
     print("=" * 60)
     
     study_id = queries.get_study_id(study_id)
-    cna_profile_id = queries.get_cna_profile_id(study_id)
-    sample_list_id = queries.get_cna_sample_list_id(study_id)
+    cna_profile_id = queries.get_cna_profile_id(study_id, refresh=refresh)
+    sample_list_id = queries.get_cna_sample_list_id(study_id, refresh=refresh)
     
     print(f"Study: {study_id}")
     print(f"CNA profile: {cna_profile_id}")
@@ -54,19 +102,19 @@ def main():
     print(f"Fetching chromosome {chromosome} genes...")
     print("=" * 60)
     
-    chr_genes = queries.get_chromosome_genes(chromosome)
+    chr_genes = queries.get_chromosome_genes(chromosome, refresh=refresh)
     print(f"Found {len(chr_genes)} genes on chr{chromosome}")
     
     # Save gene metadata for Dash app
-    chr_genes.to_excel(os.path.join(output_dir, f"chr{chromosome}_genes_metadata.xlsx"), index=False)
-    print(f"Saved gene metadata with cytobands")
+    writes.append((writer.submit(_write, chr_genes, output_dir, f"chr{chromosome}_genes_metadata", index=False),
+                   "Saved gene metadata with cytobands"))
     
     # Step 3: Fetch CNA data
     print("\n" + "=" * 60)
     print("Fetching CNA data...")
     print("=" * 60)
     
-    cna_data = queries.fetch_cna_for_genes(cna_profile_id, sample_list_id, chr_genes)
+    cna_data = queries.fetch_cna_for_genes(cna_profile_id, sample_list_id, chr_genes, refresh=refresh)
     print(f"Fetched {len(cna_data)} CNA calls")
     
     # Step 4: Build deletion matrix
@@ -81,8 +129,8 @@ def main():
     if chromosome == "13":
         symbols = {"BRCA2", "PDS5B"}
         subset = queries.select_genes_by_symbol(deletion_mat, symbols)
-        subset.to_excel(os.path.join(output_dir, f"chr{chromosome}_deletion_BRCA2_PDS5B.xlsx"), index=True)
-        print(f"Saved subset for genes: {symbols}")
+        writes.append((writer.submit(_write, subset, output_dir, f"chr{chromosome}_deletion_BRCA2_PDS5B"),
+                       f"Saved subset for genes: {symbols}"))
     
     # Step 6: Compute co-deletion frequencies
     print("\n" + "=" * 60)
@@ -101,26 +149,32 @@ def main():
     print("Exporting results...")
     print("=" * 60)
     
-    # Only save top pairs to avoid Excel size limits (max 1,048,576 rows)
-    all_pairs = freq_long.sort_values("co_deletion_frequency", ascending=False)
-    max_pairs_to_save = min(100000, len(all_pairs))  # Save top 100k pairs or less
-    top_pairs_to_save = all_pairs.head(max_pairs_to_save)
-    top_pairs_to_save.to_excel(os.path.join(output_dir, f"chr{chromosome}_codeletion_frequencies.xlsx"), index=False)
-    print(f"Saved: chr{chromosome}_codeletion_frequencies.xlsx (top {max_pairs_to_save:,} pairs)")
-    if len(all_pairs) > max_pairs_to_save:
-        print(f"  Note: Showing top {max_pairs_to_save:,} of {len(all_pairs):,} total pairs (Excel size limit)")
-    
-    # For large chromosomes, skip full matrix exports (too large for Excel)
     n_genes = freq_matrix.shape[0]
-    if n_genes > 1000:
+    
+    if EXPORT_FMT == 'xlsx':
+        # Only save top pairs to avoid Excel size limits (max 1,048,576 rows);
+        # partial selection, not a sort of every pair
+        max_pairs_to_save = min(100000, len(freq_long))  # Save top 100k pairs or less
+        top_pairs_to_save = codeletion_calc.get_top_codeleted_pairs(freq_long, n=max_pairs_to_save)
+        writes.append((writer.submit(_write, top_pairs_to_save, output_dir,
+                                     f"chr{chromosome}_codeletion_frequencies", index=False),
+                       f"Saved: chr{chromosome}_codeletion_frequencies.xlsx (top {max_pairs_to_save:,} pairs)"))
+        if len(freq_long) > max_pairs_to_save:
+            print(f"  Note: Saving top {max_pairs_to_save:,} of {len(freq_long):,} total pairs (Excel size limit)")
+    else:
+        # Parquet has no row limit: save every pair, unsorted (as batch_process does)
+        writes.append((writer.submit(_write, freq_long, output_dir,
+                                     f"chr{chromosome}_codeletion_frequencies", index=False),
+                       f"Saved: chr{chromosome}_codeletion_frequencies.parquet ({len(freq_long):,} pairs)"))
+    
+    # For large chromosomes, skip full matrix exports in Excel (too large for a sheet)
+    if EXPORT_FMT == 'xlsx' and n_genes > 1000:
         print(f"  Skipping full matrix exports (chr{chromosome} has {n_genes:,} genes - too large for Excel)")
         print(f"  Note: Conditional matrix and deletion frequencies will still be saved")
     else:
-        freq_matrix.to_excel(os.path.join(output_dir, f"chr{chromosome}_codeletion_matrix.xlsx"), index=True)
-        print(f"Saved: chr{chromosome}_codeletion_matrix.xlsx")
-        
-        counts_df.to_excel(os.path.join(output_dir, f"chr{chromosome}_codeletion_counts.xlsx"), index=True)
-        print(f"Saved: chr{chromosome}_codeletion_counts.xlsx")
+        for name, df in (('codeletion_matrix', freq_matrix), ('codeletion_counts', counts_df)):
+            writes.append((writer.submit(_write, df, output_dir, f"chr{chromosome}_{name}"),
+                           f"Saved: chr{chromosome}_{name}.{EXPORT_FMT}"))
     
     # Step 8: Compute conditional probabilities
     print("\n" + "=" * 60)
@@ -129,21 +183,31 @@ def main():
     
     conditional = codeletion_calc.compute_conditional_codeletion(counts_df)
     
-    # For large chromosomes, save as CSV instead of Excel (faster and no size limits)
-    if n_genes > 1000:
-        conditional.to_csv(os.path.join(output_dir, f"chr{chromosome}_codeletion_conditional_frequencies.csv"), index=True)
-        print(f"Saved: chr{chromosome}_codeletion_conditional_frequencies.csv (CSV format for large chromosome)")
+    # For large chromosomes in Excel mode, save as CSV instead (faster and no size limits)
+    if EXPORT_FMT == 'xlsx' and n_genes > 1000:
+        path = os.path.join(output_dir, f"chr{chromosome}_codeletion_conditional_frequencies.csv")
+        writes.append((writer.submit(conditional.to_csv, path, index=True),
+                       f"Saved: chr{chromosome}_codeletion_conditional_frequencies.csv (CSV format for large chromosome)"))
     else:
-        conditional.to_excel(os.path.join(output_dir, f"chr{chromosome}_codeletion_conditional_frequencies.xlsx"), index=True)
-        print(f"Saved: chr{chromosome}_codeletion_conditional_frequencies.xlsx")
+        writes.append((writer.submit(_write, conditional, output_dir,
+                                     f"chr{chromosome}_codeletion_conditional_frequencies"),
+                       f"Saved: chr{chromosome}_codeletion_conditional_frequencies.{EXPORT_FMT}"))
     
     print("\nConditional frequencies (first 5 genes):")
     print(conditional.iloc[:5, :5])
     
     # Compute individual deletion frequencies
     deletion_freqs = codeletion_calc.compute_deletion_frequencies(deletion_mat)
-    deletion_freqs.to_excel(os.path.join(output_dir, f"chr{chromosome}_deletion_frequencies.xlsx"), index=True)
-    print(f"Saved: chr{chromosome}_deletion_frequencies.xlsx")
+    writes.append((writer.submit(_write, deletion_freqs.to_frame('deletion_frequency'), output_dir,
+                                 f"chr{chromosome}_deletion_frequencies"),
+                   f"Saved: chr{chromosome}_deletion_frequencies.{EXPORT_FMT}"))
+    
+    # Wait for the exports in submission order; result() re-raises write errors
+    print()
+    for future, message in writes:
+        future.result()
+        print(message)
+    writer.shutdown()
     
     print("\n" + "=" * 60)
     print("Analysis complete!")
@@ -12,7 +12,47 @@ import plotly.graph_objects as go
 import plotly.express as px
 
 
-def create_heatmap_figure(mat, title="Conditional Co-Deletion Matrix", colorscale="Viridis", cytobands=None, n_labels=20):
+def downsample_matrix(mat, max_side=400):
+    """
+    Reduce a matrix to at most max_side x max_side cells by block averaging.
+    
+    Each output cell is the mean of a k x k block of the input (edge blocks may be
+    smaller), so the heatmap payload scales with display resolution, not gene count.
+    
+    Args:
+        mat: DataFrame with co-deletion data (genes x genes)
+        max_side: Maximum number of rows/columns to keep (default: 400)
+        
+    Returns:
+        Tuple of (downsampled DataFrame, block size k). Rows/columns are labeled by
+        the first gene of each block; k == 1 means the matrix was returned unchanged.
+    """
+    n_rows, n_cols = mat.shape
+    k = max(1, -(-max(n_rows, n_cols) // max_side))
+    if k == 1:
+        return mat, 1
+    
+    # Zero-padded sums and non-NaN counts, so partial edge blocks average only
+    # real cells and all-NaN blocks stay NaN
+    out_rows, out_cols = -(-n_rows // k), -(-n_cols // k)
+    values = mat.to_numpy(dtype=np.float32)
+    valid = ~np.isnan(values)
+    sums = np.zeros((out_rows * k, out_cols * k), dtype=np.float32)
+    counts = np.zeros_like(sums)
+    np.copyto(sums[:n_rows, :n_cols], values, where=valid)
+    counts[:n_rows, :n_cols] = valid
+    
+    # Separable block reduction: collapse row blocks (contiguous), then column blocks
+    sums = sums.reshape(out_rows, k, -1).sum(axis=1).reshape(out_rows, out_cols, k).sum(axis=2)
+    counts = counts.reshape(out_rows, k, -1).sum(axis=1).reshape(out_rows, out_cols, k).sum(axis=2)
+    with np.errstate(invalid='ignore'):
+        blocks = sums / counts
+    
+    return pd.DataFrame(blocks, index=mat.index[::k], columns=mat.columns[::k]), k
+
+
+def create_heatmap_figure(mat, title="Conditional Co-Deletion Matrix", colorscale="Viridis", cytobands=None, n_labels=20,
+                          quantize_above=None):
     """
     Create an interactive Plotly heatmap figure (Dash-compatible, no file saving).
     
@@ -20,44 +60,67 @@ def create_heatmap_figure(mat, title="Conditional Co-Deletion Matrix", colorscal
         mat: DataFrame with co-deletion data (genes x genes)
         title: Title for the plot
         colorscale: Plotly colorscale name (e.g., 'Viridis', 'YlOrRd', 'Blues')
-        cytobands: Optional list of cytobands corresponding to genes (if provided, used instead of gene names)
+        cytobands: Optional array-like of cytobands corresponding to genes (if provided, used instead of gene names)
         n_labels: Number of labels to show on axes (default: 20, evenly spaced)
+        quantize_above: Optional cell count above which probabilities are sent as uint8
+            whole percents (0-100) instead of float32, a quarter of the payload. Hover
+            then shows the probability rounded to 1% instead of 3 decimals. Ignored if
+            the matrix contains NaN (default: None, never quantize)
         
     Returns:
         Plotly Figure object
     """
-    # Determine labels to display
+    # Determine labels to display (as arrays, so only the ticks become Python strings)
     if cytobands is not None:
         # Use cytobands instead of gene names
-        labels = cytobands
+        labels = np.asarray(cytobands)
     else:
         # Use gene names from matrix
-        labels = list(mat.columns)
+        labels = mat.columns.to_numpy()
     
     # Select evenly spaced indices for n_labels
     n_genes = mat.shape[0]
     if n_genes <= n_labels:
         # Show all labels if fewer than requested
-        tick_indices = list(range(n_genes))
-        tick_labels = [labels[i] for i in tick_indices]
+        tick_indices = np.arange(n_genes)
     else:
         # Show evenly spaced labels
-        tick_indices = np.linspace(0, n_genes - 1, n_labels, dtype=int).tolist()
-        tick_labels = [labels[i] for i in tick_indices]
+        tick_indices = np.linspace(0, n_genes - 1, n_labels, dtype=int)
+    tick_labels = labels[tick_indices].tolist()
+    tick_indices = tick_indices.tolist()
+    
+    # float32 is plenty for the color scale and halves the payload
+    z = mat.to_numpy(dtype=np.float32)
+    colorbar = dict(
+        title=dict(
+            text="P(i | j)<br>Conditional<br>co-deletion<br>probability",
+            side="right"
+        )
+    )
+    hovertemplate = 'Row: %{y}<br>Col: %{x}<br>P(i|j): %{z:.3f}<extra></extra>'
+    z_range = {}
+    
+    # Only large matrices are quantized: probabilities in [0, 1] map onto whole
+    # percents, so hover still reads as a probability (uint8 has no NaN, so
+    # matrices with missing cells stay float32)
+    if quantize_above is not None and z.size > quantize_above and not np.isnan(z).any():
+        z = np.rint(np.clip(z, 0, 1) * 100).astype(np.uint8)
+        z_range = dict(zmin=0, zmax=100)
+        colorbar.update(
+            tickvals=np.linspace(0, 100, 6).tolist(),
+            ticktext=[f"{p:.1f}" for p in np.linspace(0, 1, 6)]
+        )
+        hovertemplate = 'Row: %{y}<br>Col: %{x}<br>P(i|j): %{z}%<extra></extra>'
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=mat.values,
+        z=z,
         x=list(range(n_genes)),
         y=list(range(n_genes)),
         colorscale=colorscale,
-        colorbar=dict(
-            title=dict(
-                text="P(i | j)<br>Conditional<br>co-deletion<br>probability",
-                side="right"
-            )
-        ),
-        hovertemplate='Row: %{y}<br>Col: %{x}<br>P(i|j): %{z:.3f}<extra></extra>'
+        colorbar=colorbar,
+        hovertemplate=hovertemplate,
+        **z_range
     ))
     
     # Update layout
@@ -95,7 +158,7 @@ def plot_heatmap(mat, title="Conditional Co-Deletion Matrix", colorscale="Viridi
         title: Title for the plot
         colorscale: Plotly colorscale name (e.g., 'Viridis', 'YlOrRd', 'Blues')
         output_path: Optional path to save the figure as HTML (if None, uses default location)
-        cytobands: Optional list of cytobands corresponding to genes (if provided, used instead of gene names)
+        cytobands: Optional array-like of cytobands corresponding to genes (if provided, used instead of gene names)
         n_labels: Number of labels to show on axes (default: 20, evenly spaced)
         
     Returns:
@@ -123,7 +186,7 @@ def create_frequency_heatmap_figure(mat, title="Co-Deletion Frequency Matrix", c
     Args:
         mat: DataFrame with co-deletion frequency data (genes x genes)
         title: Title for the plot
-        cytobands: Optional list of cytobands corresponding to genes
+        cytobands: Optional array-like of cytobands corresponding to genes
         n_labels: Number of labels to show (default: 20)
         
     Returns:
@@ -140,7 +203,7 @@ def plot_frequency_heatmap(mat, title="Co-Deletion Frequency Matrix", output_pat
         mat: DataFrame with co-deletion frequency data (genes x genes)
         title: Title for the plot
         output_path: Optional path to save the figure as HTML
-        cytobands: Optional list of cytobands corresponding to genes
+        cytobands: Optional array-like of cytobands corresponding to genes
         n_labels: Number of labels to show (default: 20)
         
     Returns:
@@ -214,6 +277,145 @@ def plot_top_pairs_barplot(long_table, n=20, output_path=None):
     return fig
 
 
+def build_top_pairs_data(conditional_matrix, deletion_freqs, joint_data, gene_metadata=None):
+    """
+    Build the unfiltered gene pairs table with detailed statistics.
+    
+    Args:
+        conditional_matrix: DataFrame where entry [i,j] represents P(gene_i deleted | gene_j deleted)
+        deletion_freqs: Series with individual gene deletion frequencies
+        joint_data: DataFrame with joint probabilities (codeletion pairs)
+        gene_metadata: DataFrame with gene positions (entrezGeneId, hugoGeneSymbol, start, end)
+        
+    Returns:
+        DataFrame with columns Gene A, Gene B, Freq A, Freq B, P(A|B), P(B|A), P(A,B),
+        Distance (bp), sorted by the larger of the two conditional probabilities
+    """
+    genes = conditional_matrix.columns
+    gene_index = pd.Index(genes)
+    n_genes = len(genes)
+    
+    # Create gene start position lookup if metadata provided ("SYMBOL (ENTREZ)" keys)
+    starts = np.full(n_genes, np.nan)
+    if gene_metadata is not None and 'start' in gene_metadata.columns:
+        gene_keys = (gene_metadata['hugoGeneSymbol'].astype(str) + ' (' +
+                     gene_metadata['entrezGeneId'].astype(int).astype(str) + ')')
+        gene_starts = pd.Series(gene_metadata['start'].astype(int).to_numpy(), index=gene_keys)
+        gene_starts = gene_starts[~gene_starts.index.duplicated(keep='last')]
+        starts = gene_starts.reindex(genes).to_numpy(dtype=float)
+        
+        # Debug: print first few gene keys and matrix columns to verify matching
+        if len(gene_starts) > 0:
+            print(f"DEBUG: First 3 metadata keys: {gene_starts.index[:3].tolist()}")
+            print(f"DEBUG: First 3 matrix columns: {genes[:3].tolist()}")
+            print(f"DEBUG: Total genes in positions: {len(gene_starts)}")
+            print(f"DEBUG: Total genes in matrix: {n_genes}")
+    
+    # Individual deletion frequencies aligned to the matrix genes
+    freqs = deletion_freqs.reindex(genes).to_numpy(dtype=float)
+    
+    # Dense symmetric lookup of joint probabilities
+    joint = np.full((n_genes, n_genes), np.nan)
+    if joint_data is not None and not joint_data.empty:
+        pos_i = gene_index.get_indexer(joint_data['gene_i'])
+        pos_j = gene_index.get_indexer(joint_data['gene_j'])
+        known = (pos_i >= 0) & (pos_j >= 0)
+        joint_probs = joint_data['co_deletion_frequency'].to_numpy(dtype=float)[known]
+        joint[pos_i[known], pos_j[known]] = joint_probs
+        joint[pos_j[known], pos_i[known]] = joint_probs  # Symmetric
+    
+    # Upper-triangle pairs among genes that are deleted at least once
+    deleted = np.flatnonzero(~np.isnan(freqs) & (freqs != 0))
+    tri_i, tri_j = np.triu_indices(len(deleted), k=1)
+    idx_i, idx_j = deleted[tri_i], deleted[tri_j]
+    
+    # Get conditional probabilities, skipping pairs where both are NaN
+    cond = conditional_matrix.to_numpy()
+    prob_i_given_j = cond[idx_i, idx_j]
+    prob_j_given_i = cond[idx_j, idx_i]
+    keep = ~(np.isnan(prob_i_given_j) & np.isnan(prob_j_given_i))
+    idx_i, idx_j = idx_i[keep], idx_j[keep]
+    prob_i_given_j, prob_j_given_i = prob_i_given_j[keep], prob_j_given_i[keep]
+    
+    if len(idx_i) == 0:
+        return pd.DataFrame()
+    
+    # Distance from start of one gene to start of the other
+    distance_bp = np.abs(starts[idx_i] - starts[idx_j])
+    if not np.isnan(distance_bp).any():
+        distance_bp = distance_bp.astype(np.int64)
+    
+    # Use maximum conditional probability for ranking (stable, so ties keep pair order)
+    max_cond = np.maximum(np.nan_to_num(prob_i_given_j, nan=0.0), np.nan_to_num(prob_j_given_i, nan=0.0))
+    order = np.argsort(-max_cond, kind='stable')
+    
+    return pd.DataFrame({
+        'Gene A': genes.to_numpy()[idx_i[order]],
+        'Gene B': genes.to_numpy()[idx_j[order]],
+        'Freq A': freqs[idx_i[order]],
+        'Freq B': freqs[idx_j[order]],
+        'P(A|B)': prob_i_given_j[order],
+        'P(B|A)': prob_j_given_i[order],
+        'P(A,B)': joint[idx_i[order], idx_j[order]],
+        'Distance (bp)': distance_bp[order]
+    })
+
+
+def create_top_pairs_table(table_records, n=20, table_id='top-pairs-datatable'):
+    """
+    Create the Dash DataTable used to display gene pairs.
+    
+    Args:
+        table_records: List of row dicts from build_top_pairs_data
+        n: Number of rows per page (default: 20)
+        table_id: Component ID for the DataTable
+        
+    Returns:
+        Dash DataTable component
+    """
+    from dash import dash_table
+    
+    # Create DataTable with all data, but display only n rows per page
+    table = dash_table.DataTable(
+        id=table_id,
+        data=table_records,
+        columns=[
+            {'name': 'Gene A', 'id': 'Gene A', 'type': 'text'},
+            {'name': 'Gene B', 'id': 'Gene B', 'type': 'text'},
+            {'name': 'Distance (bp)', 'id': 'Distance (bp)', 'type': 'numeric', 'format': {'specifier': '.2e'}},
+            {'name': 'Freq Gene A', 'id': 'Freq A', 'type': 'numeric', 'format': {'specifier': '.2%'}},
+            {'name': 'Freq Gene B', 'id': 'Freq B', 'type': 'numeric', 'format': {'specifier': '.2%'}},
+            {'name': 'P(A|B)', 'id': 'P(A|B)', 'type': 'numeric', 'format': {'specifier': '.2%'}},
+            {'name': 'P(B|A)', 'id': 'P(B|A)', 'type': 'numeric', 'format': {'specifier': '.2%'}},
+            {'name': 'P(A,B)', 'id': 'P(A,B)', 'type': 'numeric', 'format': {'specifier': '.2%'}}
+        ],
+        style_table={'overflowX': 'auto'},
+        style_cell={
+            'textAlign': 'left',
+            'padding': '10px',
+            'fontFamily': 'Arial, sans-serif',
+            'fontSize': '14px'
+        },
+        style_header={
+            'backgroundColor': '#f8f9fa',
+            'fontWeight': 'bold',
+            'borderBottom': '2px solid #dee2e6'
+        },
+        style_data_conditional=[
+            {
+                'if': {'row_index': 'odd'},
+                'backgroundColor': '#f8f9fa'
+            }
+        ],
+        page_size=n,
+        page_action='native',
+        sort_action='native',
+        filter_action='native'
+    )
+    
+    return table
+
+
 def create_top_pairs_table_data(conditional_matrix, deletion_freqs, joint_data, gene_metadata=None, n=20, gene_filter=None,
                                 min_distance=None, max_distance=None, min_freq=None, min_pab=None, min_pba=None, min_joint=None):
     """
@@ -236,97 +438,9 @@ def create_top_pairs_table_data(conditional_matrix, deletion_freqs, joint_data,
     Returns:
         Dash DataTable component
     """
-    from dash import dash_table, html
-    import numpy as np
+    from dash import html
     
-    # Create gene position lookup if metadata provided
-    gene_positions = {}
-    if gene_metadata is not None and 'start' in gene_metadata.columns:
-        for _, row in gene_metadata.iterrows():
-            # Match genes by symbol with Entrez ID format: "SYMBOL (ENTREZ)"
-            symbol = row['hugoGeneSymbol']
-            entrez = int(row['entrezGeneId'])  # Ensure integer
-            gene_key = f"{symbol} ({entrez})"
-            gene_positions[gene_key] = {
-                'start': int(row['start']),
-                'end': int(row['end'])
-            }
-    
-    # Debug: print first few gene keys and matrix columns to verify matching
-    if gene_metadata is not None and len(gene_positions) > 0:
-        genes = conditional_matrix.columns.tolist()
-        print(f"DEBUG: First 3 metadata keys: {list(gene_positions.keys())[:3]}")
-        print(f"DEBUG: First 3 matrix columns: {genes[:3]}")
-        print(f"DEBUG: Total genes in positions: {len(gene_positions)}")
-        print(f"DEBUG: Total genes in matrix: {len(genes)}")
-
-    
-    # Extract gene pairs with conditional probabilities
-    pairs_list = []
-    genes = conditional_matrix.columns.tolist()
-    
-    # Create a lookup dictionary for joint probabilities
-    joint_lookup = {}
-    if joint_data is not None and not joint_data.empty:
-        for _, row in joint_data.iterrows():
-            gene_i = row['gene_i']
-            gene_j = row['gene_j']
-            joint_prob = row['co_deletion_frequency']
-            joint_lookup[(gene_i, gene_j)] = joint_prob
-            joint_lookup[(gene_j, gene_i)] = joint_prob  # Symmetric
-    
-    for i in range(len(genes)):
-        for j in range(i+1, len(genes)):  # Upper triangle only
-            gene_i = genes[i]
-            gene_j = genes[j]
-            
-            # Get conditional probabilities
-            prob_i_given_j = conditional_matrix.iloc[i, j]
-            prob_j_given_i = conditional_matrix.iloc[j, i]
-            
-            # Skip if both are NaN
-            if pd.isna(prob_i_given_j) and pd.isna(prob_j_given_i):
-                continue
-            
-            # Get individual deletion frequencies
-            freq_i = deletion_freqs.get(gene_i, np.nan)
-            freq_j = deletion_freqs.get(gene_j, np.nan)
-            
-            # Skip pairs where either gene is never deleted
-            if pd.isna(freq_i) or pd.isna(freq_j) or freq_i == 0 or freq_j == 0:
-                continue
-            
-            # Get joint probability
-            joint_prob = joint_lookup.get((gene_i, gene_j), np.nan)
-            
-            # Calculate genomic distance
-            distance_bp = np.nan
-            if gene_i in gene_positions and gene_j in gene_positions:
-                pos_i = gene_positions[gene_i]
-                pos_j = gene_positions[gene_j]
-                # Distance from start of one gene to start of the other
-                distance_bp = abs(pos_i['start'] - pos_j['start'])
-            
-            # Use maximum conditional probability for ranking
-            max_cond_prob = max(
-                prob_i_given_j if not pd.isna(prob_i_given_j) else 0,
-                prob_j_given_i if not pd.isna(prob_j_given_i) else 0
-            )
-            
-            pairs_list.append({
-                'Gene A': gene_i,
-                'Gene B': gene_j,
-                'Freq A': freq_i,
-                'Freq B': freq_j,
-                'P(A|B)': prob_i_given_j,
-                'P(B|A)': prob_j_given_i,
-                'P(A,B)': joint_prob,
-                'Distance (bp)': distance_bp,
-                'max_cond': max_cond_prob
-            })
-    
-    # Convert to DataFrame
-    pairs_df = pd.DataFrame(pairs_list)
+    pairs_df = build_top_pairs_data(conditional_matrix, deletion_freqs, joint_data, gene_metadata)
     
     if pairs_df.empty:
         return html.Div(
@@ -369,53 +483,8 @@ def create_top_pairs_table_data(conditional_matrix, deletion_freqs, joint_data,
             className="text-center text-muted p-4"
         )
     
-    # Sort by maximum conditional probability
-    pairs_df = pairs_df.sort_values('max_cond', ascending=False)
-    
-    # Drop the sorting column for display
-    display_data = pairs_df.drop(columns=['max_cond']).copy()
-    
     # Convert to dict for DataTable (keep numeric values)
-    table_records = display_data.to_dict('records')
-    
-    # Create DataTable with all data, but display only n rows per page
-    table = dash_table.DataTable(
-        data=table_records,
-        columns=[
-            {'name': 'Gene A', 'id': 'Gene A', 'type': 'text'},
-            {'name': 'Gene B', 'id': 'Gene B', 'type': 'text'},
-            {'name': 'Distance (bp)', 'id': 'Distance (bp)', 'type': 'numeric', 'format': {'specifier': '.2e'}},
-            {'name': 'Freq Gene A', 'id': 'Freq A', 'type': 'numeric', 'format': {'specifier': '.2%'}},
-            {'name': 'Freq Gene B', 'id': 'Freq B', 'type': 'numeric', 'format': {'specifier': '.2%'}},
-            {'name': 'P(A|B)', 'id': 'P(A|B)', 'type': 'numeric', 'format': {'specifier': '.2%'}},
-            {'name': 'P(B|A)', 'id': 'P(B|A)', 'type': 'numeric', 'format': {'specifier': '.2%'}},
-            {'name': 'P(A,B)', 'id': 'P(A,B)', 'type': 'numeric', 'format': {'specifier': '.2%'}}
-        ],
-        style_table={'overflowX': 'auto'},
-        style_cell={
-            'textAlign': 'left',
-            'padding': '10px',
-            'fontFamily': 'Arial, sans-serif',
-            'fontSize': '14px'
-        },
-        style_header={
-            'backgroundColor': '#f8f9fa',
-            'fontWeight': 'bold',
-            'borderBottom': '2px solid #dee2e6'
-        },
-        style_data_conditional=[
-            {
-                'if': {'row_index': 'odd'},
-                'backgroundColor': '#f8f9fa'
-            }
-        ],
-        page_size=n,
-        page_action='native',
-        sort_action='native',
-        filter_action='native'
-    )
-    
-    return table
+    return create_top_pairs_table(pairs_df.to_dict('records'), n=n)
 
 
 def create_top_conditional_pairs_figure(conditional_matrix, n=10, gene_filter=None):
@@ -562,46 +631,44 @@ def create_deletion_frequency_scatter(deletion_freqs, gene_metadata=None):
         Plotly Figure object
     """
     # Prepare data
+    # Gene names are formatted as "SYMBOL (ENTREZ)"
+    genes = pd.Series(deletion_freqs.index.astype(str))
+    symbols = genes.str.split(' ', n=1, regex=False).str[0]
+    
     if gene_metadata is not None:
-        # Create mapping from gene name (with Entrez ID) to cytoband
-        gene_to_cytoband = {}
-        gene_to_symbol = {}
-        
-        for _, row in gene_metadata.iterrows():
-            symbol = row['hugoGeneSymbol']
-            cytoband = row['cytoband']
-            # Find matching column in deletion_freqs (formatted as "SYMBOL (ENTREZ)")
-            for col in deletion_freqs.index:
-                if col.startswith(symbol + ' '):
-                    gene_to_cytoband[col] = cytoband
-                    gene_to_symbol[col] = symbol
-                    break
+        # Map each gene's symbol to its cytoband (later metadata rows win, as before)
+        symbol_to_cytoband = (gene_metadata.drop_duplicates('hugoGeneSymbol', keep='last')
+                              .set_index('hugoGeneSymbol')['cytoband'])
         
         # Create DataFrame for plotting
         plot_data = pd.DataFrame({
-            'gene': deletion_freqs.index,
-            'frequency': deletion_freqs.values,
-            'cytoband': [gene_to_cytoband.get(g, 'unknown') for g in deletion_freqs.index],
-            'symbol': [gene_to_symbol.get(g, g.split(' ')[0]) for g in deletion_freqs.index]
+            'gene': genes,
+            'frequency': deletion_freqs.to_numpy(),
+            'cytoband': symbols.map(symbol_to_cytoband).fillna('unknown'),
+            'symbol': symbols
         })
         
-        # Sort by cytoband (already in chromosomal order from gene_metadata)
-        cytoband_order = {cb: i for i, cb in enumerate(gene_metadata['cytoband'].tolist())}
-        plot_data['cytoband_order'] = plot_data['cytoband'].map(lambda x: cytoband_order.get(x, 999999))
-        plot_data = plot_data.sort_values('cytoband_order').reset_index(drop=True)
+        # Sort by cytoband (already in chromosomal order from gene_metadata): each
+        # cytoband's key is the position of its last metadata row, unknowns go last
+        cytoband_index = pd.Index(gene_metadata['cytoband'])
+        keep = ~cytoband_index.duplicated(keep='last')
+        positions = np.flatnonzero(keep)
+        lookup = cytoband_index[keep].get_indexer(plot_data['cytoband'])
+        cytoband_order = np.where(lookup >= 0, positions[lookup], 999999)
+        plot_data = plot_data.iloc[np.argsort(cytoband_order, kind='stable')].reset_index(drop=True)
         
     else:
         # No metadata, just use gene index
         plot_data = pd.DataFrame({
-            'gene': deletion_freqs.index,
-            'frequency': deletion_freqs.values,
-            'symbol': [g.split(' ')[0] for g in deletion_freqs.index]
+            'gene': genes,
+            'frequency': deletion_freqs.to_numpy(),
+            'symbol': symbols
         })
         plot_data['position'] = range(len(plot_data))
     
-    # Create scatter plot
-    fig = go.Figure(data=go.Scatter(
-        x=list(range(len(plot_data))),
+    # Create scatter plot (WebGL, so thousands of genes stay responsive)
+    fig = go.Figure(data=go.Scattergl(
+        x=np.arange(len(plot_data)),
         y=plot_data['frequency'],
         mode='markers',
         marker=dict(
@@ -625,7 +692,7 @@ def create_deletion_frequency_scatter(deletion_freqs, gene_metadata=None):
         # Show cytoband labels on x-axis (subset for readability)
         n_labels = min(20, len(plot_data))
         tick_indices = np.linspace(0, len(plot_data) - 1, n_labels, dtype=int).tolist()
-        tick_labels = [plot_data.iloc[i]['cytoband'] for i in tick_indices]
+        tick_labels = plot_data['cytoband'].to_numpy()[tick_indices].tolist()
         
         fig.update_xaxes(
             title="Gene Position (Chromosomal Order)",
@@ -687,19 +754,11 @@ def create_distance_frequency_scatter(conditional_matrix, gene_metadata, gene_fi
     Returns:
         Plotly Figure object
     """
-    # Create gene position lookup
-    gene_positions = {}
-    if gene_metadata is not None and 'start' in gene_metadata.columns:
-        for _, row in gene_metadata.iterrows():
-            symbol = row['hugoGeneSymbol']
-            entrez = int(row['entrezGeneId'])
-            gene_key = f"{symbol} ({entrez})"
-            gene_positions[gene_key] = {
-                'start': int(row['start']),
-                'end': int(row['end'])
-            }
+    genes = conditional_matrix.columns
+    n_genes = len(genes)
     
-    if not gene_positions:
+    # Gene start positions aligned to the matrix genes ("SYMBOL (ENTREZ)" keys)
+    if gene_metadata is None or 'start' not in gene_metadata.columns or gene_metadata.empty:
         # Return empty figure with message
         fig = go.Figure()
         fig.add_annotation(
@@ -710,97 +769,44 @@ def create_distance_frequency_scatter(conditional_matrix, gene_metadata, gene_fi
         )
         return fig
     
-    # Extract gene pairs with both distance and conditional probability
-    pairs_data = []
-    genes = conditional_matrix.columns.tolist()
+    gene_keys = (gene_metadata['hugoGeneSymbol'].astype(str) + ' (' +
+                 gene_metadata['entrezGeneId'].astype(int).astype(str) + ')')
+    gene_starts = pd.Series(gene_metadata['start'].astype(int).to_numpy(), index=gene_keys)
+    gene_starts = gene_starts[~gene_starts.index.duplicated(keep='last')]
+    starts = gene_starts.reindex(genes).to_numpy(dtype=float)
+    
+    # Gene A symbols for labels and the gene filter, and gene A deletion
+    # frequencies in matrix order (genes without a frequency count as 0)
+    symbols = genes.astype(str).str.split().str[0].to_numpy()
+    if freq_a is not None and deletion_freqs is not None:
+        freqs = deletion_freqs.reindex(genes, fill_value=0).to_numpy(dtype=float)
+    else:
+        freqs = None
+    
+    # Upper-triangle pairs whose genes both have a (non-zero) start position
+    idx_i, idx_j = np.triu_indices(n_genes, k=1)
+    positioned = ~np.isnan(starts) & (starts != 0)
+    keep = positioned[idx_i] & positioned[idx_j]
+    idx_i, idx_j = idx_i[keep], idx_j[keep]
+    distance_bp = np.abs(starts[idx_i] - starts[idx_j]).astype(np.int64)
+    
+    # Matrix entry [row, col] = P(row deleted | col deleted), so each pair gives
+    # P(gene_j | gene_i) with gene_i as "A" and P(gene_i | gene_j) with gene_j as "A"
+    cond = conditional_matrix.to_numpy(dtype=float)
+    directions = []
+    for gene_a, gene_b in ((idx_i, idx_j), (idx_j, idx_i)):
+        prob = cond[gene_b, gene_a]
+        
+        # Non-zero P(B|A) (NaN compares False), then the gene A filters
+        mask = prob > 0
+        if gene_filter is not None:
+            mask &= np.char.upper(symbols[gene_a].astype(str)) == gene_filter.upper()
+        if freqs is not None:
+            mask &= ~(freqs[gene_a] < freq_a)
+        
+        directions.append((np.flatnonzero(mask), gene_a[mask], gene_b[mask], prob[mask]))
     
-    for i in range(len(genes)):
-        for j in range(i+1, len(genes)):  # Upper triangle only to avoid duplicates
-            gene_i = genes[i]
-            gene_j = genes[j]
-            
-            # Get conditional probabilities (both directions)
-            # Matrix entry [row, col] = P(row | col) = P(row deleted | col deleted)
-            # So conditional_matrix.iloc[i, j] = P(gene_i | gene_j)
-            # And conditional_matrix.iloc[j, i] = P(gene_j | gene_i)
-            prob_i_given_j = conditional_matrix.iloc[i, j]  # P(gene_i | gene_j)
-            prob_j_given_i = conditional_matrix.iloc[j, i]  # P(gene_j | gene_i)
-            
-            # Skip if both are NaN or both are 0
-            if (pd.isna(prob_i_given_j) or prob_i_given_j == 0) and \
-               (pd.isna(prob_j_given_i) or prob_j_given_i == 0):
-                continue
-            
-            # Calculate genomic distance
-            if gene_i in gene_positions and gene_j in gene_positions:
-                pos_i = gene_positions[gene_i]['start']
-                pos_j = gene_positions[gene_j]['start']
-                
-                # Skip if either position is 0 (no coordinate data)
-                if pos_i == 0 or pos_j == 0:
-                    continue
-                
-                distance_bp = abs(pos_i - pos_j)
-                
-                # Add data point for P(gene_j | gene_i) if non-zero
-                # When gene_i is "A", we want P(B|A) which is P(gene_j | gene_i)
-                if not pd.isna(prob_j_given_i) and prob_j_given_i > 0:
-                    gene_a_symbol = gene_i.split()[0]
-                    gene_b_symbol = gene_j.split()[0]
-                    # Apply gene filter if specified (filter for gene A)
-                    if gene_filter is None or gene_a_symbol.upper() == gene_filter.upper():
-                        # Apply deletion frequency filter for gene A
-                        if freq_a is not None and deletion_freqs is not None:
-                            gene_a_freq = deletion_freqs.get(gene_i, 0)
-                            if gene_a_freq < freq_a:
-                                pass  # Skip this point
-                            else:
-                                pairs_data.append({
-                                    'gene_a': gene_i,
-                                    'gene_b': gene_j,
-                                    'distance_bp': distance_bp,
-                                    'conditional_prob': prob_j_given_i,
-                                    'direction': f"{gene_b_symbol} | {gene_a_symbol}"
-                                })
-                        else:
-                            pairs_data.append({
-                                'gene_a': gene_i,
-                                'gene_b': gene_j,
-                                'distance_bp': distance_bp,
-                                'conditional_prob': prob_j_given_i,
-                                'direction': f"{gene_b_symbol} | {gene_a_symbol}"
-                            })
-                
-                # Add data point for P(gene_i | gene_j) if non-zero
-                # When gene_j is "A", we want P(B|A) which is P(gene_i | gene_j)
-                if not pd.isna(prob_i_given_j) and prob_i_given_j > 0:
-                    gene_a_symbol = gene_j.split()[0]
-                    gene_b_symbol = gene_i.split()[0]
-                    # Apply gene filter if specified (filter for gene A)
-                    if gene_filter is None or gene_a_symbol.upper() == gene_filter.upper():
-                        # Apply deletion frequency filter for gene A
-                        if freq_a is not None and deletion_freqs is not None:
-                            gene_a_freq = deletion_freqs.get(gene_j, 0)
-                            if gene_a_freq < freq_a:
-                                pass  # Skip this point
-                            else:
-                                pairs_data.append({
-                                    'gene_a': gene_j,
-                                    'gene_b': gene_i,
-                                    'distance_bp': distance_bp,
-                                    'conditional_prob': prob_i_given_j,
-                                    'direction': f"{gene_b_symbol} | {gene_a_symbol}"
-                                })
-                        else:
-                            pairs_data.append({
-                                'gene_a': gene_j,
-                                'gene_b': gene_i,
-                                'distance_bp': distance_bp,
-                                'conditional_prob': prob_i_given_j,
-                                'direction': f"{gene_b_symbol} | {gene_a_symbol}"
-                            })
-    
-    if not pairs_data:
+    if not any(len(pair) for pair, *_ in directions):
         fig = go.Figure()
         fig.add_annotation(
             text="No data points with both distance and non-zero conditional probability",
@@ -810,8 +816,19 @@ def create_distance_frequency_scatter(conditional_matrix, gene_metadata, gene_fi
         )
         return fig
     
-    # Convert to DataFrame
-    pairs_df = pd.DataFrame(pairs_data)
+    # Both directions of a pair are adjacent, in pair order (stable on pair index)
+    pair = np.concatenate([d[0] for d in directions])
+    order = np.argsort(pair, kind='stable')
+    gene_a = np.concatenate([d[1] for d in directions])[order]
+    gene_b = np.concatenate([d[2] for d in directions])[order]
+    
+    pairs_df = pd.DataFrame({
+        'gene_a': genes.to_numpy()[gene_a],
+        'gene_b': genes.to_numpy()[gene_b],
+        'distance_bp': distance_bp[pair[order]],
+        'conditional_prob': np.concatenate([d[3] for d in directions])[order],
+        'direction': symbols[gene_b] + ' | ' + symbols[gene_a]
+    })
     
     # Create scatter plot
     fig = go.Figure()
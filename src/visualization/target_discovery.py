@@ -14,6 +14,11 @@ from dash import dash_table, html
 import dash_bootstrap_components as dbc
 
 
+# Marker colors and legend labels indexed by essentiality code (0 = False, 1 = True)
+ESSENTIALITY_COLORS = np.array(['#6c757d', '#28a745'], dtype=object)
+ESSENTIALITY_LABELS = np.array(['Context-Specific', 'Core Essential'], dtype=object)
+
+
 def create_target_ranking_table(
     opportunities_df: pd.DataFrame,
     max_rows: int = 100
@@ -149,36 +154,51 @@ def create_gi_score_scatter(
         )
         return fig
     
-    # Create hover text
-    hover_text = []
-    for _, row in opportunities_df.iterrows():
-        text = f"<b>{row['deleted_gene']} deleted → target {row['target_gene']}</b><br>"
-        text += f"Deletion: {row['deletion_frequency']:.1%}<br>"
-        text += f"GI Score: {row['gi_score']:.3f}<br>"
-        text += f"FDR: {row['fdr']:.2e}<br>"
-        text += f"DepMap: {row['target_depmap_dependent_lines']}/1086<br>"
-        
-        if 'hit_count' in row and not pd.isna(row.get('hit_count')):
-            text += f"Validated: {int(row['hit_count'])}/27 lines<br>"
-            text += f"Cancer types: {row.get('cancer_types_validated', 'N/A')}"
-        
-        hover_text.append(text)
+    # Create hover text column-wise (one formatting pass per field, no iterrows)
+    hover_text = (
+        '<b>' + opportunities_df['deleted_gene'].astype(str) + ' deleted → target ' +
+        opportunities_df['target_gene'].astype(str) + '</b><br>' +
+        'Deletion: ' + opportunities_df['deletion_frequency'].map('{:.1%}'.format) + '<br>' +
+        'GI Score: ' + opportunities_df['gi_score'].map('{:.3f}'.format) + '<br>' +
+        'FDR: ' + opportunities_df['fdr'].map('{:.2e}'.format) + '<br>' +
+        'DepMap: ' + opportunities_df['target_depmap_dependent_lines'].astype(str) + '/1086<br>'
+    )
+    
+    if 'hit_count' in opportunities_df.columns:
+        validated = opportunities_df['hit_count'].notna()
+        if 'cancer_types_validated' in opportunities_df.columns:
+            cancer_types = opportunities_df['cancer_types_validated'].astype(str)
+        else:
+            cancer_types = 'N/A'
+        validation_text = (
+            'Validated: ' + opportunities_df['hit_count'].fillna(0).astype(int).astype(str) +
+            '/27 lines<br>' + 'Cancer types: ' + cancer_types
+        )
+        hover_text = hover_text.where(~validated, hover_text + validation_text)
+    
+    hover_text = hover_text.tolist()
     
     # Determine color scheme
     if color_by == 'target_is_common_essential':
-        color_map = {True: '#28a745', False: '#6c757d'}
-        colors = opportunities_df['target_is_common_essential'].map(color_map)
         legend_title = 'Target Essentiality'
         
+        # Integer essentiality codes index the color/label lookups (-1 = missing)
+        essential = opportunities_df['target_is_common_essential']
+        codes = np.full(len(essential), -1, dtype=np.intp)
+        codes[essential.eq(False).to_numpy()] = 0
+        codes[essential.eq(True).to_numpy()] = 1
+        hover_arr = np.array(hover_text, dtype=object)
+        
         # Create figure with separate traces for legend
         fig = go.Figure()
         
-        for is_essential, color, label in [(True, '#28a745', 'Core Essential'), 
-                                            (False, '#6c757d', 'Context-Specific')]:
-            mask = opportunities_df['target_is_common_essential'] == is_essential
+        for code in (1, 0):
+            mask = codes == code
             if mask.any():
                 subset = opportunities_df[mask]
-                subset_hover = [hover_text[i] for i, m in enumerate(mask) if m]
+                subset_hover = hover_arr[mask]
+                color = ESSENTIALITY_COLORS[code]
+                label = ESSENTIALITY_LABELS[code]
                 
                 fig.add_trace(go.Scatter(
                     x=subset['deletion_frequency'],
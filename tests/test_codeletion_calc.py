@@ -0,0 +1,127 @@
+"""
+Test script for co-deletion frequency calculations.
+
+Checks the Gram-matrix co-deletion kernel against an integer matrix product
+on a small random deletion matrix.
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from src.analysis import codeletion_calc
+
+
+def make_deletion_matrix(n_samples=150, n_genes=40, seed=0):
+    """Build a random samples x genes 0/1 deletion matrix."""
+    rng = np.random.default_rng(seed)
+    values = (rng.random((n_samples, n_genes)) < 0.2).astype(int)
+    genes = [f"GENE{i} ({1000 + i})" for i in range(n_genes)]
+    samples = [f"SAMPLE-{i}" for i in range(n_samples)]
+    return pd.DataFrame(values, index=samples, columns=genes)
+
+
+def test_codeletion_counts_match_matmul():
+    """Test that float32 Gram-matrix counts equal the integer X^T @ X."""
+    print("Testing compute_codeletion_frequency() counts...")
+    
+    mat = make_deletion_matrix()
+    X = mat.values
+    
+    freq_matrix, long_table, counts_df = codeletion_calc.compute_codeletion_frequency(mat)
+    
+    np.testing.assert_array_equal(counts_df.values, X.T @ X)
+    np.testing.assert_allclose(freq_matrix.values, (X.T @ X) / X.shape[0], rtol=1e-6)
+    print(f"✓ Counts match X^T @ X for {X.shape[1]} genes")
+    
+    n_genes = X.shape[1]
+    assert len(long_table) == n_genes * (n_genes - 1) // 2
+    print(f"✓ Long table has {len(long_table)} upper-triangle pairs")
+
+
+def test_statistics_sample_counts():
+    """Test compute_codeletion_statistics() counts across sample counts."""
+    print("\nTesting compute_codeletion_statistics() counts for varying sample counts...")
+    
+    for n_samples in (1, 63, 64, 65, 130):
+        mat = make_deletion_matrix(n_samples=n_samples, n_genes=7, seed=n_samples)
+        _, _, counts_df, _ = codeletion_calc.compute_codeletion_statistics(mat)
+        np.testing.assert_array_equal(counts_df.values, mat.values.T @ mat.values)
+    
+    print("✓ Counts correct for 1, 63, 64, 65, 130 samples")
+
+
+def test_conditional_codeletion():
+    """Test P(i | j) against a direct division, with never-deleted genes as 0."""
+    print("\nTesting compute_conditional_codeletion()...")
+    
+    mat = make_deletion_matrix()
+    mat.iloc[:, 3] = 0  # Gene that is never deleted
+    _, _, counts_df = codeletion_calc.compute_codeletion_frequency(mat)
+    
+    conditional = codeletion_calc.compute_conditional_codeletion(counts_df)
+    
+    counts = counts_df.values.astype(float)
+    diag = np.diag(counts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = np.where(diag > 0, counts / diag, 0.0)
+    
+    np.testing.assert_allclose(conditional.values, expected, rtol=1e-6)
+    assert (conditional.iloc[:, 3] == 0).all()
+    print("✓ Conditional probabilities match count(i,j) / count(j,j)")
+
+
+def test_statistics_match_separate_calls():
+    """Test the combined statistics against frequency + conditional computed separately."""
+    print("\nTesting compute_codeletion_statistics()...")
+    
+    mat = make_deletion_matrix(n_samples=97)
+    mat.iloc[:, 5] = 0
+    
+    freq_matrix, long_table, counts_df = codeletion_calc.compute_codeletion_frequency(mat)
+    conditional = codeletion_calc.compute_conditional_codeletion(counts_df)
+    stats = codeletion_calc.compute_codeletion_statistics(mat)
+    
+    np.testing.assert_array_equal(stats[2].values, counts_df.values)
+    np.testing.assert_allclose(stats[0].values, freq_matrix.values, rtol=1e-6)
+    np.testing.assert_allclose(stats[3].values, conditional.values, rtol=1e-6)
+    pd.testing.assert_frame_equal(stats[1], long_table, rtol=1e-6)
+    print("✓ Combined counts, frequencies and conditionals match")
+
+
+def test_deletion_frequencies():
+    """Test per-gene deletion frequencies against the pandas mean."""
+    print("\nTesting compute_deletion_frequencies()...")
+    
+    mat = make_deletion_matrix()
+    expected = mat.mean(axis=0).sort_values(ascending=False, kind='stable')
+    
+    pd.testing.assert_series_equal(codeletion_calc.compute_deletion_frequencies(mat), expected)
+    pd.testing.assert_series_equal(codeletion_calc.compute_deletion_frequencies(mat, top_k=5), expected.head(5))
+    print("✓ Deletion frequencies sorted descending, top_k matches head")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("TCGA Co-Deletion: Co-deletion Calculation Test")
+    print("=" * 70)
+    
+    test_codeletion_counts_match_matmul()
+    test_statistics_sample_counts()
+    test_conditional_codeletion()
+    test_statistics_match_separate_calls()
+    test_deletion_frequencies()
+    
+    print("\n" + "=" * 70)
+    print("Tests completed!")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Test script for building the binary deletion matrix.
+
+Checks queries.build_deletion_matrix against a pivot_table reference on
+synthetic CNA calls, including duplicate calls and genes outside the gene map.
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from src.data import queries
+
+
+def make_cna_data(n_samples=30, n_genes=12, seed=0):
+    """Build synthetic CNA calls and a gene map (gene order differs from ID order)."""
+    rng = np.random.default_rng(seed)
+    gene_map = pd.DataFrame({
+        'entrezGeneId': rng.permutation(np.arange(1000, 1000 + n_genes)),
+        'hugoGeneSymbol': [f"GENE{i}" for i in range(n_genes)]
+    })
+    
+    rows = []
+    for sample in rng.permutation(n_samples):
+        for gid in gene_map['entrezGeneId']:
+            if rng.random() < 0.7:
+                rows.append({'sampleId': f"S-{sample:03d}", 'entrezGeneId': int(gid),
+                             'alteration': int(rng.choice([-2, -1, 0, 1, 2])),
+                             'studyId': 'test_study'})
+    # Duplicate calls for one (sample, gene) and a gene outside the gene map
+    rows.append({'sampleId': rows[0]['sampleId'], 'entrezGeneId': rows[0]['entrezGeneId'],
+                 'alteration': -2, 'studyId': 'test_study'})
+    rows.append({'sampleId': 'S-999', 'entrezGeneId': 5, 'alteration': -2, 'studyId': 'test_study'})
+    
+    return rows, gene_map
+
+
+def reference_deletion_matrix(cna_data, gene_map, deletion_cutoff=-1):
+    """Deletion matrix built with pivot_table (the original implementation)."""
+    df = pd.DataFrame(cna_data)[["sampleId", "entrezGeneId", "alteration"]]
+    df["deleted"] = df["alteration"] <= deletion_cutoff
+    mat = df.pivot_table(index="sampleId", columns="entrezGeneId", values="deleted",
+                         aggfunc="max", fill_value=False)
+    mat = mat.reindex(columns=gene_map["entrezGeneId"].tolist(), fill_value=False)
+    entrez_to_hugo = dict(zip(gene_map["entrezGeneId"], gene_map["hugoGeneSymbol"]))
+    mat.columns = [f"{entrez_to_hugo[gid]} ({gid})" for gid in mat.columns]
+    return mat.astype("int8")
+
+
+def test_matches_pivot_table():
+    """Test that the scattered matrix equals the pivot_table result."""
+    print("Testing build_deletion_matrix() against pivot_table...")
+    
+    cna_data, gene_map = make_cna_data()
+    
+    for cutoff in (-1, -2):
+        compact = pd.DataFrame(cna_data)[['sampleId', 'entrezGeneId', 'alteration']].astype(
+            {'sampleId': 'category', 'entrezGeneId': 'int32', 'alteration': 'int8'})
+        # Unsorted categories plus a sample with no calls fall back to factorize
+        categories = compact['sampleId'].cat.categories
+        unsorted = compact.assign(sampleId=compact['sampleId'].cat.set_categories(
+            ['S-unused', *categories[::-1]]))
+        for data in (cna_data, pd.DataFrame(cna_data), compact, unsorted):
+            mat = queries.build_deletion_matrix(data, gene_map, deletion_cutoff=cutoff)
+            expected = reference_deletion_matrix(cna_data, gene_map, deletion_cutoff=cutoff)
+            pd.testing.assert_frame_equal(mat, expected, check_names=False)
+            assert mat.dtypes.eq(np.int8).all()
+    
+    print(f"✓ Matrix matches pivot_table ({mat.shape[0]} samples x {mat.shape[1]} genes)")
+
+
+def test_large_entrez_ids():
+    """Test the hash-lookup path for Entrez IDs beyond the lookup table."""
+    print("\nTesting build_deletion_matrix() with large Entrez IDs...")
+    
+    cna_data, gene_map = make_cna_data(seed=1)
+    offset = queries.ENTREZ_LUT_MAX_ID
+    cna_data = [dict(row, entrezGeneId=row['entrezGeneId'] + offset) for row in cna_data]
+    gene_map = gene_map.assign(entrezGeneId=gene_map['entrezGeneId'] + offset)
+    
+    mat = queries.build_deletion_matrix(cna_data, gene_map)
+    pd.testing.assert_frame_equal(mat, reference_deletion_matrix(cna_data, gene_map), check_names=False)
+    
+    print(f"✓ Matrix matches pivot_table ({mat.shape[0]} samples x {mat.shape[1]} genes)")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("TCGA Co-Deletion: Deletion Matrix Test")
+    print("=" * 70)
+    
+    test_matches_pivot_table()
+    test_large_entrez_ids()
+    
+    print("\n" + "=" * 70)
+    print("Tests completed!")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
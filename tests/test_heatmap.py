@@ -0,0 +1,74 @@
+"""
+Test script for the co-deletion heatmap figure.
+
+Checks that create_heatmap_figure only quantizes matrices above the payload
+threshold, and that quantized hover still reads as a probability.
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from src.visualization import codeletion_heatmap
+
+
+def make_probability_matrix(n_genes=30, seed=0):
+    """Build a random genes x genes probability matrix."""
+    rng = np.random.default_rng(seed)
+    genes = [f"GENE{i} ({1000 + i})" for i in range(n_genes)]
+    return pd.DataFrame(rng.random((n_genes, n_genes)), index=genes, columns=genes)
+
+
+def test_small_matrix_keeps_float_hover():
+    """Test that matrices at or below the threshold stay float32 with 3-decimal hover."""
+    print("Testing create_heatmap_figure() below the quantize threshold...")
+    
+    mat = make_probability_matrix()
+    for quantize_above in (None, mat.size):
+        trace = codeletion_heatmap.create_heatmap_figure(mat, quantize_above=quantize_above).data[0]
+        assert trace.z.dtype == np.float32
+        assert '%{z:.3f}' in trace.hovertemplate
+    
+    print("✓ float32 values and P(i|j) hover with 3 decimals")
+
+
+def test_large_matrix_quantized_to_percent():
+    """Test that quantized values and hover are whole-percent probabilities."""
+    print("\nTesting create_heatmap_figure() above the quantize threshold...")
+    
+    mat = make_probability_matrix()
+    trace = codeletion_heatmap.create_heatmap_figure(mat, quantize_above=mat.size - 1).data[0]
+    
+    assert trace.z.dtype == np.uint8
+    np.testing.assert_array_equal(trace.z, np.rint(mat.to_numpy() * 100))
+    assert (trace.zmin, trace.zmax) == (0, 100)
+    assert 'P(i|j): %{z}%' in trace.hovertemplate
+    print("✓ uint8 percents with P(i|j) hover in %")
+    
+    mat.iloc[0, 0] = np.nan
+    trace = codeletion_heatmap.create_heatmap_figure(mat, quantize_above=0).data[0]
+    assert trace.z.dtype == np.float32
+    print("✓ Matrices with NaN stay float32")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("TCGA Co-Deletion: Heatmap Figure Test")
+    print("=" * 70)
+    
+    test_small_matrix_keeps_float_hover()
+    test_large_matrix_quantized_to_percent()
+    
+    print("\n" + "=" * 70)
+    print("Tests completed!")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Test script for the processed data loader.
+
+Checks the cBioPortal fallback of load_deletion_frequencies with the module
+imported as top-level data.processed_loader, as synthetic_lethality does.
+"""
+
+import sys
+import os
+
+# Add src directory to path (synthetic_lethality imports data.processed_loader)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from data import processed_loader, queries
+
+
+def test_deletion_frequencies_fallback():
+    """Test the fallback computes sorted frequencies without the analysis package."""
+    print("Testing load_deletion_frequencies() fallback as data.processed_loader...")
+    
+    deletion_mat = pd.DataFrame(
+        np.array([[1, 0, 1], [1, 0, 0], [0, 0, 1], [1, 0, 1]], dtype=np.int8),
+        columns=['A (1)', 'B (2)', 'C (3)']
+    )
+    with mock.patch.object(queries, 'get_cna_profile_id', return_value='profile'), \
+         mock.patch.object(queries, 'get_cna_sample_list_id', return_value='samples'), \
+         mock.patch.object(queries, 'get_chromosome_genes', return_value=None), \
+         mock.patch.object(queries, 'fetch_cna_for_genes', return_value=None), \
+         mock.patch.object(queries, 'build_deletion_matrix', return_value=deletion_mat):
+        freqs = processed_loader.load_deletion_frequencies('13', 'nonexistent_study')
+    
+    expected = pd.Series([0.75, 0.75, 0.0], index=['A (1)', 'C (3)', 'B (2)'], name='deletion_frequency')
+    pd.testing.assert_series_equal(freqs, expected)
+    print("✓ Fallback frequencies sorted descending")
+
+
+def test_deletion_frequencies_fallback_failure():
+    """Test that a failed fallback raises FileNotFoundError (what callers catch)."""
+    print("\nTesting load_deletion_frequencies() when the fallback fails...")
+    
+    with mock.patch.object(queries, 'get_cna_profile_id', side_effect=RuntimeError('offline')):
+        try:
+            processed_loader.load_deletion_frequencies('13', 'nonexistent_study')
+        except FileNotFoundError:
+            print("✓ Raised FileNotFoundError")
+        else:
+            raise AssertionError("Expected FileNotFoundError")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 70)
+    print("TCGA Co-Deletion: Processed Loader Test")
+    print("=" * 70)
+    
+    test_deletion_frequencies_fallback()
+    test_deletion_frequencies_fallback_failure()
+    
+    print("\n" + "=" * 70)
+    print("Tests completed!")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()